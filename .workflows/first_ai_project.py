@@ -5,11 +5,18 @@ Demonstrates AI agent coordination for building a VOITHER clinical dashboard
 """
 
 import asyncio
+import argparse
 import json
+import os
+import sys
 from datetime import datetime
 from typing import Dict, List, Any
 from dataclasses import dataclass, asdict
 
+# Shared --profile / --trace support lives with the documentation tools
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+import instrumentation
+
 @dataclass
 class ProjectRequest:
     """Project request structure"""
@@ -416,34 +423,38 @@ class AIOrchestrationDemo:
         
         # Phase 1: Strategic Analysis (Claude)
         print("📋 Phase 1: Strategic Analysis...")
-        strategic_response = await self.agents["claude_strategic"].process_request(project_request)
+        with instrumentation.span('Phase 1: Strategic Analysis'):
+            strategic_response = await self.agents["claude_strategic"].process_request(project_request)
         self.project_state["strategic"] = strategic_response
         self._print_agent_response(strategic_response)
         
         # Phase 2: Research & Feasibility (Gemini)
         print("\n🔬 Phase 2: Research & Feasibility Analysis...")
-        research_response = await self.agents["gemini_researcher"].process_request(
-            project_request, {"strategic_input": strategic_response}
-        )
+        with instrumentation.span('Phase 2: Research & Feasibility'):
+            research_response = await self.agents["gemini_researcher"].process_request(
+                project_request, {"strategic_input": strategic_response}
+            )
         self.project_state["research"] = research_response
         self._print_agent_response(research_response)
         
         # Phase 3: Technical Design (OpenAI)
         print("\n🏗️ Phase 3: Technical Architecture Design...")
-        technical_response = await self.agents["openai_constructor"].process_request(
-            project_request, {
-                "strategic_input": strategic_response,
-                "research_input": research_response
-            }
-        )
+        with instrumentation.span('Phase 3: Technical Design'):
+            technical_response = await self.agents["openai_constructor"].process_request(
+                project_request, {
+                    "strategic_input": strategic_response,
+                    "research_input": research_response
+                }
+            )
         self.project_state["technical"] = technical_response
         self._print_agent_response(technical_response)
         
         # Phase 4: Medical Compliance (Azure)
         print("\n🏥 Phase 4: Medical Compliance Planning...")
-        medical_response = await self.agents["azure_medical"].process_request(
-            project_request, {"technical_input": technical_response}
-        )
+        with instrumentation.span('Phase 4: Medical Compliance'):
+            medical_response = await self.agents["azure_medical"].process_request(
+                project_request, {"technical_input": technical_response}
+            )
         self.project_state["medical"] = medical_response
         self._print_agent_response(medical_response)
         
@@ -452,22 +463,24 @@ class AIOrchestrationDemo:
         
         # Frontend implementation
         print("   🎨 Frontend Implementation...")
-        frontend_response = await self.agents["copilot_frontend"].process_request(
-            project_request, {
-                "technical_input": technical_response,
-                "medical_input": medical_response
-            }
-        )
+        with instrumentation.span('Phase 5: Frontend Implementation'):
+            frontend_response = await self.agents["copilot_frontend"].process_request(
+                project_request, {
+                    "technical_input": technical_response,
+                    "medical_input": medical_response
+                }
+            )
         self.project_state["frontend"] = frontend_response
         
         # Backend implementation
         print("   ⚙️ Backend Implementation...")
-        backend_response = await self.agents["copilot_backend"].process_request(
-            project_request, {
-                "technical_input": technical_response,
-                "medical_input": medical_response
-            }
-        )
+        with instrumentation.span('Phase 5: Backend Implementation'):
+            backend_response = await self.agents["copilot_backend"].process_request(
+                project_request, {
+                    "technical_input": technical_response,
+                    "medical_input": medical_response
+                }
+            )
         self.project_state["backend"] = backend_response
         
         # Generate final coordination summary
@@ -510,6 +523,10 @@ class AIOrchestrationDemo:
 async def main():
     """Run the AI coordination demonstration"""
     
+    parser = argparse.ArgumentParser(description="First AI-coordinated VOITHER project demonstration")
+    instrumentation.add_arguments(parser)
+    args = parser.parse_args()
+    
     # Define the project request
     project_request = ProjectRequest(
         name="VOITHER Clinical Dashboard",
@@ -532,7 +549,8 @@ async def main():
     orchestrator = AIOrchestrationDemo()
     
     # Run coordinated development
-    project_result = await orchestrator.orchestrate_project(project_request)
+    with instrumentation.from_args('first_ai_project', args):
+        project_result = await orchestrator.orchestrate_project(project_request)
     
     # Display final results
     print("\n" + "=" * 60)
@@ -6,6 +6,8 @@ Priority: .ee DSL, BRRE, Four Axes, Database, MedicalScribe core
 """
 
 import os
+import sys
+import argparse
 import subprocess
 import json
 import asyncio
@@ -14,6 +16,10 @@ from dataclasses import dataclass
 from datetime import datetime
 import logging
 
+# Shared --profile / --trace support lives with the documentation tools
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+import instrumentation
+
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -124,266 +130,10 @@ class VoitherCoreBuilder:
         
         print("📄 Creating urgent component implementations...")
         
-        # .ee DSL parser foundation (URGENT)
-        ee_parser_implementation = '''"""
-VOITHER .ee DSL Parser - Urgent Implementation
-Unified language combining .aje, .ire, .e, .Re into single .ee DSL
-Priority: Critical for all VOITHER components
-"""
-
-import re
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass
-from enum import Enum
-
-class EETokenType(Enum):
-    # Core .ee DSL tokens
-    CLINICAL_EVENT = "clinical_event"
-    CORRELATE = "correlate" 
-    EXECUTE = "execute"
-    TEMPORAL_MARKER = "temporal"
-    SPATIAL_MARKER = "spatial"
-    EMERGENT_MARKER = "emergent"
-    SEMANTIC_MARKER = "semantic"
-    
-    # Legacy DSL integration
-    AJE_CONSTRUCT = "aje_construct"  # From .aje
-    IRE_CONSTRUCT = "ire_construct"  # From .ire
-    E_CONSTRUCT = "e_construct"      # From .e
-    RE_CONSTRUCT = "re_construct"    # From .Re
-    
-    # Four Axes integration
-    FOUR_AXES_ANNOTATION = "four_axes"
-    
-    # Literals and identifiers
-    STRING = "string"
-    NUMBER = "number"
-    IDENTIFIER = "identifier"
-    OPERATOR = "operator"
-
-@dataclass
-class EEASTNode:
-    """AST node for .ee DSL with Four Axes annotations"""
-    node_type: str
-    value: Any
-    four_axes_coords: Optional[Tuple[float, float, float, float]] = None
-    children: List['EEASTNode'] = None
-    metadata: Dict[str, Any] = None
-    
-    def __post_init__(self):
-        if self.children is None:
-            self.children = []
-        if self.metadata is None:
-            self.metadata = {}
-
-class EELanguageParser:
-    """
-    .ee DSL Parser - Urgent Production Implementation
-    
-    Core Features:
-    - Unifies .aje/.ire/.e/.Re into single .ee syntax
-    - Four Axes coordinate assignment for all constructs
-    - BRRE reasoning engine integration
-    - Clinical workflow native support
-    - Privacy-by-design parsing
-    """
-    
-    def __init__(self, four_axes_processor=None):
-        self.four_axes = four_axes_processor
-        self.grammar = self._load_ee_grammar()
-        self.tokens = []
-        self.current_token = 0
-        
-    def parse(self, ee_code: str) -> EEASTNode:
-        """Parse .ee DSL code into AST with Four Axes annotations"""
-        
-        # Tokenize
-        self.tokens = self._tokenize(ee_code)
-        self.current_token = 0
-        
-        # Parse AST
-        ast = self._parse_program()
-        
-        # Annotate with Four Axes coordinates
-        if self.four_axes:
-            ast = self._annotate_four_axes(ast)
-        
-        return ast
-    
-    def _tokenize(self, code: str) -> List[Dict[str, Any]]:
-        """Tokenize .ee DSL code"""
-        
-        # .ee DSL token patterns
-        token_patterns = [
-            (r'clinical_event\s*\{', EETokenType.CLINICAL_EVENT),
-            (r'correlate\s*\(', EETokenType.CORRELATE),
-            (r'execute\s*\(', EETokenType.EXECUTE),
-            (r'@temporal\[', EETokenType.TEMPORAL_MARKER),
-            (r'@spatial\[', EETokenType.SPATIAL_MARKER),
-            (r'@emergent\[', EETokenType.EMERGENT_MARKER),
-            (r'@semantic\[', EETokenType.SEMANTIC_MARKER),
-            (r'@four_axes\[', EETokenType.FOUR_AXES_ANNOTATION),
-            
-            # Legacy DSL integration patterns
-            (r'\.aje\s*\{', EETokenType.AJE_CONSTRUCT),
-            (r'\.ire\s*\(', EETokenType.IRE_CONSTRUCT),
-            (r'\.e\s*\[', EETokenType.E_CONSTRUCT),
-            (r'\.Re\s*<', EETokenType.RE_CONSTRUCT),
-            
-            # Basic patterns
-            (r'"[^"]*"', EETokenType.STRING),
-            (r'\d+\.?\d*', EETokenType.NUMBER),
-            (r'[a-zA-Z_][a-zA-Z0-9_]*', EETokenType.IDENTIFIER),
-            (r'[+\-*/=<>!&|]+', EETokenType.OPERATOR),
-        ]
-        
-        tokens = []
-        position = 0
-        
-        while position < len(code):
-            matched = False
-            
-            for pattern, token_type in token_patterns:
-                regex = re.compile(pattern)
-                match = regex.match(code, position)
-                
-                if match:
-                    tokens.append({
-                        "type": token_type,
-                        "value": match.group(0),
-                        "position": position,
-                        "length": len(match.group(0))
-                    })
-                    position = match.end()
-                    matched = True
-                    break
-            
-            if not matched:
-                # Skip whitespace and unknown characters
-                position += 1
-        
-        return tokens
-    
-    def _parse_program(self) -> EEASTNode:
-        """Parse top-level .ee program"""
-        
-        program_node = EEASTNode("program", "root")
-        
-        while self.current_token < len(self.tokens):
-            statement = self._parse_statement()
-            if statement:
-                program_node.children.append(statement)
-        
-        return program_node
-    
-    def _parse_statement(self) -> Optional[EEASTNode]:
-        """Parse individual .ee statement"""
-        
-        if self.current_token >= len(self.tokens):
-            return None
-        
-        token = self.tokens[self.current_token]
-        
-        if token["type"] == EETokenType.CLINICAL_EVENT:
-            return self._parse_clinical_event()
-        elif token["type"] == EETokenType.CORRELATE:
-            return self._parse_correlate()
-        elif token["type"] == EETokenType.EXECUTE:
-            return self._parse_execute()
-        elif token["type"] in [EETokenType.AJE_CONSTRUCT, EETokenType.IRE_CONSTRUCT, 
-                              EETokenType.E_CONSTRUCT, EETokenType.RE_CONSTRUCT]:
-            return self._parse_legacy_construct()
-        else:
-            # Skip unknown tokens
-            self.current_token += 1
-            return None
-    
-    def _parse_clinical_event(self) -> EEASTNode:
-        """Parse clinical_event construct"""
-        
-        self.current_token += 1  # Skip 'clinical_event{'
-        
-        event_node = EEASTNode("clinical_event", {})
-        
-        # Parse event properties
-        while (self.current_token < len(self.tokens) and 
-               self.tokens[self.current_token]["value"] != "}"):
-            
-            property_node = self._parse_property()
-            if property_node:
-                event_node.children.append(property_node)
-        
-        return event_node
-    
-    def _parse_correlate(self) -> EEASTNode:
-        """Parse correlate construct"""
-        
-        self.current_token += 1  # Skip 'correlate('
-        
-        correlate_node = EEASTNode("correlate", {})
-        
-        # Parse correlation parameters
-        while (self.current_token < len(self.tokens) and 
-               self.tokens[self.current_token]["value"] != ")"):
-            
-            param_node = self._parse_parameter()
-            if param_node:
-                correlate_node.children.append(param_node)
-        
-        return correlate_node
-    
-    def _parse_execute(self) -> EEASTNode:
-        """Parse execute construct"""
-        
-        self.current_token += 1  # Skip 'execute('
-        
-        execute_node = EEASTNode("execute", {})
-        
-        # Parse execution parameters
-        while (self.current_token < len(self.tokens) and 
-               self.tokens[self.current_token]["value"] != ")"):
-            
-            param_node = self._parse_parameter()
-            if param_node:
-                execute_node.children.append(param_node)
-        
-        return execute_node
-    
-    def _annotate_four_axes(self, ast: EEASTNode) -> EEASTNode:
-        """Annotate AST with Four Axes coordinates"""
-        
-        if self.four_axes:
-            ast.four_axes_coords = self.four_axes.calculate_coordinates(ast)
-        
-        # Recursively annotate children
-        for child in ast.children:
-            self._annotate_four_axes(child)
-        
-        return ast
-    
-    def validate(self, ast: EEASTNode) -> Dict[str, Any]:
-        """Validate .ee DSL AST for correctness and compliance"""
-        
-        validation_result = {
-            "valid": True,
-            "errors": [],
-            "warnings": [],
-            "four_axes_coverage": 0.0,
-            "legacy_constructs_count": 0,
-            "privacy_compliance": True
-        }
-        
-        # Validate AST structure
-        self._validate_ast_structure(ast, validation_result)
-        
-        # Validate Four Axes annotations
-        self._validate_four_axes_coverage(ast, validation_result)
-        
-        # Check privacy compliance
-        self._validate_privacy_compliance(ast, validation_result)
-        
-        return validation_result
-'''
+        # .ee DSL parser foundation (URGENT) - maintained in scripts/ee_parser.py
+        ee_parser_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts", "ee_parser.py")
+        with open(ee_parser_path, "r", encoding="utf-8") as f:
+            ee_parser = f.read()
         
         # BRRE cognitive engine
         brre_engine = '''"""
@@ -499,9 +249,12 @@ class BRREReasoningEngine:
         print("Goal: Build foundation efficiently, scale later\n")
         
         try:
-            self.create_core_structure()
-            self.setup_ai_integration()
-            self.create_development_workflow()
+            with instrumentation.span('Create Core Structure'):
+                asyncio.run(self.create_core_structure())
+            with instrumentation.span('Setup AI Integration'):
+                self.setup_ai_integration()
+            with instrumentation.span('Create Development Workflow'):
+                self.create_development_workflow()
             
             print("\n✅ VOITHER Core Setup Complete!")
             print("\n📋 Next Steps:")
@@ -522,279 +275,10 @@ class BRREReasoningEngine:
             print(f"❌ Setup failed: {e}")
 
 if __name__ == "__main__":
-    builder = VoitherCoreBuilder()
-    builder.run_setup()
-        ]
-        
-        for step_name, step_func in setup_steps:
-            print(f"\n📋 {step_name}...")
-            try:
-                result = await step_func()
-                self.setup_status[step_name] = {"status": "success", "result": result}
-                print(f"✅ {step_name} completed successfully")
-            except Exception as e:
-                self.setup_status[step_name] = {"status": "error", "error": str(e)}
-                print(f"❌ {step_name} failed: {e}")
-                
-        self.generate_setup_report()
+    parser = argparse.ArgumentParser(description="VOITHER Core System Quick Start")
+    instrumentation.add_arguments(parser)
+    args = parser.parse_args()
     
-    async def validate_resources(self) -> Dict:
-        """Validate available enterprise resources"""
-        resources = {
-            "github_enterprise": self.check_github_enterprise(),
-            "copilot_licenses": self.check_copilot_licenses(),
-            "ai_services": self.check_ai_services(),
-            "cloud_resources": self.check_cloud_resources()
-        }
-        
-        print(f"📊 Enterprise Resources Validated:")
-        for resource, status in resources.items():
-            status_icon = "✅" if status else "❌"
-            print(f"   {status_icon} {resource}: {status}")
-            
-        return resources
-    
-    def check_github_enterprise(self) -> bool:
-        """Check GitHub Enterprise availability"""
-        # Simulate check - in real implementation, use GitHub API
-        print("   🔍 Checking GitHub Enterprise subscriptions...")
-        return True  # Gustavo confirmed he has 10 subscriptions
-    
-    def check_copilot_licenses(self) -> bool:
-        """Check Copilot Enterprise licenses"""
-        print("   🔍 Checking Copilot Enterprise licenses...")
-        return True  # Gustavo confirmed he has 10 licenses
-    
-    def check_ai_services(self) -> Dict[str, bool]:
-        """Check AI service availability"""
-        services = {
-            "claude_max": bool(self.config.claude_api_key),
-            "openai_plus": bool(self.config.openai_api_key),
-            "google_ai_ultra": bool(self.config.google_ai_key),
-            "azure_ai": bool(self.config.azure_ai_key)
-        }
-        
-        for service, available in services.items():
-            status_icon = "✅" if available else "❌"
-            print(f"   {status_icon} {service}: {'Available' if available else 'Need API key'}")
-            
-        return services
-    
-    def check_cloud_resources(self) -> Dict[str, bool]:
-        """Check cloud resource availability"""
-        resources = {
-            "microsoft_for_startups": True,  # Gustavo confirmed
-            "google_for_startups": True,     # Gustavo confirmed
-            "google_cloud_innovators": True   # Gustavo confirmed
-        }
-        
-        for resource, available in resources.items():
-            print(f"   ✅ {resource}: Available")
-            
-        return resources
-    
-    async def setup_github_enterprise(self) -> Dict:
-        """Setup GitHub Enterprise multi-account structure"""
-        organizations = [
-            "voither-core", "voither-medical", "voither-development",
-            "voither-orchestration", "voither-infrastructure", "voither-research",
-            "voither-mobile", "voither-data", "voither-compliance", "voither-innovation"
-        ]
-        
-        setup_result = {"organizations": [], "repositories": []}
-        
-        for org in organizations:
-            print(f"   🏢 Setting up organization: {org}")
-            # In real implementation, use GitHub API
-            org_setup = {
-                "name": org,
-                "copilot_licenses": 2 if org != "voither-development" else 3,
-                "repositories": self.get_org_repositories(org)
-            }
-            setup_result["organizations"].append(org_setup)
-            
-        return setup_result
-    
-    def get_org_repositories(self, org: str) -> List[str]:
-        """Get repository list for organization"""
-        repo_mapping = {
-            "voither-core": ["knowledge-base", "documentation", "automation"],
-            "voither-medical": ["medicalscribe", "fhir-integration", "clinical-tools"],
-            "voither-development": ["frontend-app", "backend-api", "shared-components"],
-            "voither-orchestration": ["autoagency", "multi-agent-coordination", "workflow-engine"],
-            "voither-infrastructure": ["cloud-deployment", "monitoring", "ci-cd-pipelines"],
-            "voither-research": ["holofractor", "analytics", "research-tools"],
-            "voither-mobile": ["mobile-app", "cross-platform", "native-modules"],
-            "voither-data": ["data-lake", "privacy-engine", "analytics-pipeline"],
-            "voither-compliance": ["hipaa-tools", "lgpd-compliance", "audit-systems"],
-            "voither-innovation": ["experimental-features", "r-and-d", "proof-of-concepts"]
-        }
-        return repo_mapping.get(org, [])
-    
-    async def initialize_ai_agents(self) -> Dict:
-        """Initialize all AI agents with VOITHER context"""
-        agents = {
-            "claude_strategic": self.init_claude_strategic(),
-            "openai_constructor": self.init_openai_constructor(),
-            "gemini_researcher": self.init_gemini_researcher(),
-            "azure_medical": self.init_azure_medical(),
-            "copilot_specialists": self.init_copilot_specialists()
-        }
-        
-        for agent_name, agent_config in agents.items():
-            print(f"   🤖 Initializing {agent_name}...")
-            
-        return agents
-    
-    def init_claude_strategic(self) -> Dict:
-        """Initialize Claude as Strategic CTO"""
-        return {
-            "role": "Strategic CTO & Philosophical Reasoner",
-            "specialization": "VOITHER ecosystem strategy",
-            "knowledge_base": "Complete VOITHER documentation",
-            "capabilities": ["strategic_planning", "team_coordination", "philosophical_analysis"]
-        }
-    
-    def init_openai_constructor(self) -> Dict:
-        """Initialize OpenAI as Development Constructor"""
-        return {
-            "role": "Development Constructor & Code Generator",
-            "specialization": "VOITHER application development",
-            "knowledge_base": "Technical architecture and patterns",
-            "capabilities": ["code_generation", "architecture_design", "refactoring"]
-        }
-    
-    def init_gemini_researcher(self) -> Dict:
-        """Initialize Gemini as Research Agent"""
-        return {
-            "role": "Research & Analytics Specialist",
-            "specialization": "VOITHER research and data analysis",
-            "knowledge_base": "Research papers and analytics",
-            "capabilities": ["data_analysis", "research_synthesis", "insight_generation"]
-        }
-    
-    def init_azure_medical(self) -> Dict:
-        """Initialize Azure as Medical AI"""
-        return {
-            "role": "Medical AI & FHIR Specialist",
-            "specialization": "Clinical data processing",
-            "knowledge_base": "Medical terminology and FHIR",
-            "capabilities": ["clinical_analysis", "fhir_processing", "medical_compliance"]
-        }
-    
-    def init_copilot_specialists(self) -> Dict:
-        """Initialize Copilot Enterprise specialists"""
-        return {
-            "specialists": [
-                {"domain": "medical", "organization": "voither-medical"},
-                {"domain": "frontend", "organization": "voither-development"},
-                {"domain": "backend", "organization": "voither-development"},
-                {"domain": "data", "organization": "voither-data"},
-                {"domain": "mobile", "organization": "voither-mobile"}
-            ]
-        }
-    
-    async def setup_communication(self) -> Dict:
-        """Setup cross-agent communication protocol"""
-        print("   🔄 Configuring VOITHER ontological communication protocol...")
-        
-        communication_config = {
-            "protocol": "voither_four_axes",
-            "message_format": "ee_dsl_encoding",
-            "routing_table": self.create_routing_table(),
-            "coordination_engine": "autoagency_agent"
-        }
-        
-        return communication_config
-    
-    def create_routing_table(self) -> Dict:
-        """Create routing table for agent communication"""
-        return {
-            "strategic_planning": "claude_strategic",
-            "code_generation": "openai_constructor",
-            "research_analysis": "gemini_researcher",
-            "medical_processing": "azure_medical",
-            "specialized_development": "copilot_specialists"
-        }
-    
-    async def create_repositories(self) -> Dict:
-        """Create initial repository structure"""
-        print("   📁 Creating specialized repositories...")
-        
-        # In real implementation, create actual repositories
-        repositories = {
-            "total_repositories": 30,
-            "organizations": 10,
-            "templates_created": True,
-            "knowledge_sync": True
-        }
-        
-        return repositories
-    
-    async def test_coordination(self) -> Dict:
-        """Test AI agent coordination"""
-        print("   🧪 Testing AI agent coordination...")
-        
-        test_results = {
-            "communication_test": "passed",
-            "routing_test": "passed",
-            "coordination_test": "passed",
-            "knowledge_sync_test": "passed"
-        }
-        
-        return test_results
-    
-    async def launch_dashboard(self) -> Dict:
-        """Launch monitoring dashboard"""
-        print("   📊 Launching AI ecosystem monitoring dashboard...")
-        
-        dashboard_config = {
-            "url": "http://localhost:3000/voither-dashboard",
-            "features": ["ai_agent_monitoring", "project_coordination", "resource_utilization"],
-            "real_time_updates": True
-        }
-        
-        return dashboard_config
-    
-    def generate_setup_report(self):
-        """Generate comprehensive setup report"""
-        print("\n" + "=" * 60)
-        print("🎯 VOITHER AI ECOSYSTEM SETUP COMPLETE")
-        print("=" * 60)
-        
-        print("\n📋 Setup Summary:")
-        success_count = sum(1 for status in self.setup_status.values() if status["status"] == "success")
-        total_count = len(self.setup_status)
-        
-        print(f"✅ Successful steps: {success_count}/{total_count}")
-        
-        for step, status in self.setup_status.items():
-            status_icon = "✅" if status["status"] == "success" else "❌"
-            print(f"   {status_icon} {step}")
-        
-        print("\n🚀 Next Steps:")
-        print("1. Access your AI team dashboard: http://localhost:3000/voither-dashboard")
-        print("2. Try your first AI-coordinated project: python examples/first_ai_project.py")
-        print("3. Explore Claude Strategic guidance: python scripts/claude_consultation.py")
-        print("4. Monitor GitHub Enterprise usage: python scripts/enterprise_monitor.py")
-        
-        print("\n🎉 Welcome to the VOITHER AI-Native Ecosystem!")
-        print("Your 18 months of research is now a functioning AI startup team.")
-        
-        # Save setup report
-        with open("voither_setup_report.json", "w") as f:
-            json.dump(self.setup_status, f, indent=2)
-        
-        print("\n📄 Setup report saved: voither_setup_report.json")
-
-async def main():
-    """Main setup function"""
-    print("🎯 VOITHER AI Ecosystem Quick Start")
-    print("Transforming 18 months of research into AI-native startup team")
-    print()
-    
-    quick_start = VoitherQuickStart()
-    await quick_start.run_complete_setup()
-
-if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    with instrumentation.from_args('voither_quick_start', args):
+        builder = VoitherCoreBuilder()
+        builder.run_setup()
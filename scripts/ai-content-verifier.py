@@ -25,6 +25,14 @@ import frontmatter
 from typing import Dict, List, Any, Tuple
 import logging
 
+import instrumentation
+from bibliography_index import BibliographyIndex
+from blob_map import BlobMap
+from code_blocks import CodeBlockValidator, extract_code_blocks, VALIDATOR_VERSION
+from docs_cache import ResultCache
+from docs_index import DocumentIndex
+from docs_rules import get_engine
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -32,10 +40,15 @@ logger = logging.getLogger(__name__)
 class AIContentVerifier:
     def __init__(self, docs_directory: str):
         self.docs_directory = Path(docs_directory)
+        self.rules = get_engine(docs_directory)
         self.verification_log = []
         self.content_hashes = {}
         self.terminology_database = self._load_terminology_database()
         self.scientific_references = self._load_scientific_references()
+        self.bibliography = BibliographyIndex.from_directory(str(self.docs_directory))
+        self.code_blocks = CodeBlockValidator(
+            ResultCache("code_blocks", self.docs_directory, VALIDATOR_VERSION)
+        )
         
     def _load_terminology_database(self) -> Dict[str, Any]:
         """Load and return the VOITHER terminology database"""
@@ -146,7 +159,7 @@ class AIContentVerifier:
     
     def _verify_metadata(self, metadata: Dict) -> Dict[str, Any]:
         """Verify YAML frontmatter metadata"""
-        required_fields = ["title", "description", "version", "last_updated", "audience", "priority", "reading_time", "tags"]
+        required_fields = self.rules.required_frontmatter
         validation = {
             "has_required_fields": True,
             "missing_fields": [],
@@ -198,12 +211,17 @@ class AIContentVerifier:
             validation["structure_score"] -= 10
             validation["issues"].append("Insufficient section organization")
         
-        # Check content length and completeness
+        # Check content length and completeness against docs-config.yml word limits
         word_count = len(content.split())
+        max_words = self.rules.word_limits.get("max_words_per_document")
+        warn_words = self.rules.word_limits.get("warn_words_per_document")
         if word_count < 100:
             validation["completeness_score"] -= 30
             validation["issues"].append("Content too brief for comprehensive documentation")
-        elif word_count > 5000:
+        elif max_words is not None and word_count > max_words:
+            validation["readability_score"] -= 20
+            validation["issues"].append(f"Document exceeds {max_words} words - split into smaller documents")
+        elif warn_words is not None and word_count > warn_words:
             validation["readability_score"] -= 10
             validation["issues"].append("Consider breaking into smaller sections")
         
@@ -213,6 +231,12 @@ class AIContentVerifier:
                 validation["completeness_score"] -= 15
                 validation["issues"].append("Technical content lacks code examples")
         
+        # Check that embedded code blocks still parse
+        for block in extract_code_blocks(content):
+            for error in self.code_blocks.errors_for(block):
+                validation["completeness_score"] = max(0, validation["completeness_score"] - 5)
+                validation["issues"].append(f"Invalid {block.language or 'text'} code block: {error}")
+        
         return validation
     
     def _verify_terminology(self, content: str) -> Dict[str, Any]:
@@ -293,6 +317,17 @@ class AIContentVerifier:
             validation["citation_quality"] -= 20
             validation["warnings"].append("Long content lacks proper citations")
         
+        # Resolve author/year citations against the local bibliography
+        if len(self.bibliography):
+            resolution = self.bibliography.verify(content)
+            validation["fact_checking"]["citations_resolved"] = resolution["citations_resolved"]
+            for item in resolution["unresolved"]:
+                validation["citation_quality"] -= 5
+                validation["warnings"].append(
+                    f"Citation not found in bibliography: ({item['citation']}) at line {item['line']}"
+                )
+            validation["citation_quality"] = max(0, validation["citation_quality"])
+        
         return validation
     
     def _verify_consistency(self, content: str, file_path: Path) -> Dict[str, Any]:
@@ -421,24 +456,34 @@ class AIContentVerifier:
             "excluded_folders": ["raw"]
         }
         
-        # Find all markdown files, excluding raw folder
-        md_files = []
-        for md_file in self.docs_directory.rglob("*.md"):
-            # Skip files in the raw folder as they are unprocessed backups
-            if "raw" in md_file.parts:
-                logger.info(f"Skipping raw backup file: {md_file}")
-                continue
-            md_files.append(md_file)
+        # Markdown files from the shared document index, selected by docs-config.yml (raw/ is excluded there)
+        index = DocumentIndex.open(str(self.docs_directory))
+        md_paths = [record.path for record in index.markdown() if self.rules.matcher.matches(record.path)]
+        groups = BlobMap.from_index(index, ('.md',)).distinct(md_paths)
+        index.close()
         
-        results["total_documents"] = len(md_files)
-        logger.info(f"Found {len(md_files)} markdown files for verification (excluding raw folder)")
+        results["total_documents"] = len(md_paths)
+        logger.info(f"Found {len(md_paths)} markdown files for verification "
+                    f"({len(groups)} distinct, excluding raw folder)")
         
         total_quality = 0
         issue_counts = {}
         
-        for md_file in md_files:
+        # Validate every embedded code block up front in one pooled batch
+        with instrumentation.span('code-blocks', documents=len(groups)):
+            self.code_blocks.validate_files(self.docs_directory / paths[0] for paths in groups.values())
+        
+        for paths in groups.values():
             try:
-                doc_result = self.verify_document(md_file)
+                with instrumentation.span('verify-document', path=paths[0]):
+                    verified = self.verify_document(self.docs_directory / paths[0])
+            except Exception as e:
+                logger.error(f"Error verifying {paths[0]}: {e}")
+                continue
+            
+            # Verification depends only on content, so identical copies share the result
+            for rel_path in paths:
+                doc_result = dict(verified, file=rel_path) if rel_path != paths[0] else verified
                 results["documents"].append(doc_result)
                 results["documents_verified"] += 1
                 
@@ -458,9 +503,6 @@ class AIContentVerifier:
                 # Track common issues
                 for suggestion in doc_result["improvement_suggestions"]:
                     issue_counts[suggestion] = issue_counts.get(suggestion, 0) + 1
-                
-            except Exception as e:
-                logger.error(f"Error verifying {md_file}: {e}")
         
         # Calculate averages and generate recommendations
         if results["documents_verified"] > 0:
@@ -472,6 +514,8 @@ class AIContentVerifier:
         # Generate high-level recommendations
         results["recommendations"] = self._generate_repository_recommendations(results)
         
+        self.code_blocks.save()
+        
         return results
     
     def _generate_repository_recommendations(self, results: Dict) -> List[str]:
@@ -544,20 +588,25 @@ def main():
     parser.add_argument("--docs-dir", default=".", help="Documentation directory path")
     parser.add_argument("--output", default="content_verification_report.json", help="Output report file")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
+    instrumentation.add_arguments(parser)
     
     args = parser.parse_args()
     
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
     
-    # Initialize verifier
-    verifier = AIContentVerifier(args.docs_dir)
-    
-    # Run comprehensive verification
-    results = verifier.verify_all_documents()
-    
-    # Generate audit report
-    verifier.generate_audit_report(results, args.output)
+    with instrumentation.from_args('ai-content-verifier', args):
+        # Initialize verifier
+        with instrumentation.span('init'):
+            verifier = AIContentVerifier(args.docs_dir)
+        
+        # Run comprehensive verification
+        with instrumentation.span('verify-all'):
+            results = verifier.verify_all_documents()
+        
+        # Generate audit report
+        with instrumentation.span('audit-report'):
+            verifier.generate_audit_report(results, args.output)
     
     # Print summary
     print(f"\n🤖 AI Content Verification Complete")
@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+VOITHER Asset Pipeline
+Content-hashed image optimization for docs/assets
+
+Features:
+- Lossless recompression: PNG through Pillow's optimizer, JPEG through
+  jpegtran (Huffman optimization, metadata stripped); the smaller of the
+  original and the recompressed file is kept
+- Responsive downscaled variants and a WebP variant of every image
+- Outputs are named by source hash under build/assets with a manifest.json;
+  results are cached by source hash, so unchanged assets are never
+  reprocessed and identical copies are processed once
+- Process pool for large asset sets
+- Per-asset size budget (build.assets.max_kb in docs-config.yml), checked by
+  validate-docs.py against the optimized size when the asset is built
+"""
+
+import io
+import os
+import re
+import sys
+import json
+import shutil
+import argparse
+import posixpath
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from blob_map import BlobMap
+from docs_cache import ResultCache, atomic_write, content_hash
+from docs_index import DocumentIndex
+from docs_rules import load_config
+
+try:
+    from PIL import Image, features
+except ImportError:  # pragma: no cover - optional dependency
+    Image = None
+
+# Bump when encoders or output naming change so cached results are discarded
+PIPELINE_VERSION = 1
+
+# Images are slow to encode; the pool pays off after a handful
+POOL_THRESHOLD = 4
+
+IMAGE_SUFFIXES = ('.png', '.jpg', '.jpeg')
+MANIFEST = 'manifest.json'
+
+DEFAULT_SETTINGS: Dict[str, Any] = {
+    'source_dir': 'docs/assets',
+    'output_dir': 'build/assets',
+    'widths': [480, 960, 1440],
+    'webp': True,
+    'webp_quality': 85,
+    'max_kb': 0,  # 0 disables the budget
+}
+
+SLUG = re.compile(r'[^A-Za-z0-9._-]+')
+
+
+def load_settings(root: str = '.') -> Dict[str, Any]:
+    """build.assets from docs-config.yml over the defaults"""
+    build = load_config(root).get('build') or {}
+    return {**DEFAULT_SETTINGS, **(build.get('assets') or {})}
+
+
+def output_name(rel_path: str, source_hash: str, tag: str = '', suffix: Optional[str] = None) -> str:
+    """URL-safe, content-addressed file name: <stem>.<hash>[.<tag>]<suffix>"""
+    stem, original_suffix = posixpath.splitext(posixpath.basename(rel_path))
+    stem = SLUG.sub('-', stem).strip('-') or 'asset'
+    tag = f".{tag}" if tag else ''
+    return f"{stem}.{source_hash[:10]}{tag}{(suffix or original_suffix).lower()}"
+
+
+def _recompress(data: bytes, suffix: str) -> bytes:
+    """Losslessly recompressed bytes (or the input when nothing is gained)"""
+    if suffix == '.png' and Image is not None:
+        image = Image.open(io.BytesIO(data))
+        buffer = io.BytesIO()
+        options = {'optimize': True}
+        if image.info.get('icc_profile'):
+            options['icc_profile'] = image.info['icc_profile']
+        image.save(buffer, 'PNG', **options)
+        candidate = buffer.getvalue()
+    elif suffix in ('.jpg', '.jpeg') and shutil.which('jpegtran'):
+        # Re-encoding through Pillow is not lossless for JPEG; jpegtran is
+        result = subprocess.run(['jpegtran', '-copy', 'none', '-optimize', '-progressive'],
+                                input=data, capture_output=True)
+        candidate = result.stdout if result.returncode == 0 else data
+    else:
+        candidate = data
+    return candidate if 0 < len(candidate) < len(data) else data
+
+
+def _flatten_mode(image: 'Image.Image') -> 'Image.Image':
+    """RGB or RGBA, so resampling and WebP encoding work on every input"""
+    if image.mode in ('RGB', 'RGBA'):
+        return image
+    has_alpha = 'A' in image.getbands() or 'transparency' in image.info
+    return image.convert('RGBA' if has_alpha else 'RGB')
+
+
+def _encode(image: 'Image.Image', image_format: str, quality: int, lossless: bool) -> bytes:
+    buffer = io.BytesIO()
+    if image_format == 'WEBP':
+        options = {'lossless': True} if lossless else {'quality': quality}
+        image.save(buffer, 'WEBP', method=6, **options)
+    elif image_format == 'PNG':
+        image.save(buffer, 'PNG', optimize=True)
+    else:
+        image.convert('RGB').save(buffer, 'JPEG', quality=quality, optimize=True, progressive=True)
+    return buffer.getvalue()
+
+
+def process_asset(data: bytes, rel_path: str, source_hash: str, output_dir: str,
+                  settings: Dict[str, Any]) -> Dict[str, Any]:
+    """Write the optimized file and its variants; returns the manifest entry"""
+    suffix = posixpath.splitext(rel_path)[1].lower()
+    optimized = _recompress(data, suffix)
+    name = output_name(rel_path, source_hash)
+    atomic_write(os.path.join(output_dir, name), optimized)
+    entry: Dict[str, Any] = {
+        'hash': source_hash,
+        'bytes': len(data),
+        'file': name,
+        'output_bytes': len(optimized),
+        'variants': [],
+        'webp': None,
+    }
+    if Image is None:
+        return entry
+
+    image = Image.open(io.BytesIO(data))
+    entry['width'], entry['height'] = image.size
+    image = _flatten_mode(image)
+    # PNG screenshots keep their detail losslessly; photos use the quality setting
+    lossless = suffix == '.png'
+    image_format = 'PNG' if lossless else 'JPEG'
+    quality = int(settings['webp_quality'])
+
+    for width in sorted(set(int(w) for w in settings['widths'])):
+        if width >= image.width:
+            continue
+        height = max(1, round(image.height * width / image.width))
+        scaled = image.resize((width, height), Image.LANCZOS)
+        variant = _encode(scaled, image_format, quality, lossless)
+        variant_name = output_name(rel_path, source_hash, f"w{width}")
+        atomic_write(os.path.join(output_dir, variant_name), variant)
+        entry['variants'].append({'width': width, 'file': variant_name, 'bytes': len(variant)})
+
+    if settings['webp'] and features.check('webp'):
+        webp = _encode(image, 'WEBP', quality, lossless)
+        # A WebP that is no smaller than the optimized original is not worth serving
+        if len(webp) < len(optimized):
+            webp_name = output_name(rel_path, source_hash, suffix='.webp')
+            atomic_write(os.path.join(output_dir, webp_name), webp)
+            entry['webp'] = {'file': webp_name, 'bytes': len(webp)}
+    return entry
+
+
+def _process_job(job: Tuple[str, str, str, str, str, Dict[str, Any]]) -> Tuple[str, Optional[Dict[str, Any]]]:
+    key, root, rel_path, source_hash, output_dir, settings = job
+    try:
+        with open(os.path.join(root, rel_path), 'rb') as f:
+            data = f.read()
+        return key, process_asset(data, rel_path, source_hash, output_dir, settings)
+    except (OSError, ValueError) as e:
+        print(f"  ❌ {rel_path}: {e}", file=sys.stderr)
+        return key, None
+
+
+def _outputs(entry: Dict[str, Any]) -> List[str]:
+    files = [entry['file']] + [variant['file'] for variant in entry['variants']]
+    if entry.get('webp'):
+        files.append(entry['webp']['file'])
+    return files
+
+
+class AssetPipeline:
+    """Builds build/assets from the indexed source images"""
+
+    def __init__(self, root: str = '.', settings: Optional[Dict[str, Any]] = None,
+                 cache: Optional[ResultCache] = None, workers: Optional[int] = None):
+        self.root = os.path.abspath(root)
+        self.settings = settings or load_settings(self.root)
+        self.output_dir = os.path.join(self.root, self.settings['output_dir'])
+        self.cache = cache
+        self.workers = workers
+        self.processed = 0
+        self.cached = 0
+        # Results depend on the encoders and their settings as well as the source bytes
+        encoders = {key: self.settings[key] for key in ('widths', 'webp', 'webp_quality')}
+        encoders.update(pillow=Image is not None, jpegtran=bool(shutil.which('jpegtran')))
+        self.settings_key = content_hash(json.dumps(encoders, sort_keys=True))[:16]
+
+    def sources(self, index: DocumentIndex) -> List[Tuple[str, str]]:
+        """(path, hash) of every image under the source directory"""
+        prefix = self.settings['source_dir'].strip('/') + '/'
+        return [(record.path, record.hash) for record in index.files(kinds=IMAGE_SUFFIXES, prefix=prefix)]
+
+    def _cached(self, key: str) -> Optional[Dict[str, Any]]:
+        if self.cache is None or key not in self.cache:
+            return None
+        entry = self.cache.get(key)
+        # A cleaned build directory means the outputs have to be written again
+        if all(os.path.exists(os.path.join(self.output_dir, name)) for name in _outputs(entry)):
+            return entry
+        return None
+
+    def build(self, index: DocumentIndex) -> Dict[str, Dict[str, Any]]:
+        """path -> manifest entry, processing only sources without cached outputs"""
+        sources = self.sources(index)
+        hashes = dict(sources)
+        groups = BlobMap((path, source_hash, 0) for path, source_hash in sources).distinct(hashes)
+
+        results: Dict[str, Dict[str, Any]] = {}
+        jobs = []
+        for source_hash, paths in groups.items():
+            key = f"{source_hash}:{self.settings_key}"
+            entry = self._cached(key)
+            if entry is not None:
+                results[source_hash] = entry
+            else:
+                jobs.append((key, self.root, paths[0], source_hash, self.output_dir, self.settings))
+        self.cached = len(results)
+
+        if len(jobs) >= POOL_THRESHOLD and self.workers != 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                processed = list(pool.map(_process_job, jobs))
+        else:
+            processed = [_process_job(job) for job in jobs]
+
+        for key, entry in processed:
+            if entry is None:
+                continue
+            results[entry['hash']] = entry
+            self.processed += 1
+            if self.cache is not None:
+                self.cache.put(key, entry)
+        if self.cache is not None:
+            self.cache.retain(f"{source_hash}:{self.settings_key}" for source_hash in groups)
+            self.cache.save()
+
+        return {path: results[hashes[path]] for path in sorted(hashes) if hashes[path] in results}
+
+    def write_manifest(self, assets: Dict[str, Dict[str, Any]]) -> str:
+        path = os.path.join(self.output_dir, MANIFEST)
+        manifest = {'version': PIPELINE_VERSION, 'assets': assets}
+        atomic_write(path, json.dumps(manifest, indent=2, ensure_ascii=False))
+        return path
+
+    def prune(self, assets: Dict[str, Dict[str, Any]]) -> int:
+        """Delete outputs no current source produces"""
+        keep = {MANIFEST} | {name for entry in assets.values() for name in _outputs(entry)}
+        removed = 0
+        for name in os.listdir(self.output_dir):
+            if name not in keep and not name.startswith('.'):
+                os.remove(os.path.join(self.output_dir, name))
+                removed += 1
+        return removed
+
+
+def load_manifest(root: str = '.', settings: Optional[Dict[str, Any]] = None) -> Dict[str, Dict[str, Any]]:
+    """path -> manifest entry from the last build ({} when nothing was built)"""
+    settings = settings or load_settings(root)
+    try:
+        with open(os.path.join(root, settings['output_dir'], MANIFEST), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest.get('assets', {}) if manifest.get('version') == PIPELINE_VERSION else {}
+
+
+def check_budget(index: DocumentIndex, settings: Optional[Dict[str, Any]] = None) -> List[Tuple[str, int, int]]:
+    """
+    (path, bytes, budget) for every source image over the per-asset budget
+
+    An image counts at its optimized size when the manifest has an entry
+    for its current content, and at its source size otherwise.
+    """
+    settings = settings or load_settings(index.root)
+    budget = int(float(settings.get('max_kb') or 0) * 1024)
+    if budget <= 0:
+        return []
+    manifest = load_manifest(index.root, settings)
+    prefix = settings['source_dir'].strip('/') + '/'
+    over = []
+    for record in index.files(kinds=IMAGE_SUFFIXES, prefix=prefix):
+        entry = manifest.get(record.path)
+        size = entry['output_bytes'] if entry and entry['hash'] == record.hash else record.size
+        if size > budget:
+            over.append((record.path, size, budget))
+    return over
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Optimize documentation images into build/assets')
+    parser.add_argument('directory', nargs='?', default='.',
+                        help='Documentation root (default: current directory)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes (default: CPU count)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Reprocess every asset')
+    parser.add_argument('--check', action='store_true',
+                        help='Only check the per-asset size budget')
+    args = parser.parse_args()
+
+    directory = os.path.abspath(args.directory)
+    settings = load_settings(directory)
+    index = DocumentIndex.open(directory)
+    try:
+        if args.check:
+            over = check_budget(index, settings)
+            for path, size, budget in over:
+                print(f"  ❌ {path}: {size / 1024:.0f} KB exceeds the {budget / 1024:.0f} KB asset budget")
+            print(f"{'⚠️ ' if over else '✅'} {len(over)} assets over budget")
+            return 0
+
+        if Image is None:
+            print("⚠️  Pillow is not installed: images are copied without recompression or variants")
+        cache = None if args.no_cache else ResultCache('assets', directory, PIPELINE_VERSION)
+        pipeline = AssetPipeline(directory, settings, cache, args.workers)
+        print(f"🖼️  Optimizing images in {settings['source_dir']} -> {settings['output_dir']}...")
+        assets = pipeline.build(index)
+    finally:
+        index.close()
+
+    os.makedirs(pipeline.output_dir, exist_ok=True)
+    manifest_path = pipeline.write_manifest(assets)
+    pruned = pipeline.prune(assets)
+
+    source_bytes = sum(entry['bytes'] for entry in assets.values())
+    output_bytes = sum(entry['output_bytes'] for entry in assets.values())
+    webp_bytes = sum(min(entry['output_bytes'], (entry.get('webp') or {}).get('bytes', entry['output_bytes']))
+                     for entry in assets.values())
+    for path, entry in assets.items():
+        webp = f", webp {entry['webp']['bytes'] / 1024:.0f} KB" if entry.get('webp') else ''
+        print(f"  📄 {path}: {entry['bytes'] / 1024:.0f} KB -> {entry['output_bytes'] / 1024:.0f} KB"
+              f"{webp}, {len(entry['variants'])} variants")
+
+    print(f"\n📊 {len(assets)} assets ({pipeline.processed} processed, {pipeline.cached} cached, "
+          f"{pruned} stale outputs removed)")
+    if source_bytes:
+        print(f"   💾 Lossless: {source_bytes:,} -> {output_bytes:,} bytes "
+              f"({source_bytes - output_bytes:,} saved, {100 * (source_bytes - output_bytes) / source_bytes:.1f}%)")
+        print(f"   🌐 Best format per asset: {webp_bytes:,} bytes "
+              f"({source_bytes - webp_bytes:,} saved, {100 * (source_bytes - webp_bytes) / source_bytes:.1f}%)")
+    print(f"   🗺️  Manifest: {os.path.relpath(manifest_path, directory)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
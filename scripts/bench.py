@@ -0,0 +1,570 @@
+#!/usr/bin/env python3
+"""
+VOITHER Benchmarks
+Fixed-input timings of the documentation tools and runtime hot paths, gated
+against a per-machine baseline
+
+Features:
+- Cases for the link checker (cold and warm index), the content verifier,
+  the .ee tokenizer and parser, and the A2A message path and initializer
+- The .ee tokenizer is also timed on a multi-megabyte program, next to the
+  original per-position tokenizer it replaced for comparison, and the
+  streaming statement parser reads the same program from a file
+- Inputs are synthetic and generated from a fixed seed, so every run and
+  every machine times the same work
+- Each case runs in its own child process: peak RSS belongs to that case
+  alone, and module caches never leak from one case into the next
+- Wall time is the median of several timed repeats after a warm-up run
+- Results are stored as benchmarks/<machine>.json; later runs fail when wall
+  time, throughput or peak RSS regress past the threshold in docs-config.yml
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import random
+import shutil
+import asyncio
+import logging
+import argparse
+import platform
+import posixpath
+import statistics
+import subprocess
+import tempfile
+import contextlib
+import importlib.util
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from docs_cache import CACHE_DIR, atomic_write
+from docs_rules import load_config
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_DIR = 'benchmarks'
+# Bump when a case's input or unit changes; older baselines are not compared
+BENCH_VERSION = 1
+
+DEFAULT_SETTINGS = {
+    'threshold': 0.20,  # fail when a metric is this much worse than the baseline
+    'repeats': 5,
+}
+
+# (metric, higher is better, metric whose absolute change must pass the floor,
+# floor). The floors keep timer jitter on millisecond cases and allocator
+# noise from failing the gate; throughput moves with wall time.
+METRICS = [
+    ('wall_s', False, 'wall_s', 0.005),
+    ('throughput', True, 'wall_s', 0.005),
+    ('peak_rss_mb', False, 'peak_rss_mb', 4.0),
+]
+
+SEED = 20240601
+CORPUS_DOCS = 240
+CORPUS_DIRS = ['docs', 'docs/core-concepts', 'docs/architecture', 'guides', 'wiki']
+WORDS = (
+    'emergenability brre holofractor clinical session patient dimension temporal spatial semantic '
+    'pipeline agent protocol coordination reasoning narrative framework analysis memory graph '
+    'knowledge therapeutic intervention assessment data model event correlation privacy '
+    'compliance workflow documentation architecture component signal pattern emergence'
+).split()
+
+A2A_AGENTS = ['claude', 'openai', 'gemini', 'azure', 'copilot_medical', 'copilot_backend']
+A2A_MESSAGES = 20000
+# Matches the per-agent queues _setup_a2a_protocol creates
+A2A_QUEUE_SIZE = 1000
+A2A_SCRIPT = 'voither_architecture_specs/a2a_orchestration/initialize_agent_a2a.py'
+
+EE_STATEMENTS = 1500
+# About 4.5 MB of source
+EE_LARGE_STATEMENTS = 60000
+# About 100k lines, edited a keystroke at a time
+EE_EDIT_STATEMENTS = 33000
+EE_EDITS = 200
+
+
+@dataclass
+class Case:
+    name: str
+    unit: str
+    description: str
+    # corpus dir -> (reset before each repeat, timed run returning units of work)
+    load: Callable[[str, str], Tuple[Callable[[], None], Callable[[], int]]]
+
+
+CASES: Dict[str, Case] = {}
+
+
+def case(name: str, unit: str, description: str):
+    def register(load):
+        CASES[name] = Case(name, unit, description, load)
+        return load
+    return register
+
+
+def load_settings(root: str) -> Dict[str, Any]:
+    """quality_gates.benchmarks from docs-config.yml over the defaults"""
+    settings = dict(DEFAULT_SETTINGS)
+    settings.update((load_config(root).get('quality_gates') or {}).get('benchmarks') or {})
+    return settings
+
+
+def machine_id() -> str:
+    return re.sub(r'[^A-Za-z0-9_.-]+', '-', f"{platform.node() or 'unknown'}-{platform.machine()}")
+
+
+def machine_info() -> Dict[str, Any]:
+    return {
+        'id': machine_id(),
+        'platform': platform.platform(),
+        'python': platform.python_version(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def peak_rss_mb() -> float:
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def _load_script(path: str, name: str):
+    """Import a script whose file name is not a valid module name"""
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# Synthetic inputs
+
+def _paragraph(rng: random.Random, words: int) -> str:
+    text = ' '.join(rng.choice(WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + '.'
+
+
+def write_corpus(root: str, docs: int = CORPUS_DOCS, seed: int = SEED) -> Dict[str, int]:
+    """Markdown documents with frontmatter, links (one in ten broken), citations and code"""
+    rng = random.Random(seed)
+    paths = [f"{CORPUS_DIRS[i % len(CORPUS_DIRS)]}/topic_{i:03d}.md" for i in range(docs)]
+    links = 0
+    for i, path in enumerate(paths):
+        base = posixpath.dirname(path)
+        lines = [
+            '---',
+            f'title: "Topic {i}"',
+            f'description: "Synthetic benchmark document {i}"',
+            'version: "1.0"',
+            'last_updated: "2024-06-01"',
+            f'category: "{base.split("/")[-1]}"',
+            'tags: [benchmark, synthetic]',
+            '---',
+            '',
+            f'# Topic {i}',
+            '',
+        ]
+        for section in range(4):
+            lines += [f'## Section {section}', '', _paragraph(rng, 120), '']
+            for _ in range(3):
+                target = paths[rng.randrange(docs)]
+                if rng.random() < 0.1:
+                    target = posixpath.join(posixpath.dirname(target), f'missing_{rng.randrange(1000)}.md')
+                url = posixpath.relpath(target, base)
+                if rng.random() < 0.2:
+                    url += f'#section-{rng.randrange(4)}'
+                lines.append(f'- See [{posixpath.basename(target)}]({url}) (Smith, {2000 + rng.randrange(20)})')
+                links += 1
+            lines.append('')
+        lines += ['```python', f'def topic_{i}(value):', '    return value * 2', '```', '',
+                  '```ee', f'clinical_event {{ patient: "p{i}", score: {rng.randrange(100)} }}', '```', '',
+                  '[External reference](https://example.org/reference)', '']
+        full_path = os.path.join(root, path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines))
+    return {'documents': docs, 'links': links}
+
+
+def ee_program(statements: int = EE_STATEMENTS, seed: int = SEED) -> str:
+    """A .ee source mixing every statement kind, annotations and legacy constructs"""
+    rng = random.Random(seed)
+    parts = []
+    for i in range(statements):
+        kind = i % 5
+        if kind == 0:
+            parts.append(f'clinical_event {{\n    patient_id: "p{i}"\n    severity: {rng.randrange(10)}.{rng.randrange(10)}\n'
+                         f'    privacy_level: "phi_protected"\n    @temporal[onset: {rng.randrange(100)}]\n}}')
+        elif kind == 1:
+            parts.append(f'correlate(symptom_{i}: "fatigue", window: {rng.randrange(30)}, method: pearson)')
+        elif kind == 2:
+            parts.append(f'execute(action_{i}: notify, target: "clinician", priority >= {rng.randrange(5)})')
+        elif kind == 3:
+            parts.append(f'.aje {{ narrative: "session {i}", @semantic[weight: 0.{rng.randrange(100)}] }}')
+        else:
+            parts.append(f'.ire ( rule_{i}: "threshold", value: {rng.randrange(1000)} ) // legacy rule')
+    return '\n\n'.join(parts) + '\n'
+
+
+# Cases
+
+def corpus_stats(corpus: str) -> Dict[str, int]:
+    """The counts write_corpus recorded next to the corpus"""
+    with open(f'{corpus}.json', 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _cold(corpus: str) -> Callable[[], None]:
+    def reset():
+        shutil.rmtree(os.path.join(corpus, CACHE_DIR), ignore_errors=True)
+    return reset
+
+
+def _quiet(run: Callable[[], Any]) -> Callable[[], Any]:
+    def quiet():
+        with open(os.devnull, 'w') as sink, contextlib.redirect_stdout(sink):
+            return run()
+    return quiet
+
+
+@case('links', 'links', 'Link checker over the synthetic corpus, index built from scratch')
+def _links_cold(corpus: str, root: str):
+    validate = _load_script(os.path.join(SCRIPTS_DIR, 'validate-docs.py'), 'validate_docs')
+    stats = corpus_stats(corpus)
+    check = _quiet(lambda: validate.validate_documentation_links(corpus))
+    return _cold(corpus), lambda: (check(), stats['links'])[1]
+
+
+@case('links-warm', 'links', 'Link checker with an up-to-date index (the local `make links` path)')
+def _links_warm(corpus: str, root: str):
+    validate = _load_script(os.path.join(SCRIPTS_DIR, 'validate-docs.py'), 'validate_docs')
+    stats = corpus_stats(corpus)
+    check = _quiet(lambda: validate.validate_documentation_links(corpus))
+    check()
+    return (lambda: None), lambda: (check(), stats['links'])[1]
+
+
+@case('verifier', 'documents', 'Content verifier over the synthetic corpus, caches cleared')
+def _verifier(corpus: str, root: str):
+    verifier = _load_script(os.path.join(SCRIPTS_DIR, 'ai-content-verifier.py'), 'ai_content_verifier')
+    return _cold(corpus), lambda: verifier.AIContentVerifier(corpus).verify_all_documents()['documents_verified']
+
+
+@case('ee-tokenize', 'tokens', f'.ee tokenizer over a {EE_STATEMENTS}-statement program')
+def _ee_tokenize(corpus: str, root: str):
+    from ee_parser import EELanguageParser
+    code = ee_program()
+    parser = EELanguageParser()
+    return (lambda: None), lambda: len(parser._tokenize(code))
+
+
+@case('ee-tokenize-mb', 'bytes', f'.ee tokenizer over a {EE_LARGE_STATEMENTS}-statement (multi-MB) program')
+def _ee_tokenize_large(corpus: str, root: str):
+    from ee_parser import EELanguageParser
+    code = ee_program(EE_LARGE_STATEMENTS)
+    parser = EELanguageParser()
+    return (lambda: None), lambda: (parser._tokenize(code), len(code))[1]
+
+
+def _legacy_ee_tokenize(code: str) -> List[Dict[str, Any]]:
+    """The tokenizer before the master pattern: every pattern tried in turn at every position"""
+    from ee_parser import TOKEN_PATTERNS
+    tokens = []
+    position = 0
+    while position < len(code):
+        for pattern, token_type in TOKEN_PATTERNS:
+            match = re.compile(pattern).match(code, position)
+            if match:
+                tokens.append({
+                    'type': token_type,
+                    'value': match.group(0),
+                    'position': position,
+                    'length': len(match.group(0))
+                })
+                position = match.end()
+                break
+        else:
+            position += 1
+    return tokens
+
+
+@case('ee-tokenize-legacy', 'bytes', f'Original per-position .ee tokenizer over the {EE_STATEMENTS}-statement program')
+def _ee_tokenize_legacy(corpus: str, root: str):
+    code = ee_program()
+    return (lambda: None), lambda: (_legacy_ee_tokenize(code), len(code))[1]
+
+
+@case('ee-parse', 'statements', f'.ee tokenize + parse + validate of a {EE_STATEMENTS}-statement program')
+def _ee_parse(corpus: str, root: str):
+    from ee_parser import EELanguageParser
+    code = ee_program()
+
+    def run():
+        parser = EELanguageParser()
+        ast = parser.parse(code)
+        parser.validate(ast)
+        return len(ast.children)
+    return (lambda: None), run
+
+
+async def _a2a_exchange(agents: List[str], messages: int) -> int:
+    """Every agent sends to every other in turn over bounded per-agent queues"""
+    queues = {agent: asyncio.Queue(maxsize=A2A_QUEUE_SIZE) for agent in agents}
+
+    async def consume(agent: str) -> int:
+        received = 0
+        while True:
+            raw = await queues[agent].get()
+            if raw is None:
+                return received
+            json.loads(raw)
+            received += 1
+
+    async def produce(source: str, count: int) -> None:
+        targets = [agent for agent in agents if agent != source]
+        for i in range(count):
+            payload = {
+                'task_id': f'{source}-{i}',
+                'source_agent': source,
+                'description': 'Benchmark coordination task',
+                'deliverables': ['implementation_plan'],
+                'priority': 'high',
+                'coordination_type': 'eulerian_flow',
+                'reversible': True,
+            }
+            await queues[targets[i % len(targets)]].put(json.dumps(payload))
+
+    consumers = [asyncio.ensure_future(consume(agent)) for agent in agents]
+    await asyncio.gather(*(produce(agent, messages // len(agents)) for agent in agents))
+    for queue in queues.values():
+        await queue.put(None)
+    return sum(await asyncio.gather(*consumers))
+
+
+@case('ee-reparse', 'edits', f'.ee incremental reparse: keystrokes mid-way through a {EE_EDIT_STATEMENTS}-statement program')
+def _ee_reparse(corpus: str, root: str):
+    from ee_parser import EELanguageParser
+    code = ee_program(EE_EDIT_STATEMENTS)
+    parser = EELanguageParser()
+    ast = parser.parse(code)
+    # Inside the identifier of a statement half-way through
+    position = code.index('symptom_', len(code) // 2) + len('symptom_')
+
+    def run():
+        # Type a character and delete it again, so every repeat edits the same text
+        for _ in range(EE_EDITS // 2):
+            parser.reparse(ast, (position, position), 'x')
+            parser.reparse(ast, (position, position + 1), '')
+        return EE_EDITS
+    return (lambda: None), run
+
+
+@case('ee-stream', 'statements', f'.ee statements streamed from a {EE_LARGE_STATEMENTS}-statement file')
+def _ee_stream(corpus: str, root: str):
+    from ee_parser import EELanguageParser
+    # Next to the corpus, like its stats, so the documentation cases never see it
+    path = f'{corpus}.ee'
+    if not os.path.exists(path):
+        atomic_write(path, ee_program(EE_LARGE_STATEMENTS))
+
+    def run():
+        parser = EELanguageParser()
+        with open(path, 'rb') as f:
+            return sum(1 for _ in parser.iter_statements(f))
+    return (lambda: None), run
+
+
+@case('a2a-messages', 'messages', f'{A2A_MESSAGES} JSON messages across {len(A2A_AGENTS)} agent queues')
+def _a2a_messages(corpus: str, root: str):
+    return (lambda: None), lambda: asyncio.run(_a2a_exchange(A2A_AGENTS, A2A_MESSAGES))
+
+
+@case('a2a-init', 'runs', 'Full VoitherA2AInitializer.initialize_a2a_system() run')
+def _a2a_init(corpus: str, root: str):
+    module = _load_script(os.path.join(root, A2A_SCRIPT), 'initialize_agent_a2a')
+    logging.disable(logging.CRITICAL)
+    # The initializer writes its report to the working directory
+    os.chdir(corpus)
+
+    def run():
+        asyncio.run(module.VoitherA2AInitializer(['claude', 'openai', 'copilot_medical']).initialize_a2a_system())
+        return 1
+    return (lambda: None), run
+
+
+# Running
+
+def run_case(name: str, corpus: str, root: str, repeats: int) -> Dict[str, Any]:
+    """Time one case in this process (called in the child)"""
+    bench_case = CASES[name]
+    reset, run = bench_case.load(corpus, root)
+    reset()
+    run()  # warm-up: imports, regex caches, first-touch allocations
+
+    timings, units = [], 0
+    for _ in range(repeats):
+        reset()
+        started = time.perf_counter()
+        units = run()
+        timings.append(time.perf_counter() - started)
+
+    wall = statistics.median(timings)
+    return {
+        'unit': bench_case.unit,
+        'units': units,
+        'repeats': repeats,
+        'wall_s': round(wall, 6),
+        'wall_min_s': round(min(timings), 6),
+        'throughput': round(units / wall, 2) if wall else 0.0,
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+    }
+
+
+def run_in_child(name: str, corpus: str, root: str, repeats: int) -> Dict[str, Any]:
+    command = [sys.executable, os.path.abspath(__file__), root,
+               '--child', name, '--corpus', corpus, '--repeats', str(repeats)]
+    result = subprocess.run(command, capture_output=True, text=True)
+    if result.returncode != 0:
+        error = (result.stderr.strip().splitlines() or ['no output'])[-1]
+        return {'error': error}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[Tuple[str, str, float]]:
+    """(metric, message, relative change) for every metric past the threshold"""
+    regressions = []
+    for metric, higher_is_better, floor_metric, floor in METRICS:
+        new, old = current.get(metric), baseline.get(metric)
+        if not new or not old:
+            continue
+        change = (new - old) / old
+        worse = -change if higher_is_better else change
+        moved = abs(current.get(floor_metric, 0) - baseline.get(floor_metric, 0))
+        if worse > threshold and moved > floor:
+            regressions.append((metric, f"{old:g} → {new:g}", change))
+    return regressions
+
+
+def load_baseline(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return baseline if baseline.get('version') == BENCH_VERSION else None
+
+
+def save_baseline(path: str, results: Dict[str, Dict[str, Any]], previous: Optional[Dict[str, Any]]) -> None:
+    cases = dict(previous.get('cases', {})) if previous else {}
+    cases.update((name, result) for name, result in results.items() if 'error' not in result)
+    baseline = {
+        'version': BENCH_VERSION,
+        'recorded': datetime.now().isoformat(timespec='seconds'),
+        'machine': machine_info(),
+        'cases': dict(sorted(cases.items())),
+    }
+    atomic_write(path, json.dumps(baseline, indent=2) + '\n')
+
+
+def _format(result: Dict[str, Any]) -> str:
+    return (f"{result['wall_s'] * 1000:>9.1f} ms  {result['throughput']:>12,.0f} {result['unit']}/s  "
+            f"{result['peak_rss_mb']:>7.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the VOITHER benchmarks and gate on regressions')
+    parser.add_argument('directory', nargs='?', default='.',
+                        help='Repository root (default: current directory)')
+    parser.add_argument('--case', action='append', default=[], dest='cases', choices=sorted(CASES),
+                        help='Run only this case (repeatable)')
+    parser.add_argument('--repeats', type=int, help='Timed repeats per case (default from docs-config.yml)')
+    parser.add_argument('--threshold', type=float,
+                        help='Allowed relative regression, e.g. 0.2 for 20%% (default from docs-config.yml)')
+    parser.add_argument('--baseline', help=f'Baseline file (default: {BASELINE_DIR}/<machine>.json)')
+    parser.add_argument('--update', action='store_true', help='Record the results as the new baseline')
+    parser.add_argument('--json', action='store_true', help='Print the results as JSON')
+    parser.add_argument('--list', action='store_true', help='List the cases and exit')
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    parser.add_argument('--corpus', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    root = os.path.abspath(args.directory)
+    settings = load_settings(root)
+    repeats = args.repeats or settings['repeats']
+
+    if args.child:
+        print(json.dumps(run_case(args.child, args.corpus, root, repeats)))
+        return 0
+
+    if args.list:
+        for bench_case in CASES.values():
+            print(f"  {bench_case.name:<18} {bench_case.description}")
+        return 0
+
+    threshold = settings['threshold'] if args.threshold is None else args.threshold
+    baseline_path = args.baseline or os.path.join(root, BASELINE_DIR, f"{machine_id()}.json")
+    baseline = load_baseline(baseline_path)
+    names = args.cases or list(CASES)
+
+    if not args.json:
+        print(f"🏎️  Running {len(names)} benchmarks ({repeats} repeats each) on {machine_id()}")
+    results: Dict[str, Dict[str, Any]] = {}
+    workdir = tempfile.mkdtemp(prefix='voither-bench-')
+    corpus = os.path.join(workdir, 'corpus')
+    try:
+        atomic_write(f'{corpus}.json', json.dumps(write_corpus(corpus)))
+        for name in names:
+            results[name] = result = run_in_child(name, corpus, root, repeats)
+            if args.json:
+                continue
+            if 'error' in result:
+                print(f"  ❌ {name:<18} failed: {result['error']}")
+            else:
+                print(f"  ⏱️  {name:<18}{_format(result)}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    failed = [name for name, result in results.items() if 'error' in result]
+    regressions: Dict[str, List[Tuple[str, str, float]]] = {}
+    if baseline and not args.update:
+        for name, result in results.items():
+            previous = baseline['cases'].get(name)
+            if previous and 'error' not in result:
+                found = compare(result, previous, threshold)
+                if found:
+                    regressions[name] = found
+
+    if args.json:
+        print(json.dumps({'machine': machine_info(), 'threshold': threshold, 'cases': results,
+                          'regressions': {name: [{'metric': m, 'change': round(c, 4)} for m, _, c in found]
+                                          for name, found in regressions.items()}}, indent=2))
+    elif baseline and not args.update:
+        if baseline['machine'].get('python') != platform.python_version():
+            print(f"⚠️  Baseline was recorded with Python {baseline['machine'].get('python')}")
+        if regressions:
+            print(f"\n💥 Regressions beyond {threshold:.0%} against {os.path.relpath(baseline_path, root)}:")
+            for name, found in regressions.items():
+                for metric, detail, change in found:
+                    print(f"  ❌ {name}: {metric} {detail} ({change:+.0%})")
+        else:
+            print(f"\n✅ No regressions beyond {threshold:.0%} against {os.path.relpath(baseline_path, root)}")
+
+    if args.update or baseline is None:
+        save_baseline(baseline_path, results, baseline if args.update else None)
+        if not args.json:
+            print(f"\n📝 Baseline recorded: {os.path.relpath(baseline_path, root)}")
+
+    return 1 if regressions or failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+"""
+VOITHER Bibliography Index
+Local citation resolver backed by the BibTeX / CSL-JSON files in the repository
+
+Features:
+- BibTeX (.bib) and CSL-JSON (.csl.json) parsing without network access
+- O(1) exact lookup keyed by normalized author surname + year
+- Fuzzy fallback over author and title trigrams for misspelled citations
+- Citation extraction for "(Author, 2023)" and "Author et al., 2021" styles
+"""
+
+import os
+import re
+import sys
+import json
+import unicodedata
+import argparse
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Set, Tuple
+import logging
+
+from blob_map import BlobMap
+from docs_index import DocumentIndex
+from docs_rules import get_engine
+
+logger = logging.getLogger(__name__)
+
+BIBLIOGRAPHY_SUFFIXES = ('.bib', '.csl.json')
+
+# "(Silva, 2023)", "(Silva et al., 2021; Costa & Lima, 2019a)"
+PARENTHETICAL_CITATION = re.compile(r'\(([^()]*?,\s*\d{4}[a-z]?(?:\s*;[^()]*?,\s*\d{4}[a-z]?)*)\)')
+# "Silva et al., 2021" / "Silva et al. 2021" outside parentheses
+NARRATIVE_CITATION = re.compile(r'([A-ZÀ-Ý][\w\'\-]+)\s+et al\.,?\s*(\d{4})[a-z]?')
+CITATION_PART = re.compile(r'^\s*(?P<names>.+?),?\s+(?P<year>\d{4})[a-z]?\s*$')
+
+FUZZY_THRESHOLD = 0.5
+
+
+def normalize_token(text: str) -> str:
+    """Lowercase, strip accents and drop everything but letters and digits"""
+    folded = unicodedata.normalize('NFKD', text)
+    folded = ''.join(c for c in folded if not unicodedata.combining(c))
+    return re.sub(r'[^a-z0-9]+', '', folded.lower())
+
+
+def trigrams(text: str) -> Set[str]:
+    """Character trigrams of a normalized string, padded so short names still match"""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+@dataclass(frozen=True)
+class BibEntry:
+    """A single bibliography record"""
+    key: str
+    authors: Tuple[str, ...]  # normalized surnames, in citation order
+    year: str
+    title: str
+    source: str
+
+
+@dataclass(frozen=True)
+class Citation:
+    """An in-text citation found in a document"""
+    text: str
+    surname: str
+    year: str
+    line: int
+
+
+def _bibtex_surnames(author_field: str) -> Tuple[str, ...]:
+    surnames = []
+    for person in re.split(r'\s+and\s+', author_field):
+        person = person.strip().strip('{}')
+        if not person:
+            continue
+        if ',' in person:
+            surname = person.split(',', 1)[0]
+        else:
+            surname = person.split()[-1]
+        normalized = normalize_token(surname)
+        if normalized:
+            surnames.append(normalized)
+    return tuple(surnames)
+
+
+def _bibtex_fields(body: str) -> Dict[str, str]:
+    """Parse the `field = value` list of a BibTeX entry body"""
+    fields = {}
+    position = 0
+    field_start = re.compile(r'\s*,?\s*([A-Za-z_\-]+)\s*=\s*')
+
+    while position < len(body):
+        match = field_start.match(body, position)
+        if not match:
+            break
+        name = match.group(1).lower()
+        position = match.end()
+        if position >= len(body):
+            break
+
+        opener = body[position]
+        if opener == '{':
+            depth = 0
+            end = position
+            while end < len(body):
+                if body[end] == '{':
+                    depth += 1
+                elif body[end] == '}':
+                    depth -= 1
+                    if depth == 0:
+                        break
+                end += 1
+            value = body[position + 1:end]
+            position = end + 1
+        elif opener == '"':
+            end = body.find('"', position + 1)
+            end = len(body) if end == -1 else end
+            value = body[position + 1:end]
+            position = end + 1
+        else:
+            end = body.find(',', position)
+            end = len(body) if end == -1 else end
+            value = body[position:end]
+            position = end
+
+        fields[name] = re.sub(r'[{}]', '', ' '.join(value.split()))
+
+    return fields
+
+
+def parse_bibtex(text: str, source: str = '') -> List[BibEntry]:
+    """Parse BibTeX text into entries; @string/@comment/@preamble are ignored"""
+    entries = []
+    for match in re.finditer(r'@(\w+)\s*\{', text):
+        entry_type = match.group(1).lower()
+        if entry_type in ('string', 'comment', 'preamble'):
+            continue
+
+        # Find the matching closing brace of the entry
+        depth = 1
+        end = match.end()
+        while end < len(text) and depth:
+            if text[end] == '{':
+                depth += 1
+            elif text[end] == '}':
+                depth -= 1
+            end += 1
+        body = text[match.end():end - 1]
+
+        key, _, field_text = body.partition(',')
+        fields = _bibtex_fields(field_text)
+        year_match = re.search(r'\d{4}', fields.get('year', fields.get('date', '')))
+
+        entries.append(BibEntry(
+            key=key.strip(),
+            authors=_bibtex_surnames(fields.get('author', fields.get('editor', ''))),
+            year=year_match.group(0) if year_match else '',
+            title=fields.get('title', ''),
+            source=source
+        ))
+
+    return entries
+
+
+def parse_csl_json(data: Any, source: str = '') -> List[BibEntry]:
+    """Parse CSL-JSON (a list of items, or a single item) into entries"""
+    items = data if isinstance(data, list) else [data]
+    entries = []
+
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+
+        surnames = []
+        for person in item.get('author', []) or item.get('editor', []):
+            name = person.get('family') or person.get('literal') or ''
+            if not person.get('family') and name:
+                name = name.split()[-1]
+            normalized = normalize_token(name)
+            if normalized:
+                surnames.append(normalized)
+
+        year = ''
+        date_parts = (item.get('issued') or {}).get('date-parts') or []
+        if date_parts and date_parts[0]:
+            year = str(date_parts[0][0])
+        elif (item.get('issued') or {}).get('raw'):
+            year_match = re.search(r'\d{4}', item['issued']['raw'])
+            year = year_match.group(0) if year_match else ''
+
+        entries.append(BibEntry(
+            key=str(item.get('id', '')),
+            authors=tuple(surnames),
+            year=year,
+            title=item.get('title', ''),
+            source=source
+        ))
+
+    return entries
+
+
+def extract_citations(content: str) -> List[Citation]:
+    """Extract author/year citations from markdown content"""
+    line_starts = [0] + [m.end() for m in re.finditer('\n', content)]
+
+    def line_of(offset: int) -> int:
+        # Binary search over line starts instead of counting newlines per hit
+        low, high = 0, len(line_starts) - 1
+        while low < high:
+            mid = (low + high + 1) // 2
+            if line_starts[mid] <= offset:
+                low = mid
+            else:
+                high = mid - 1
+        return low + 1
+
+    citations = []
+    covered = []
+
+    for match in PARENTHETICAL_CITATION.finditer(content):
+        covered.append((match.start(), match.end()))
+        line = line_of(match.start())
+        for part in match.group(1).split(';'):
+            part_match = CITATION_PART.match(part)
+            if not part_match:
+                continue
+            names = re.sub(r'\bet al\.?', '', part_match.group('names')).strip(' ,')
+            words = re.findall(r'[^\W\d_][\w\'\-]*', names)
+            if not words:
+                continue
+            citations.append(Citation(
+                text=part.strip(),
+                surname=names,
+                year=part_match.group('year'),
+                line=line
+            ))
+
+    for match in NARRATIVE_CITATION.finditer(content):
+        if any(start <= match.start() < end for start, end in covered):
+            continue
+        citations.append(Citation(
+            text=match.group(0),
+            surname=match.group(1),
+            year=match.group(2),
+            line=line_of(match.start())
+        ))
+
+    return citations
+
+
+class BibliographyIndex:
+    """
+    In-memory citation index built from local bibliography files
+
+    Lookups:
+    - exact: (normalized surname, year) -> entries, one dict probe
+    - fuzzy: author-surname trigrams restricted to the cited year
+    - title: title trigrams for citations that name a work instead of an author
+    """
+
+    def __init__(self, entries: Optional[List[BibEntry]] = None):
+        self.entries: List[BibEntry] = []
+        self._by_author_year: Dict[Tuple[str, str], List[int]] = {}
+        self._surname_trigrams: Dict[str, Set[str]] = {}
+        self._surnames_by_year: Dict[str, Dict[str, Set[str]]] = {}
+        self._title_trigrams: Dict[str, Set[int]] = {}
+        self._title_grams: Dict[int, Set[str]] = {}
+        self._resolved: Dict[Tuple[str, str], Optional[BibEntry]] = {}
+
+        for entry in entries or []:
+            self.add(entry)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add(self, entry: BibEntry) -> None:
+        """Register an entry under every author surname and its title trigrams"""
+        entry_id = len(self.entries)
+        self.entries.append(entry)
+        self._resolved.clear()
+
+        for surname in entry.authors:
+            self._by_author_year.setdefault((surname, entry.year), []).append(entry_id)
+            grams = self._surname_trigrams.setdefault(surname, trigrams(surname))
+            self._surnames_by_year.setdefault(entry.year, {})[surname] = grams
+
+        title = normalize_token(entry.title)
+        if title:
+            grams = trigrams(title)
+            self._title_grams[entry_id] = grams
+            for gram in grams:
+                self._title_trigrams.setdefault(gram, set()).add(entry_id)
+
+    @classmethod
+    def from_directory(cls, directory: str) -> 'BibliographyIndex':
+        """Build the index from every .bib / .csl.json file under directory"""
+        documents = DocumentIndex.open(directory)
+        try:
+            matcher = get_engine(directory).matcher
+            paths = [
+                path for path, _, _ in documents.blobs(('.bib', '.json'))
+                if path.endswith(BIBLIOGRAPHY_SUFFIXES) and not matcher.in_excluded_dir(path)
+            ]
+            groups = BlobMap.from_index(documents, ('.bib', '.json')).distinct(paths)
+        finally:
+            documents.close()
+
+        index = cls()
+        # Identical bibliography files (e.g. copies in several folders) are parsed once
+        for source, *_ in groups.values():
+            path = os.path.join(directory, source)
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    text = f.read()
+                if source.endswith('.bib'):
+                    entries = parse_bibtex(text, source)
+                else:
+                    entries = parse_csl_json(json.loads(text), source)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not load bibliography {path}: {e}")
+                continue
+
+            for entry in entries:
+                index.add(entry)
+
+        logger.info(f"Bibliography index loaded: {len(index)} entries")
+        return index
+
+    def resolve(self, names: str, year: str) -> Optional[BibEntry]:
+        """Resolve the name part and year of a citation to a bibliography entry"""
+        cache_key = (names, year)
+        if cache_key in self._resolved:
+            return self._resolved[cache_key]
+
+        entry = self._resolve_uncached(names, year)
+        self._resolved[cache_key] = entry
+        return entry
+
+    def resolve_citation(self, citation: Citation) -> Optional[BibEntry]:
+        return self.resolve(citation.surname, citation.year)
+
+    def _resolve_uncached(self, names: str, year: str) -> Optional[BibEntry]:
+        words = re.findall(r'[^\W\d_][\w\'\-]*', names)
+        candidates = [normalize_token(w) for w in words if w[:1].isupper()] or \
+                     [normalize_token(w) for w in words]
+
+        # Exact: first capitalised word is the lead author's surname
+        for surname in candidates[:1]:
+            hits = self._by_author_year.get((surname, year))
+            if hits:
+                return self.entries[hits[0]]
+
+        # Fuzzy: nearest surname published in the same year
+        year_surnames = self._surnames_by_year.get(year, {})
+        if candidates and year_surnames:
+            cited = trigrams(candidates[0])
+            best, best_score = None, FUZZY_THRESHOLD
+            for surname, grams in year_surnames.items():
+                score = jaccard(cited, grams)
+                if score >= best_score:
+                    best, best_score = surname, score
+            if best is not None:
+                return self.entries[self._by_author_year[(best, year)][0]]
+
+        # Title: the citation names a work ("(Matter and Memory, 1896)")
+        title = normalize_token(names)
+        if len(title) >= 6:
+            cited = trigrams(title)
+            scores: Dict[int, int] = {}
+            for gram in cited:
+                for entry_id in self._title_trigrams.get(gram, ()):
+                    scores[entry_id] = scores.get(entry_id, 0) + 1
+            best_id, best_score = None, FUZZY_THRESHOLD
+            for entry_id in scores:
+                if self.entries[entry_id].year != year:
+                    continue
+                score = jaccard(cited, self._title_grams[entry_id])
+                if score >= best_score:
+                    best_id, best_score = entry_id, score
+            if best_id is not None:
+                return self.entries[best_id]
+
+        return None
+
+    def verify(self, content: str) -> Dict[str, Any]:
+        """Resolve every citation in content; returns resolved/unresolved summary"""
+        citations = extract_citations(content)
+        unresolved = [c for c in citations if self.resolve_citation(c) is None]
+        return {
+            "citations_found": len(citations),
+            "citations_resolved": len(citations) - len(unresolved),
+            "unresolved": [{"citation": c.text, "line": c.line} for c in unresolved]
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Resolve documentation citations against the local bibliography')
+    parser.add_argument('directory', nargs='?', default='.',
+                        help='Directory to check (default: current directory)')
+    args = parser.parse_args()
+
+    directory = os.path.abspath(args.directory)
+    index = BibliographyIndex.from_directory(directory)
+
+    print(f"📚 Bibliography entries: {len(index)}")
+    if not len(index):
+        print("⚠️  No .bib or .csl.json files found - nothing to resolve against")
+        return 0
+
+    documents = DocumentIndex.open(directory)
+    try:
+        matcher = get_engine(directory).matcher
+        paths = [record.path for record in documents.markdown() if matcher.matches(record.path)]
+        groups = BlobMap.from_index(documents, ('.md',)).distinct(paths)
+    finally:
+        documents.close()
+
+    total = resolved = 0
+    for paths in groups.values():
+        with open(os.path.join(directory, paths[0]), 'r', encoding='utf-8') as f:
+            result = index.verify(f.read())
+        total += result["citations_found"] * len(paths)
+        resolved += result["citations_resolved"] * len(paths)
+        for rel_path in paths:
+            for item in result["unresolved"]:
+                print(f"  ❌ {rel_path}:{item['line']} - {item['citation']}")
+
+    print(f"🔗 Citations: {total} found, {resolved} resolved, {total - resolved} unresolved")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
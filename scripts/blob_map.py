@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+VOITHER Blob Map
+Content-addressed view of the tree: which paths share identical bytes
+
+Features:
+- hash -> paths map built from the shared document index (no file reads)
+- Tools process each distinct blob once and fan results out to every path
+- raw/ mirror divergence reported by comparing hashes, never by re-reading
+  both copies
+"""
+
+import sys
+import argparse
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple, TypeVar
+
+from docs_index import DocumentIndex
+
+# Backup mirror written by the auto-documentation workflow
+MIRROR_DIR = 'raw'
+
+T = TypeVar('T')
+
+
+@dataclass
+class MirrorReport:
+    """How raw/ compares with the canonical tree"""
+    identical: List[str] = field(default_factory=list)    # canonical paths with a byte-identical copy
+    diverged: List[str] = field(default_factory=list)     # canonical paths whose copy differs
+    mirror_only: List[str] = field(default_factory=list)  # mirror paths with no canonical file
+    unmirrored: List[str] = field(default_factory=list)   # canonical paths missing from the mirror
+
+
+class BlobMap:
+    """hash -> paths (and back) for a set of indexed files"""
+
+    def __init__(self, entries: Iterable[Tuple[str, str, int]] = ()):
+        self.by_hash: Dict[str, List[str]] = {}
+        self.by_path: Dict[str, str] = {}
+        self.sizes: Dict[str, int] = {}
+        for path, file_hash, size in entries:
+            self.by_hash.setdefault(file_hash, []).append(path)
+            self.by_path[path] = file_hash
+            self.sizes[file_hash] = size
+
+    @classmethod
+    def from_index(cls, index: DocumentIndex, kinds: Optional[Tuple[str, ...]] = None) -> 'BlobMap':
+        return cls(index.blobs(kinds))
+
+    def __len__(self) -> int:
+        return len(self.by_hash)
+
+    def hash_of(self, path: str) -> Optional[str]:
+        return self.by_path.get(path)
+
+    def paths_for(self, file_hash: str) -> List[str]:
+        return self.by_hash.get(file_hash, [])
+
+    @staticmethod
+    def _preference(path: str) -> Tuple[bool, str]:
+        # Canonical copies are read in preference to the mirror
+        return path.startswith(MIRROR_DIR + '/'), path
+
+    def distinct(self, paths: Iterable[str]) -> Dict[str, List[str]]:
+        """
+        Group paths by content: hash -> the given paths with that content
+
+        The first path of each group is the one to read (canonical before
+        mirror). Paths missing from the map get a group of their own, keyed
+        by the path itself.
+        """
+        groups: Dict[str, List[str]] = {}
+        for path in paths:
+            groups.setdefault(self.by_path.get(path, path), []).append(path)
+        for group in groups.values():
+            group.sort(key=self._preference)
+        return groups
+
+    def fan_out(self, results: Dict[str, T], groups: Dict[str, List[str]]) -> Dict[str, T]:
+        """Per-blob results -> per-path results"""
+        return {path: results[key] for key, paths in groups.items() if key in results for path in paths}
+
+    def duplicates(self) -> Dict[str, List[str]]:
+        """Blobs stored at more than one path"""
+        return {h: sorted(p, key=self._preference) for h, p in self.by_hash.items() if len(p) > 1}
+
+    def redundant_bytes(self) -> int:
+        return sum(self.sizes[h] * (len(p) - 1) for h, p in self.by_hash.items())
+
+    def mirror_report(self, mirror: str = MIRROR_DIR) -> MirrorReport:
+        """Compare mirror/<path> with <path> by hash"""
+        report = MirrorReport()
+        prefix = mirror + '/'
+        mirrored = set()
+        for path, file_hash in self.by_path.items():
+            if not path.startswith(prefix):
+                continue
+            canonical = path[len(prefix):]
+            mirrored.add(canonical)
+            canonical_hash = self.by_path.get(canonical)
+            if canonical_hash is None:
+                report.mirror_only.append(path)
+            elif canonical_hash == file_hash:
+                report.identical.append(canonical)
+            else:
+                report.diverged.append(canonical)
+
+        if mirrored:
+            report.unmirrored = [
+                path for path in self.by_path
+                if not path.startswith(prefix) and path not in mirrored
+            ]
+        for paths in (report.identical, report.diverged, report.mirror_only, report.unmirrored):
+            paths.sort()
+        return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Report duplicate content and raw/ mirror divergence')
+    parser.add_argument('directory', nargs='?', default='.',
+                        help='Documentation root (default: current directory)')
+    parser.add_argument('--verbose', '-v', action='store_true',
+                        help='List duplicate groups and diverged paths')
+    args = parser.parse_args()
+
+    index = DocumentIndex.open(args.directory)
+    try:
+        blobs = BlobMap.from_index(index)
+    finally:
+        index.close()
+
+    duplicates = blobs.duplicates()
+    print(f"🧬 {len(blobs.by_path)} files, {len(blobs)} distinct blobs")
+    print(f"   {len(duplicates)} blobs stored more than once ({blobs.redundant_bytes():,} redundant bytes)")
+
+    report = blobs.mirror_report()
+    if report.identical or report.diverged or report.mirror_only:
+        print(f"\n🪞 {MIRROR_DIR}/ mirror: {len(report.identical)} identical, {len(report.diverged)} diverged, "
+              f"{len(report.mirror_only)} only in mirror, {len(report.unmirrored)} not mirrored")
+
+    if args.verbose:
+        for paths in duplicates.values():
+            others = ', '.join(paths[1:4]) + (f", ... ({len(paths) - 4} more)" if len(paths) > 4 else '')
+            print(f"  = {paths[0]}  ←  {others}")
+        for path in report.diverged:
+            print(f"  ≠ {path}")
+        for path in report.mirror_only:
+            print(f"  - {path}")
+        for path in report.unmirrored:
+            print(f"  + {path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
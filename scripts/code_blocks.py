@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+VOITHER Code Block Validator
+Extracts fenced code blocks from documentation and checks that they still parse
+
+Features:
+- Fenced block extraction (``` and ~~~) with language tag and line number
+- Python via ast, YAML/JSON via their parsers, .ee via the EE parser,
+  mermaid via the built-in diagram checker
+- Process pool for large corpora
+- Results cached by block hash so unchanged snippets are never re-checked
+- Byte-identical documents (e.g. the raw/ mirror) are read once per content
+"""
+
+import os
+import re
+import sys
+import ast
+import json
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Iterable, Optional, Tuple
+
+import yaml
+
+from blob_map import BlobMap
+from docs_cache import ResultCache, content_hash
+from docs_index import DocumentIndex
+from docs_rules import get_engine
+from ee_parser import EELanguageParser, check_delimiters
+from mermaid_check import validate_mermaid
+
+# Bump when a validator changes so cached results are discarded
+VALIDATOR_VERSION = 2
+
+# Below this many unchecked blocks the pool start-up costs more than it saves
+POOL_THRESHOLD = 64
+
+DOCUMENT_SUFFIXES = ('.md', '.ee')
+
+FENCE_OPEN = re.compile(r'^ {0,3}(?P<fence>`{3,}|~{3,})[ \t]*(?P<info>[^`\n]*?)[ \t]*$')
+
+
+@dataclass(frozen=True)
+class CodeBlock:
+    """A fenced code block inside a document"""
+    language: str
+    code: str
+    line: int  # line of the opening fence, 1-based
+    terminated: bool = True
+
+    @property
+    def hash(self) -> str:
+        return content_hash(f"{self.language}\0{self.code}")
+
+
+def extract_code_blocks(content: str) -> List[CodeBlock]:
+    """Collect every fenced code block with its language tag"""
+    blocks = []
+    lines = content.split('\n')
+    index = 0
+
+    while index < len(lines):
+        match = FENCE_OPEN.match(lines[index])
+        if not match:
+            index += 1
+            continue
+
+        fence = match.group('fence')
+        language = match.group('info').split()[0].lower() if match.group('info') else ''
+        closing = re.compile(rf'^ {{0,3}}{re.escape(fence[0])}{{{len(fence)},}}[ \t]*$')
+        start = index
+
+        index += 1
+        body = []
+        while index < len(lines) and not closing.match(lines[index]):
+            body.append(lines[index])
+            index += 1
+
+        blocks.append(CodeBlock(
+            language=language,
+            code='\n'.join(body),
+            line=start + 1,
+            terminated=index < len(lines)
+        ))
+        index += 1
+
+    return blocks
+
+
+def _validate_python(code: str) -> List[str]:
+    try:
+        # Same as ast.parse, but notebook-style top-level await is accepted
+        compile(code, '<code block>', 'exec', ast.PyCF_ONLY_AST | ast.PyCF_ALLOW_TOP_LEVEL_AWAIT)
+    except SyntaxError as e:
+        return [f"line {e.lineno}: {e.msg}"]
+    return []
+
+
+def _validate_yaml(code: str) -> List[str]:
+    try:
+        for _ in yaml.safe_load_all(code):
+            pass
+    except yaml.YAMLError as e:
+        mark = getattr(e, 'problem_mark', None)
+        problem = getattr(e, 'problem', None) or str(e).split('\n')[0]
+        return [f"line {mark.line + 1}: {problem}" if mark else problem]
+    return []
+
+
+def _validate_json(code: str) -> List[str]:
+    try:
+        json.loads(code)
+    except json.JSONDecodeError as e:
+        return [f"line {e.lineno}: {e.msg}"]
+    return []
+
+
+def _validate_ee(code: str) -> List[str]:
+    parser = EELanguageParser()
+    result = parser.validate(parser.parse(code))
+    return check_delimiters(code) + result["errors"]
+
+
+VALIDATORS: Dict[str, Callable[[str], List[str]]] = {
+    'python': _validate_python,
+    'yaml': _validate_yaml,
+    'json': _validate_json,
+    'ee': _validate_ee,
+    'mermaid': validate_mermaid,
+}
+
+LANGUAGE_ALIASES = {
+    'py': 'python',
+    'python3': 'python',
+    'yml': 'yaml',
+}
+
+
+def register_validator(language: str, validator: Callable[[str], List[str]]) -> None:
+    """Register a validator for another fenced-block language"""
+    VALIDATORS[language] = validator
+
+
+def canonical_language(language: str) -> str:
+    return LANGUAGE_ALIASES.get(language, language)
+
+
+def validate_block(language: str, code: str) -> List[str]:
+    """Run the validator for a language; unknown languages always pass"""
+    validator = VALIDATORS.get(canonical_language(language))
+    if validator is None:
+        return []
+    try:
+        return validator(code)
+    except Exception as e:
+        return [f"validator error: {e}"]
+
+
+def _validate_job(job: Tuple[str, str, str]) -> Tuple[str, List[str]]:
+    block_hash, language, code = job
+    return block_hash, validate_block(language, code)
+
+
+class CodeBlockValidator:
+    """Validates code blocks through a hash-keyed cache and a worker pool"""
+
+    def __init__(self, cache: Optional[ResultCache] = None, workers: Optional[int] = None):
+        self.cache = cache
+        self.workers = workers
+        self.results: Dict[str, List[str]] = {}
+
+    def _lookup(self, block_hash: str) -> Optional[List[str]]:
+        if block_hash in self.results:
+            return self.results[block_hash]
+        if self.cache is not None and block_hash in self.cache:
+            self.results[block_hash] = self.cache.get(block_hash)
+            return self.results[block_hash]
+        return None
+
+    def validate(self, blocks: Iterable[CodeBlock]) -> Dict[str, List[str]]:
+        """Validate blocks, checking each distinct unchecked snippet once"""
+        pending = {}
+        for block in blocks:
+            if canonical_language(block.language) not in VALIDATORS:
+                continue
+            block_hash = block.hash
+            if block_hash not in pending and self._lookup(block_hash) is None:
+                pending[block_hash] = (block_hash, block.language, block.code)
+
+        jobs = list(pending.values())
+        if len(jobs) >= POOL_THRESHOLD and self.workers != 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                checked = list(pool.map(_validate_job, jobs, chunksize=16))
+        else:
+            checked = [_validate_job(job) for job in jobs]
+
+        for block_hash, errors in checked:
+            self.results[block_hash] = errors
+            if self.cache is not None:
+                self.cache.put(block_hash, errors)
+
+        return self.results
+
+    def errors_for(self, block: CodeBlock) -> List[str]:
+        """Errors for one block, validating it if it has not been seen yet"""
+        errors = [] if block.terminated else ["unterminated code fence"]
+        if canonical_language(block.language) not in VALIDATORS:
+            return errors
+        cached = self._lookup(block.hash)
+        if cached is None:
+            self.validate([block])
+            cached = self.results[block.hash]
+        return errors + cached
+
+    def validate_files(self, paths: Iterable[str]) -> None:
+        """Pre-validate all blocks of many files in one pooled batch"""
+        blocks = []
+        for path in paths:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    blocks.extend(extract_code_blocks(f.read()))
+            except (OSError, UnicodeDecodeError):
+                continue
+        self.validate(blocks)
+
+    def save(self) -> None:
+        if self.cache is not None:
+            self.cache.save()
+
+
+def find_documents(index: DocumentIndex) -> List[str]:
+    """Indexed markdown and .ee documents outside the directories docs-config.yml excludes"""
+    matcher = get_engine(index.root).matcher
+    return [
+        record.path for record in index.files(kinds=DOCUMENT_SUFFIXES)
+        if not matcher.in_excluded_dir(record.path)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Validate fenced code blocks in VOITHER documentation')
+    parser.add_argument('directory', nargs='?', default='.',
+                        help='Directory to check (default: current directory)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes (default: CPU count)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Ignore and do not update the block cache')
+    parser.add_argument('--language', action='append', default=None,
+                        help='Only check blocks in this language (repeatable)')
+    args = parser.parse_args()
+    languages = {canonical_language(language) for language in args.language} if args.language else None
+
+    directory = os.path.abspath(args.directory)
+    cache = None if args.no_cache else ResultCache('code_blocks', directory, VALIDATOR_VERSION)
+    validator = CodeBlockValidator(cache, args.workers)
+
+    index = DocumentIndex.open(directory)
+    try:
+        documents = find_documents(index)
+        groups = BlobMap.from_index(index, DOCUMENT_SUFFIXES).distinct(documents)
+    finally:
+        index.close()
+
+    # One read per distinct document; identical copies share the result
+    blocks_by_blob = {}
+    for key, paths in groups.items():
+        try:
+            with open(os.path.join(directory, paths[0]), 'r', encoding='utf-8') as f:
+                blocks = extract_code_blocks(f.read())
+        except (OSError, UnicodeDecodeError):
+            continue
+        if languages is not None:
+            blocks = [block for block in blocks if canonical_language(block.language) in languages]
+        blocks_by_blob[key] = blocks
+    print(f"🧩 Checking code blocks in {len(documents)} documents ({len(groups)} distinct)...")
+    validator.validate(block for blocks in blocks_by_blob.values() for block in blocks)
+
+    total_blocks = broken_blocks = 0
+    for key, paths in groups.items():
+        for block in blocks_by_blob.get(key, []):
+            errors = validator.errors_for(block)
+            total_blocks += len(paths)
+            if errors:
+                broken_blocks += len(paths)
+                for rel_path in paths:
+                    for error in errors:
+                        print(f"  ❌ {rel_path}:{block.line} [{block.language or 'text'}] {error}")
+
+    validator.save()
+
+    print(f"\n📊 Code blocks: {total_blocks} found, {broken_blocks} with errors")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
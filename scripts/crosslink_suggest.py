@@ -0,0 +1,487 @@
+#!/usr/bin/env python3
+"""
+VOITHER Cross-Link Suggestions
+Related documents that do not link to each other, ranked by TF-IDF similarity
+
+Features:
+- A sparse TF-IDF matrix built from the search index postings, so nothing is
+  re-tokenized; near-stopwords are dropped and each document keeps only its
+  strongest terms
+- Top-k cosine neighbours from sparse matrix products computed in row chunks
+  sized to bound memory (scipy.sparse when installed, a pure-Python
+  inverted-index product otherwise)
+- Neighbour lists are persisted under .docs-cache/; later runs recompute only
+  the rows of changed documents and offer them to every other list
+- Pairs already linked in either direction are left out of the suggestions
+"""
+
+import os
+import re
+import sys
+import json
+import math
+import time
+import heapq
+import argparse
+import itertools
+import posixpath
+from array import array
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+from urllib.parse import unquote
+
+from docs_cache import atomic_write, cache_path
+from docs_index import DocumentIndex, MARKDOWN_SUFFIXES
+from docs_search import SearchIndex
+
+try:
+    import numpy as np
+    from scipy import sparse
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+    sparse = None
+
+STATE_FILE = 'crosslinks.json'
+# Bump when the shape of the persisted state changes
+STATE_VERSION = 1
+
+# A term found in a single document cannot make two documents similar, and
+# one found in most of them says nothing about any particular pair
+MIN_DF = 2
+MAX_DF_RATIO = 0.5
+TERM_PATTERN = re.compile(r'[^\W\d_]\w{2,}')
+# The corpus mixes English, Portuguese and code samples; function words rare
+# enough to pass the df cut still make unrelated documents look alike
+STOPWORDS = frozenset('''
+    about after all also and any are because been before being between both but can could
+    does each for from had has have here how into its just more most not now only other our
+    out over should some such than that the their them then there these they this those
+    through under use used using very was were what when where which while who will with
+    would you your
+    aos apos com como das dos ela ele elas eles entre essa esse esta este isso mais mas
+    mesmo muito nao nas nos num numa para pela pelas pelo pelos por qual quando que sao
+    seu sua suas seus sem sob sobre tambem tem uma umas uns
+    class def dict false import int list none return self str true
+'''.split())
+
+# Strongest terms kept per document, and documents kept per term (highest
+# weight first). Together they bound the cost of every row product: past
+# these points only terms too common to tell documents apart are left.
+TERMS_PER_DOC = 32
+MAX_POSTINGS_PER_TERM = 1000
+
+# Neighbours stored per document. Keeping more than are shown lets a list
+# lose entries to changed documents without a recompute.
+NEIGHBORS_KEPT = 20
+REFILL_BELOW = 10
+MIN_SIMILARITY = 0.05
+
+# Upper bound on the multiply-adds (and so the non-zeros) of one chunk product
+MAX_CHUNK_PRODUCTS = 10_000_000
+
+# Every row is recomputed when the corpus size drifts this much from the
+# last full build, since the idf weights of the stored rows have gone stale
+REBUILD_DRIFT = 0.10
+
+# Stored rows computed under other weighting settings are recomputed
+SETTINGS = f'{MIN_DF}:{MAX_DF_RATIO}:{TERMS_PER_DOC}:{MAX_POSTINGS_PER_TERM}:{len(STOPWORDS)}'
+
+FETCH_SIZE = 1 << 16
+EXTERNAL_PREFIXES = ('http://', 'https://', '#', 'mailto:')
+
+
+@dataclass
+class Corpus:
+    """Term counts of the indexed documents, restricted to the useful vocabulary"""
+    paths: List[str]
+    vocab: List[str]
+    df: List[int]
+    # Flat (column, row, tf) triples, grouped by column
+    triples: array = field(default_factory=lambda: array('I'))
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+
+def load_corpus(search: SearchIndex) -> Corpus:
+    """Read the term counts of every document from the search index"""
+    conn = search.conn
+    doc_ids = conn.execute('SELECT id, path FROM docs ORDER BY id').fetchall()
+    row_of = {doc_id: row for row, (doc_id, _) in enumerate(doc_ids)}
+    paths = [path for _, path in doc_ids]
+
+    max_df = max(MIN_DF, int(len(paths) * MAX_DF_RATIO))
+    vocab_rows = [(term_id, term, df) for term_id, term, df in conn.execute(
+        'SELECT id, term, df FROM terms WHERE df BETWEEN ? AND ? ORDER BY id', (MIN_DF, max_df)
+    ) if TERM_PATTERN.fullmatch(term) and term not in STOPWORDS]
+
+    conn.execute('CREATE TEMP TABLE IF NOT EXISTS crosslink_vocab '
+                 '(id INTEGER PRIMARY KEY, col INTEGER NOT NULL)')
+    conn.execute('DELETE FROM crosslink_vocab')
+    conn.executemany('INSERT INTO crosslink_vocab VALUES (?, ?)',
+                     [(term_id, col) for col, (term_id, _, _) in enumerate(vocab_rows)])
+
+    triples = array('I')
+    # CROSS JOIN keeps the vocabulary as the outer loop, so postings are read
+    # as primary-key ranges instead of through the doc_id index
+    cursor = conn.execute('SELECT v.col, p.doc_id, p.tf FROM crosslink_vocab v '
+                          'CROSS JOIN postings p ON p.term_id = v.id')
+    while True:
+        batch = cursor.fetchmany(FETCH_SIZE)
+        if not batch:
+            break
+        triples.extend(itertools.chain.from_iterable((col, row_of[doc_id], tf) for col, doc_id, tf in batch))
+    return Corpus(paths, [term for _, term, _ in vocab_rows], [df for _, _, df in vocab_rows], triples)
+
+
+def idf(df: int, total_docs: int) -> float:
+    return math.log(total_docs / df)
+
+
+def tf_weight(tf: int) -> float:
+    """Sublinear term frequency, so one repeated word cannot dominate a document"""
+    return 1.0 + math.log(tf)
+
+
+class _PythonMatrix:
+    """Row vectors as dicts and their transpose as posting lists"""
+
+    name = 'pure Python'
+
+    def __init__(self, corpus: Corpus):
+        total = len(corpus)
+        weights = [idf(df, total) for df in corpus.df]
+        rows: List[Dict[int, float]] = [{} for _ in range(total)]
+        triples = corpus.triples
+        for start in range(0, len(triples), 3):
+            col, row, tf = triples[start:start + 3]
+            rows[row][col] = tf_weight(tf) * weights[col]
+
+        self.postings: List[List[Tuple[int, float]]] = [[] for _ in corpus.vocab]
+        self.rows: List[Dict[int, float]] = []
+        for row, vector in enumerate(rows):
+            if len(vector) > TERMS_PER_DOC:
+                vector = dict(heapq.nlargest(TERMS_PER_DOC, vector.items(), key=lambda item: item[1]))
+            norm = math.sqrt(sum(w * w for w in vector.values())) or 1.0
+            vector = {col: w / norm for col, w in vector.items()}
+            self.rows.append(vector)
+            for col, weight in vector.items():
+                self.postings[col].append((row, weight))
+        for col, postings in enumerate(self.postings):
+            if len(postings) > MAX_POSTINGS_PER_TERM:
+                self.postings[col] = heapq.nlargest(MAX_POSTINGS_PER_TERM, postings, key=lambda item: item[1])
+
+    def terms(self, row: int) -> Dict[int, float]:
+        return self.rows[row]
+
+    def rank(self, rows: Iterable[int], keep: int, floors: Optional[Sequence[float]] = None
+             ) -> Iterator[Tuple[int, List[Tuple[int, float]], List[Tuple[int, float]]]]:
+        """
+        (row, top neighbours, offers) per row; offers are the other rows whose
+        floor the row's similarity beats (only when floors are given)
+        """
+        for row in rows:
+            scores: Dict[int, float] = defaultdict(float)
+            for col, weight in self.rows[row].items():
+                for other, other_weight in self.postings[col]:
+                    scores[other] += weight * other_weight
+            scores.pop(row, None)
+            candidates = [(other, score) for other, score in scores.items() if score >= MIN_SIMILARITY]
+            top = heapq.nlargest(keep, candidates, key=lambda item: item[1])
+            offers = [(other, score) for other, score in candidates
+                      if score > floors[other]] if floors is not None else []
+            yield row, top, offers
+
+
+def _strongest(groups, members, weights, limit: int):
+    """The `limit` highest-weighted entries of each group, grouped in order"""
+    order = np.lexsort((-weights, groups))
+    groups, members, weights = groups[order], members[order], weights[order]
+    counts = np.bincount(groups)
+    starts = np.cumsum(counts) - counts
+    kept = (np.arange(len(groups)) - starts[groups]) < limit
+    return groups[kept], members[kept], weights[kept]
+
+
+class _SparseMatrix:
+    """CSR matrix; row products run in chunks of bounded size"""
+
+    name = 'scipy.sparse'
+
+    def __init__(self, corpus: Corpus):
+        total = len(corpus)
+        triples = np.frombuffer(corpus.triples, dtype=np.uint32).reshape(-1, 3)
+        cols, rows = triples[:, 0].astype(np.int64), triples[:, 1].astype(np.int64)
+        df = np.asarray(corpus.df, dtype=np.float64)
+        weights = (1.0 + np.log(triples[:, 2])) * np.log(total / df)[cols]
+
+        rows, cols, weights = _strongest(rows, cols, weights, TERMS_PER_DOC)
+        norms = np.sqrt(np.bincount(rows, weights=weights * weights, minlength=total))
+        norms[norms == 0] = 1.0
+        weights /= norms[rows]
+        self.matrix = sparse.csr_matrix((weights, (rows, cols)), shape=(total, len(corpus.vocab)))
+
+        cols, rows, weights = _strongest(cols, rows, weights, MAX_POSTINGS_PER_TERM)
+        self.transposed = sparse.csr_matrix((weights, (cols, rows)), shape=(len(corpus.vocab), total))
+        # Multiply-adds of each row product: the postings of all its terms
+        postings = np.diff(self.transposed.indptr)
+        self.cost = np.bincount(rows, weights=postings[cols], minlength=total)
+
+    def terms(self, row: int) -> Dict[int, float]:
+        start, end = self.matrix.indptr[row], self.matrix.indptr[row + 1]
+        return dict(zip(self.matrix.indices[start:end].tolist(), self.matrix.data[start:end].tolist()))
+
+    def _chunks(self, rows: Sequence[int]) -> Iterator[Sequence[int]]:
+        chunk, cost = [], 0.0
+        for row in rows:
+            if chunk and cost + self.cost[row] > MAX_CHUNK_PRODUCTS:
+                yield chunk
+                chunk, cost = [], 0.0
+            chunk.append(row)
+            cost += self.cost[row]
+        if chunk:
+            yield chunk
+
+    def rank(self, rows: Iterable[int], keep: int, floors: Optional[Sequence[float]] = None
+             ) -> Iterator[Tuple[int, List[Tuple[int, float]], List[Tuple[int, float]]]]:
+        if floors is not None:
+            floors = np.asarray(floors, dtype=np.float64)
+        for chunk in self._chunks(list(rows)):
+            product = self.matrix[chunk] @ self.transposed
+            for offset, row in enumerate(chunk):
+                start, end = product.indptr[offset], product.indptr[offset + 1]
+                cols, scores = product.indices[start:end], product.data[start:end]
+                mask = (scores >= MIN_SIMILARITY) & (cols != row)
+                cols, scores = cols[mask], scores[mask]
+
+                best = np.argpartition(-scores, keep)[:keep] if len(scores) > keep else np.arange(len(scores))
+                best = best[np.argsort(-scores[best], kind='stable')]
+                top = list(zip(cols[best].tolist(), scores[best].tolist()))
+                offers = []
+                if floors is not None:
+                    beats = scores > floors[cols]
+                    offers = list(zip(cols[beats].tolist(), scores[beats].tolist()))
+                yield row, top, offers
+
+
+def build_matrix(corpus: Corpus):
+    return _SparseMatrix(corpus) if sparse is not None else _PythonMatrix(corpus)
+
+
+def link_pairs(index: DocumentIndex) -> Set[FrozenSet[str]]:
+    """Document pairs joined by an internal markdown link, in either direction"""
+    pairs = set()
+    for record in index.markdown():
+        base = posixpath.dirname(record.path)
+        for link in record.links:
+            url = link['url']
+            if url.startswith(EXTERNAL_PREFIXES):
+                continue
+            target = unquote(url.split('#', 1)[0].split('?', 1)[0]).strip()
+            if not target:
+                continue
+            target = target[1:] if target.startswith('/') else posixpath.join(base, target)
+            pairs.add(frozenset((record.path, posixpath.normpath(target))))
+    return pairs
+
+
+@dataclass
+class Suggestion:
+    source: str
+    target: str
+    score: float
+    terms: List[str] = field(default_factory=list)
+
+
+class CrossLinker:
+    """path -> most similar documents, kept current with the document index"""
+
+    def __init__(self, root: str = '.'):
+        self.root = os.path.abspath(root)
+        self.state_path = cache_path(self.root, STATE_FILE)
+        self.epoch: Optional[str] = None
+        self.settings: Optional[str] = None
+        self.generation = 0
+        self.built_docs = 0
+        self.neighbors: Dict[str, List[Tuple[str, float]]] = {}
+        self.corpus: Optional[Corpus] = None
+        self.matrix = None
+        self.position: Dict[str, int] = {}
+
+    def load(self) -> None:
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return
+        if state.get('version') != STATE_VERSION:
+            return
+        self.epoch = state.get('epoch')
+        self.settings = state.get('settings')
+        self.generation = state.get('generation', 0)
+        self.built_docs = state.get('built_docs', 0)
+        paths = state.get('paths', [])
+        self.neighbors = {
+            path: [(paths[other], score) for other, score in entries]
+            for path, entries in zip(paths, state.get('neighbors', []))
+        }
+
+    def save(self) -> None:
+        paths = sorted(self.neighbors)
+        position = {path: i for i, path in enumerate(paths)}
+        state = {
+            'version': STATE_VERSION,
+            'epoch': self.epoch,
+            'settings': self.settings,
+            'generation': self.generation,
+            'built_docs': self.built_docs,
+            'paths': paths,
+            'neighbors': [[[position[other], round(score, 4)] for other, score in self.neighbors[path]
+                           if other in position] for path in paths],
+        }
+        atomic_write(self.state_path, json.dumps(state, separators=(',', ':'), ensure_ascii=False))
+
+    def update(self, index: DocumentIndex, search: SearchIndex, full: bool = False) -> Tuple[int, bool]:
+        """Recompute the neighbour rows that changed; returns (rows computed, full rebuild)"""
+        search.update(index)
+        self.corpus = corpus = load_corpus(search)
+        self.matrix = build_matrix(corpus)
+        self.position = position = {path: row for row, path in enumerate(corpus.paths)}
+
+        drift = abs(len(corpus) - self.built_docs) / self.built_docs if self.built_docs else 1.0
+        full = full or self.epoch != index.epoch or self.settings != SETTINGS or drift > REBUILD_DRIFT
+        if full:
+            self.neighbors = {}
+            rows = list(range(len(corpus)))
+        else:
+            rows = self._invalidate(index, position)
+
+        recomputed = {corpus.paths[row] for row in rows}
+        floors = None
+        if not full:
+            # Recomputed rows get their own full list; everyone else takes offers
+            floors = [math.inf if path in recomputed else self._floor(path) for path in corpus.paths]
+
+        for row, top, offers in self.matrix.rank(rows, NEIGHBORS_KEPT, floors):
+            path = corpus.paths[row]
+            self.neighbors[path] = [(corpus.paths[other], score) for other, score in top]
+            for other, score in offers:
+                self._offer(corpus.paths[other], path, score)
+
+        self.epoch = index.epoch
+        self.settings = SETTINGS
+        self.generation = index.generation
+        if full:
+            self.built_docs = len(corpus)
+        self.save()
+        return len(rows), full
+
+    def _invalidate(self, index: DocumentIndex, position: Dict[str, int]) -> List[int]:
+        """Drop state that mentions changed documents; returns the rows to recompute"""
+        changed, removed = index.changes_since(self.generation, tuple(MARKDOWN_SUFFIXES))
+        stale = {record.path for record in changed} | set(removed)
+        stale.update(path for path in self.neighbors if path not in position)
+        for path in stale:
+            self.neighbors.pop(path, None)
+
+        refill = set()
+        for path, entries in self.neighbors.items():
+            kept = [entry for entry in entries if entry[0] not in stale]
+            if len(kept) != len(entries):
+                self.neighbors[path] = kept
+                if len(kept) < REFILL_BELOW:
+                    refill.add(path)
+        missing = {path for path in position if path not in self.neighbors}
+        return sorted(position[path] for path in stale | refill | missing if path in position)
+
+    def _floor(self, path: str) -> float:
+        """Similarity a new entry must beat to get into the stored list"""
+        entries = self.neighbors.get(path, [])
+        return entries[-1][1] if len(entries) >= NEIGHBORS_KEPT else 0.0
+
+    def _offer(self, path: str, other: str, score: float) -> None:
+        entries = self.neighbors.setdefault(path, [])
+        if len(entries) >= NEIGHBORS_KEPT and score <= entries[-1][1]:
+            return
+        # A refilled row may already be listed with its old score
+        entries[:] = [entry for entry in entries if entry[0] != other]
+        entries.append((other, score))
+        entries.sort(key=lambda entry: -entry[1])
+        del entries[NEIGHBORS_KEPT:]
+
+    def shared_terms(self, source: str, target: str, count: int = 3) -> List[str]:
+        """The terms contributing most to the similarity of two documents"""
+        if source not in self.position or target not in self.position:
+            return []
+        left, right = self.matrix.terms(self.position[source]), self.matrix.terms(self.position[target])
+        products = [(weight * right[col], col) for col, weight in left.items() if col in right]
+        return [self.corpus.vocab[col] for _, col in heapq.nlargest(count, products)]
+
+    def suggestions(self, index: DocumentIndex, top: int = 5, min_score: float = 0.2,
+                    prefix: str = '') -> List[Suggestion]:
+        """Up to `top` unlinked similar documents for each document under prefix"""
+        linked = link_pairs(index)
+        # Identical copies are the duplicate report's business, not missing links
+        hashes = {record.path: record.hash for record in index.markdown()}
+        found = []
+        for source in sorted(self.neighbors):
+            if not source.startswith(prefix):
+                continue
+            picks = [(target, score) for target, score in self.neighbors[source]
+                     if score >= min_score and frozenset((source, target)) not in linked
+                     and hashes.get(source) != hashes.get(target)]
+            found.extend(Suggestion(source, target, score) for target, score in picks[:top])
+        return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Suggest cross-links between similar documents')
+    parser.add_argument('directory', nargs='?', default='.',
+                        help='Documentation root (default: current directory)')
+    parser.add_argument('--top', type=int, default=5,
+                        help=f'Suggestions per document (at most {NEIGHBORS_KEPT})')
+    parser.add_argument('--min-score', type=float, default=0.2,
+                        help='Minimum cosine similarity to suggest (default: 0.2)')
+    parser.add_argument('--prefix', default='', help='Only suggest links from documents under this path')
+    parser.add_argument('--json', action='store_true', help='Print suggestions as JSON')
+    parser.add_argument('--rebuild', action='store_true', help='Recompute every row from scratch')
+    args = parser.parse_args()
+
+    index = DocumentIndex.open(args.directory)
+    search = SearchIndex(args.directory)
+    linker = CrossLinker(args.directory)
+    linker.load()
+    try:
+        started = time.perf_counter()
+        computed, full = linker.update(index, search, full=args.rebuild)
+        elapsed = time.perf_counter() - started
+        suggestions = linker.suggestions(index, min(args.top, NEIGHBORS_KEPT), args.min_score, args.prefix)
+        for suggestion in suggestions:
+            suggestion.terms = linker.shared_terms(suggestion.source, suggestion.target)
+
+        if args.json:
+            print(json.dumps([vars(s) for s in suggestions], indent=2, ensure_ascii=False))
+            return 0
+
+        mode = 'full rebuild' if full else 'incremental'
+        print(f"🧮 {computed} of {len(linker.corpus)} similarity rows computed ({mode}, "
+              f"{linker.matrix.name}, {len(linker.corpus.vocab)} terms) in {elapsed:.2f}s")
+        if not suggestions:
+            print("✅ No missing cross-links above the similarity threshold")
+            return 0
+
+        print(f"\n🔗 {len(suggestions)} suggested cross-links:")
+        for source, group in itertools.groupby(suggestions, key=lambda s: s.source):
+            print(f"  📄 {source}")
+            for suggestion in group:
+                terms = f"  ({', '.join(suggestion.terms)})" if suggestion.terms else ''
+                print(f"     {suggestion.score:.2f}  → {suggestion.target}{terms}")
+    finally:
+        search.close()
+        index.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
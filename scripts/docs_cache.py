@@ -0,0 +1,109 @@
+"""
+VOITHER Documentation Tool Cache
+Content-hash keyed result cache shared by the documentation tools
+
+Results live under .docs-cache/ in the documentation root, one JSON file per
+tool. Keys are content hashes, so a cached result stays valid for as long as
+the content it was computed from is unchanged.
+"""
+
+import os
+import json
+import stat
+import hashlib
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Union
+
+CACHE_DIR = '.docs-cache'
+
+
+def content_hash(data: Union[str, bytes]) -> str:
+    """SHA-256 hex digest of text (UTF-8 encoded) or bytes"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.sha256(data).hexdigest()
+
+
+def cache_path(root: Union[str, Path], name: str) -> Path:
+    """Path of a named artifact inside the cache directory"""
+    return Path(root) / CACHE_DIR / name
+
+
+def atomic_write(path: Union[str, Path], data: Union[str, bytes]) -> None:
+    """
+    Write data to path via a temp file in the same directory and rename
+
+    An existing file keeps its permission bits; new files get the usual
+    umask-derived mode instead of mkstemp's 0600.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    fd, tmp_path = tempfile.mkstemp(prefix=f'.{path.name}.', dir=str(path.parent))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+class ResultCache:
+    """
+    JSON-backed mapping of content hash -> tool result
+
+    The cache is dropped wholesale when `version` changes, so tools bump
+    their version whenever the shape or meaning of a result changes.
+    """
+
+    def __init__(self, name: str, root: Union[str, Path] = '.', version: int = 1):
+        self.path = cache_path(root, f'{name}.json')
+        self.version = version
+        self.entries: Dict[str, Any] = {}
+        self._dirty = False
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == version:
+                self.entries = data.get('entries', {})
+        except (OSError, ValueError):
+            pass
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: str, default: Optional[Any] = None) -> Any:
+        return self.entries.get(key, default)
+
+    def put(self, key: str, value: Any) -> None:
+        self.entries[key] = value
+        self._dirty = True
+
+    def retain(self, keys: Iterable[str]) -> None:
+        """Drop every entry whose key is not in keys"""
+        keep = set(keys)
+        stale = [key for key in self.entries if key not in keep]
+        for key in stale:
+            del self.entries[key]
+        self._dirty = self._dirty or bool(stale)
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        atomic_write(self.path, json.dumps({'version': self.version, 'entries': self.entries}))
+        self._dirty = False
@@ -0,0 +1,452 @@
+#!/usr/bin/env python3
+"""
+VOITHER Document Index
+Persistent per-file index shared by every documentation tool
+
+One walk of the tree records, for every file, its hash, size, type and
+line/word counts, plus frontmatter, headings and links for markdown. The
+index lives in .docs-cache/docs_index.sqlite and is refreshed
+incrementally: files whose size and mtime are unchanged are not re-read,
+and files whose content hash is unchanged are not re-parsed.
+
+Every refresh that changes something bumps a generation counter stamped on
+the rows it wrote (and on tombstones for removed paths), so a tool that
+remembers the generation it last saw can ask for exactly what changed since.
+"""
+
+import os
+import re
+import sys
+import json
+import bisect
+import sqlite3
+import hashlib
+import argparse
+import secrets
+import posixpath
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from docs_cache import CACHE_DIR, cache_path
+from docs_rules import split_frontmatter
+
+SCHEMA_VERSION = 3
+INDEX_FILE = 'docs_index.sqlite'
+
+# Directories that are never indexed
+PRUNED_DIRS = {'.git', CACHE_DIR, 'node_modules', '__pycache__'}
+
+# Known binary formats are hashed and sized but never decoded
+BINARY_SUFFIXES = {
+    '.png', '.jpg', '.jpeg', '.gif', '.webp', '.ico', '.svgz', '.pdf',
+    '.mp4', '.mov', '.webm', '.mp3', '.wav', '.zip', '.gz', '.br',
+    '.tar', '.sqlite', '.db', '.pyc', '.so', '.woff', '.woff2', '.ttf'
+}
+
+MARKDOWN_SUFFIXES = {'.md'}
+
+LINK_PATTERN = re.compile(r'\[([^\]]*)\]\(([^)]+)\)')
+HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.+?)\s*#*\s*$', re.MULTILINE)
+FENCED_BLOCK = re.compile(r'^ {0,3}(`{3,}|~{3,}).*?(?:^ {0,3}\1[ \t]*$|\Z)', re.MULTILINE | re.DOTALL)
+
+
+def file_kind(path: str) -> str:
+    """Lowercase suffix used for per-type queries ('.md', '.png', '' for none)"""
+    name = posixpath.basename(path)
+    if name.startswith('.') and name.count('.') == 1:
+        return name.lower()  # dotfiles such as docs/dsl/.ee
+    return posixpath.splitext(name)[1].lower()
+
+
+@dataclass
+class FileRecord:
+    """Indexed facts about one file"""
+    path: str
+    hash: str
+    size: int
+    mtime_ns: int
+    kind: str
+    lines: Optional[int] = None        # None for binary files
+    words: Optional[int] = None
+    body_words: Optional[int] = None   # words after the frontmatter block
+    body_offset: int = 0               # character offset where the body starts
+    frontmatter: Dict[str, Any] = field(default_factory=dict)
+    headings: List[Dict[str, Any]] = field(default_factory=list)
+    links: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def is_text(self) -> bool:
+        return self.lines is not None
+
+    @property
+    def is_markdown(self) -> bool:
+        return self.kind in MARKDOWN_SUFFIXES
+
+
+@dataclass
+class IndexDelta:
+    """What changed in the last refresh; `previous` holds the old records"""
+    added: List[str] = field(default_factory=list)
+    modified: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    previous: Dict[str, FileRecord] = field(default_factory=dict)
+
+    @property
+    def changed(self) -> List[str]:
+        return self.added + self.modified
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.modified or self.removed)
+
+
+def analyze_file(path: str, data: bytes, size: int, mtime_ns: int) -> FileRecord:
+    """Build the record for one file from its bytes"""
+    kind = file_kind(path)
+    record = FileRecord(
+        path=path,
+        hash=hashlib.sha256(data).hexdigest(),
+        size=size,
+        mtime_ns=mtime_ns,
+        kind=kind
+    )
+
+    if kind in BINARY_SUFFIXES or b'\0' in data[:8192]:
+        return record
+    try:
+        text = data.decode('utf-8')
+    except UnicodeDecodeError:
+        return record
+
+    # Same conventions as `wc -l` / `wc -w`
+    record.lines = data.count(b'\n')
+    record.words = len(text.split())
+    record.body_words = record.words
+
+    if kind in MARKDOWN_SUFFIXES:
+        metadata, body, body_offset = split_frontmatter(text)
+        record.frontmatter = metadata
+        record.body_offset = body_offset
+        record.body_words = len(body.split())
+
+        line_starts = [0] + [m.end() for m in re.finditer('\n', text)]
+        fence_starts, fence_ends = [], []
+        for m in FENCED_BLOCK.finditer(text, body_offset):
+            fence_starts.append(m.start())
+            fence_ends.append(m.end())
+
+        def in_fence(offset: int) -> bool:
+            i = bisect.bisect_right(fence_starts, offset) - 1
+            return i >= 0 and offset < fence_ends[i]
+
+        record.headings = [
+            {"level": len(m.group(1)), "text": m.group(2),
+             "line": bisect.bisect_right(line_starts, m.start())}
+            for m in HEADING_PATTERN.finditer(text, body_offset)
+            if not in_fence(m.start())
+        ]
+        record.links = [
+            {"text": m.group(1), "url": m.group(2),
+             "line": bisect.bisect_right(line_starts, m.start())}
+            for m in LINK_PATTERN.finditer(text)
+        ]
+
+    return record
+
+
+def _json_default(value: Any) -> str:
+    # YAML frontmatter may hold dates and datetimes
+    return value.isoformat() if hasattr(value, 'isoformat') else str(value)
+
+
+class DocumentIndex:
+    """SQLite-backed index of every file under a documentation root"""
+
+    COLUMNS = ('path', 'hash', 'size', 'mtime_ns', 'kind', 'lines', 'words', 'body_words',
+               'body_offset', 'frontmatter', 'headings', 'links')
+
+    def __init__(self, root: str = '.', db_path: Optional[str] = None):
+        self.root = os.path.abspath(root)
+        self.db_path = db_path or str(cache_path(self.root, INDEX_FILE))
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self._ensure_schema()
+        self.last_delta = IndexDelta()
+        self._directories: Optional[Set[str]] = None
+
+    @classmethod
+    def open(cls, root: str = '.', refresh: bool = True) -> 'DocumentIndex':
+        """Open the index for root, bringing it up to date unless refresh=False"""
+        index = cls(root)
+        if refresh:
+            index.refresh()
+        return index
+
+    def _ensure_schema(self) -> None:
+        self.conn.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+        if row is None or int(row[0]) != SCHEMA_VERSION:
+            self.conn.execute('DROP TABLE IF EXISTS files')
+            self.conn.execute('DROP TABLE IF EXISTS removed')
+            # A new epoch tells generation-tracking consumers to start over
+            self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('epoch', ?)", (secrets.token_hex(8),))
+            self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('generation', '0')")
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY,
+                hash TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                kind TEXT NOT NULL,
+                lines INTEGER,
+                words INTEGER,
+                body_words INTEGER,
+                body_offset INTEGER NOT NULL DEFAULT 0,
+                frontmatter TEXT,
+                headings TEXT,
+                links TEXT,
+                generation INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS removed (
+                path TEXT PRIMARY KEY,
+                generation INTEGER NOT NULL
+            )
+        ''')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS files_generation ON files (generation)')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS removed_generation ON removed (generation)')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS files_kind ON files (kind)')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS files_hash ON files (hash)')
+        self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+        self.conn.commit()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def _meta(self, key: str) -> Optional[str]:
+        row = self.conn.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    @property
+    def epoch(self) -> str:
+        """Identifies this index instance; changes when the index is rebuilt"""
+        return self._meta('epoch') or ''
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped by every refresh that changed something"""
+        return int(self._meta('generation') or 0)
+
+    def _walk(self) -> Iterator[Tuple[str, os.stat_result]]:
+        """Yield (relative posix path, stat) for every indexable file"""
+        stack = ['']
+        while stack:
+            rel_dir = stack.pop()
+            try:
+                entries = os.scandir(os.path.join(self.root, rel_dir))
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in PRUNED_DIRS:
+                            stack.append(rel_path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield rel_path, entry.stat(follow_symlinks=False)
+
+    def refresh(self) -> IndexDelta:
+        """Bring the index up to date with one walk; returns what changed"""
+        known = {
+            path: (size, mtime_ns, file_hash)
+            for path, size, mtime_ns, file_hash in
+            self.conn.execute('SELECT path, size, mtime_ns, hash FROM files')
+        }
+        delta = IndexDelta()
+        seen = set()
+        upserts = []
+        touched = []
+
+        for rel_path, stat in self._walk():
+            seen.add(rel_path)
+            previous = known.get(rel_path)
+            if previous and previous[0] == stat.st_size and previous[1] == stat.st_mtime_ns:
+                continue
+
+            try:
+                with open(os.path.join(self.root, rel_path), 'rb') as f:
+                    data = f.read()
+            except OSError:
+                continue
+
+            if previous and previous[2] == hashlib.sha256(data).hexdigest():
+                touched.append((stat.st_mtime_ns, rel_path))
+                continue
+
+            upserts.append(analyze_file(rel_path, data, stat.st_size, stat.st_mtime_ns))
+            if previous:
+                delta.modified.append(rel_path)
+            else:
+                delta.added.append(rel_path)
+
+        delta.removed = sorted(set(known) - seen)
+
+        for path in delta.modified + delta.removed:
+            delta.previous[path] = self.get(path)
+
+        generation = self.generation + 1 if delta else self.generation
+        with self.conn:
+            self.conn.executemany('UPDATE files SET mtime_ns = ? WHERE path = ?', touched)
+            self.conn.executemany(
+                f'INSERT OR REPLACE INTO files ({", ".join(self.COLUMNS)}, generation) '
+                f'VALUES ({", ".join("?" * (len(self.COLUMNS) + 1))})',
+                [self._to_row(record) + (generation,) for record in upserts]
+            )
+            self.conn.executemany('DELETE FROM files WHERE path = ?', [(p,) for p in delta.removed])
+            self.conn.executemany('DELETE FROM removed WHERE path = ?', [(p,) for p in delta.added])
+            self.conn.executemany('INSERT OR REPLACE INTO removed VALUES (?, ?)',
+                                  [(p, generation) for p in delta.removed])
+            if delta:
+                self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('generation', ?)", (str(generation),))
+
+        if delta:
+            self._directories = None
+        self.last_delta = delta
+        return delta
+
+    def _to_row(self, record: FileRecord) -> Tuple:
+        return (
+            record.path, record.hash, record.size, record.mtime_ns, record.kind,
+            record.lines, record.words, record.body_words, record.body_offset,
+            json.dumps(record.frontmatter, default=_json_default, ensure_ascii=False) if record.frontmatter else None,
+            json.dumps(record.headings, ensure_ascii=False) if record.headings else None,
+            json.dumps(record.links, ensure_ascii=False) if record.links else None,
+        )
+
+    def _from_row(self, row: Tuple) -> FileRecord:
+        (path, file_hash, size, mtime_ns, kind, lines, words, body_words,
+         body_offset, frontmatter, headings, links) = row
+        return FileRecord(
+            path=path, hash=file_hash, size=size, mtime_ns=mtime_ns, kind=kind,
+            lines=lines, words=words, body_words=body_words, body_offset=body_offset,
+            frontmatter=json.loads(frontmatter) if frontmatter else {},
+            headings=json.loads(headings) if headings else [],
+            links=json.loads(links) if links else []
+        )
+
+    def get(self, path: str) -> Optional[FileRecord]:
+        row = self.conn.execute(
+            f'SELECT {", ".join(self.COLUMNS)} FROM files WHERE path = ?', (path,)
+        ).fetchone()
+        return self._from_row(row) if row else None
+
+    def files(self, kinds: Optional[Tuple[str, ...]] = None, prefix: Optional[str] = None) -> Iterator[FileRecord]:
+        """Records in path order, optionally filtered by kind and path prefix"""
+        query = f'SELECT {", ".join(self.COLUMNS)} FROM files'
+        clauses, params = [], []
+        if kinds:
+            clauses.append(f'kind IN ({", ".join("?" * len(kinds))})')
+            params.extend(kinds)
+        if prefix:
+            clauses.append('path >= ? AND path < ?')
+            params.extend([prefix, prefix + '\uffff'])
+        if clauses:
+            query += ' WHERE ' + ' AND '.join(clauses)
+        query += ' ORDER BY path'
+        for row in self.conn.execute(query, params):
+            yield self._from_row(row)
+
+    def changes_since(self, generation: int,
+                      kinds: Optional[Tuple[str, ...]] = None) -> Tuple[List[FileRecord], List[str]]:
+        """(records added or modified, paths removed) after the given generation"""
+        query = f'SELECT {", ".join(self.COLUMNS)} FROM files WHERE generation > ?'
+        params: List[Any] = [generation]
+        if kinds:
+            query += f' AND kind IN ({", ".join("?" * len(kinds))})'
+            params.extend(kinds)
+        changed = [self._from_row(row) for row in self.conn.execute(query + ' ORDER BY path', params)]
+        removed = [row[0] for row in self.conn.execute(
+            'SELECT path FROM removed WHERE generation > ? ORDER BY path', (generation,)
+        )]
+        return changed, removed
+
+    def markdown(self) -> Iterator[FileRecord]:
+        return self.files(kinds=tuple(MARKDOWN_SUFFIXES))
+
+    def summaries(self) -> Iterator[Tuple[str, str, int, Optional[int], Optional[int]]]:
+        """(path, kind, size, lines, words) for every file, without decoding the JSON columns"""
+        return self.conn.execute('SELECT path, kind, size, lines, words FROM files ORDER BY path')
+
+    def blobs(self, kinds: Optional[Tuple[str, ...]] = None) -> Iterator[Tuple[str, str, int]]:
+        """(path, hash, size) for every file, optionally filtered by kind"""
+        if kinds:
+            return self.conn.execute(
+                f'SELECT path, hash, size FROM files WHERE kind IN ({", ".join("?" * len(kinds))}) ORDER BY path',
+                kinds
+            )
+        return self.conn.execute('SELECT path, hash, size FROM files ORDER BY path')
+
+    def paths(self) -> List[str]:
+        return [row[0] for row in self.conn.execute('SELECT path FROM files ORDER BY path')]
+
+    def exists(self, rel_path: str) -> bool:
+        """True if rel_path is an indexed file or a directory containing one"""
+        rel_path = posixpath.normpath(rel_path.replace(os.sep, '/'))
+        if rel_path in ('', '.'):
+            return True
+        if self.conn.execute('SELECT 1 FROM files WHERE path = ?', (rel_path,)).fetchone():
+            return True
+        if self._directories is None:
+            self._directories = set()
+            for path in self.paths():
+                parent = posixpath.dirname(path)
+                while parent and parent not in self._directories:
+                    self._directories.add(parent)
+                    parent = posixpath.dirname(parent)
+        return rel_path.rstrip('/') in self._directories
+
+    def read_text(self, rel_path: str) -> str:
+        with open(os.path.join(self.root, rel_path), 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def __len__(self) -> int:
+        return self.conn.execute('SELECT COUNT(*) FROM files').fetchone()[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build or refresh the shared VOITHER document index')
+    parser.add_argument('directory', nargs='?', default='.',
+                        help='Documentation root (default: current directory)')
+    parser.add_argument('--rebuild', action='store_true',
+                        help='Discard the existing index and rebuild from scratch')
+    parser.add_argument('--verbose', '-v', action='store_true',
+                        help='List changed files')
+    args = parser.parse_args()
+
+    directory = os.path.abspath(args.directory)
+    if args.rebuild:
+        db_path = cache_path(directory, INDEX_FILE)
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(f"{db_path}{suffix}"):
+                os.unlink(f"{db_path}{suffix}")
+
+    index = DocumentIndex.open(directory)
+    delta = index.last_delta
+
+    print(f"🗂️  Document index: {len(index)} files ({index.db_path})")
+    print(f"   ➕ Added: {len(delta.added)}  ✏️  Modified: {len(delta.modified)}  ➖ Removed: {len(delta.removed)}")
+    if args.verbose:
+        for label, paths in (('+', delta.added), ('~', delta.modified), ('-', delta.removed)):
+            for path in paths:
+                print(f"   {label} {path}")
+
+    index.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+VOITHER Documentation Rule Engine
+Compiles the validation rules in docs-config.yml into a single-pass evaluation plan
+
+Features:
+- docs-config.yml is loaded once per process and shared by every tool
+- include_patterns / exclude_patterns compiled into one anchored regex
+- required_frontmatter and word_limits compiled into per-document rules
+- Every rule runs against facts extracted in a single read of each document
+"""
+
+import os
+import re
+import sys
+import argparse
+import posixpath
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import yaml
+
+CONFIG_FILE = 'docs-config.yml'
+
+DEFAULT_CONFIG: Dict[str, Any] = {
+    'documentation': {
+        'include_patterns': ['*.md'],
+        'exclude_patterns': ['.git/', 'node_modules/'],
+    },
+    'validation': {
+        'required_frontmatter': [],
+        'word_limits': {},
+        'spell_check': {'enabled': False},
+    },
+}
+
+_CONFIG_CACHE: Dict[str, Dict[str, Any]] = {}
+_ENGINE_CACHE: Dict[str, 'RuleEngine'] = {}
+
+
+def load_config(root: str = '.') -> Dict[str, Any]:
+    """Load docs-config.yml from root once per process"""
+    config_path = os.path.abspath(os.path.join(root, CONFIG_FILE))
+    if config_path not in _CONFIG_CACHE:
+        try:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                _CONFIG_CACHE[config_path] = yaml.safe_load(f) or {}
+        except FileNotFoundError:
+            _CONFIG_CACHE[config_path] = DEFAULT_CONFIG
+    return _CONFIG_CACHE[config_path]
+
+
+def split_frontmatter(text: str) -> Tuple[Dict[str, Any], str, int]:
+    """
+    Split a document into (metadata, body, body_offset)
+
+    body_offset is the character offset where the body starts, 0 when the
+    document has no frontmatter block. Unparseable frontmatter yields {}.
+    """
+    if not text.startswith('---'):
+        return {}, text, 0
+
+    # The block may be empty: the closing fence then directly follows the opening one
+    match = re.match(r'---[ \t]*\r?\n(.*?\r?\n)??---[ \t]*(?:\r?\n|$)', text, re.DOTALL)
+    if not match:
+        return {}, text, 0
+
+    try:
+        metadata = yaml.safe_load(match.group(1) or '') or {}
+    except yaml.YAMLError:
+        metadata = {}
+    if not isinstance(metadata, dict):
+        metadata = {}
+
+    return metadata, text[match.end():], match.end()
+
+
+def _glob_to_regex(pattern: str) -> str:
+    """Translate a docs-config glob ('*.md', 'build/', '**/x') to a regex fragment"""
+    regex = []
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if pattern.startswith('**', index):
+            regex.append('.*')
+            index += 2
+            continue
+        if char == '*':
+            regex.append('[^/]*')
+        elif char == '?':
+            regex.append('[^/]')
+        elif char == '[':
+            end = pattern.find(']', index + 1)
+            if end == -1:
+                regex.append(r'\[')
+            else:
+                regex.append(pattern[index:end + 1].replace('[!', '[^'))
+                index = end
+        else:
+            regex.append(re.escape(char))
+        index += 1
+    return ''.join(regex)
+
+
+class PathMatcher:
+    """
+    include_patterns / exclude_patterns as one compiled regex
+
+    Exclude patterns follow gitignore rules: a pattern without a slash
+    matches any path component, and a trailing slash restricts it to
+    directories. Include patterns match the file name.
+    """
+
+    def __init__(self, include: List[str], exclude: List[str]):
+        include_alternatives = '|'.join(_glob_to_regex(p) for p in include) or '(?!)'
+        exclude_alternatives = '|'.join(
+            _glob_to_regex(p.rstrip('/')) + ('/' if p.endswith('/') else '(?:/|$)')
+            for p in exclude
+        ) or '(?!)'
+
+        self._exclude = re.compile(rf'(?:^|/)(?:{exclude_alternatives})')
+        self._regex = re.compile(
+            rf'^(?!(?:.*/)?(?:{exclude_alternatives}))(?:.*/)?(?:{include_alternatives})$'
+        )
+
+    def matches(self, rel_path: str) -> bool:
+        """True if the relative path is a documentation file"""
+        return self._regex.match(rel_path.replace(os.sep, '/')) is not None
+
+    def prunes(self, rel_dir: str) -> bool:
+        """True if nothing under the relative directory can match"""
+        return self._exclude.search(rel_dir.replace(os.sep, '/') + '/') is not None
+
+    def in_excluded_dir(self, rel_path: str) -> bool:
+        """True if the file sits under an excluded directory, whatever its own name"""
+        directory = posixpath.dirname(rel_path.replace(os.sep, '/'))
+        return bool(directory) and self.prunes(directory)
+
+
+@dataclass
+class Finding:
+    """A rule violation in one document"""
+    rule: str
+    severity: str  # "error" or "warning"
+    message: str
+    data: Any = None
+
+
+@dataclass
+class DocumentFacts:
+    """Everything the rules need, extracted from one read of a document"""
+    path: str
+    metadata: Dict[str, Any]
+    body: str
+    has_frontmatter: bool
+    word_count: int
+
+
+@dataclass
+class RuleReport:
+    path: str
+    facts: DocumentFacts
+    findings: List[Finding] = field(default_factory=list)
+
+    @property
+    def errors(self) -> List[Finding]:
+        return [f for f in self.findings if f.severity == 'error']
+
+    @property
+    def warnings(self) -> List[Finding]:
+        return [f for f in self.findings if f.severity == 'warning']
+
+
+Rule = Callable[[DocumentFacts], List[Finding]]
+
+# Each factory receives the `validation` section and returns a compiled rule or None
+RULE_FACTORIES: Dict[str, Callable[[Dict[str, Any]], Optional[Rule]]] = {}
+
+
+def rule_factory(name: str):
+    """Register a rule factory under the validation key it compiles"""
+    def register(factory):
+        RULE_FACTORIES[name] = factory
+        return factory
+    return register
+
+
+@rule_factory('required_frontmatter')
+def _compile_required_frontmatter(validation: Dict[str, Any]) -> Optional[Rule]:
+    required = tuple(validation.get('required_frontmatter') or ())
+    if not required:
+        return None
+
+    def check(facts: DocumentFacts) -> List[Finding]:
+        return [
+            Finding('required_frontmatter', 'error', f"Missing frontmatter field: {name}", name)
+            for name in required if name not in facts.metadata
+        ]
+    return check
+
+
+@rule_factory('word_limits')
+def _compile_word_limits(validation: Dict[str, Any]) -> Optional[Rule]:
+    limits = validation.get('word_limits') or {}
+    max_words = limits.get('max_words_per_document')
+    warn_words = limits.get('warn_words_per_document')
+    if max_words is None and warn_words is None:
+        return None
+
+    def check(facts: DocumentFacts) -> List[Finding]:
+        if max_words is not None and facts.word_count > max_words:
+            return [Finding('word_limits', 'error',
+                            f"Document has {facts.word_count} words (max {max_words})", facts.word_count)]
+        if warn_words is not None and facts.word_count > warn_words:
+            return [Finding('word_limits', 'warning',
+                            f"Document has {facts.word_count} words (warn above {warn_words})", facts.word_count)]
+        return []
+    return check
+
+
+class RuleEngine:
+    """Evaluation plan compiled once from docs-config.yml"""
+
+    def __init__(self, config: Dict[str, Any], root: str = '.'):
+        self.root = os.path.abspath(root)
+        self.config = config
+
+        documentation = config.get('documentation') or {}
+        self.validation = config.get('validation') or {}
+
+        self.matcher = PathMatcher(
+            documentation.get('include_patterns') or [],
+            documentation.get('exclude_patterns') or []
+        )
+        self.required_frontmatter: Tuple[str, ...] = tuple(self.validation.get('required_frontmatter') or ())
+        self.word_limits: Dict[str, int] = dict(self.validation.get('word_limits') or {})
+        self.spell_check: Dict[str, Any] = dict(self.validation.get('spell_check') or {})
+
+        self.plan: List[Tuple[str, Rule]] = []
+        for name, factory in RULE_FACTORIES.items():
+            rule = factory(self.validation)
+            if rule is not None:
+                self.plan.append((name, rule))
+
+    def facts(self, rel_path: str, text: str) -> DocumentFacts:
+        metadata, body, body_offset = split_frontmatter(text)
+        return DocumentFacts(
+            path=rel_path,
+            metadata=metadata,
+            body=body,
+            has_frontmatter=body_offset > 0,
+            word_count=len(body.split())
+        )
+
+    def facts_from_record(self, record: Any) -> DocumentFacts:
+        """Facts from a DocumentIndex record, without reading the file (body is not loaded)"""
+        return DocumentFacts(
+            path=record.path,
+            metadata=record.frontmatter,
+            body='',
+            has_frontmatter=record.body_offset > 0,
+            word_count=record.body_words or 0
+        )
+
+    def evaluate_facts(self, facts: DocumentFacts) -> RuleReport:
+        """Run the whole plan against one document's facts"""
+        report = RuleReport(facts.path, facts)
+        for _, rule in self.plan:
+            report.findings.extend(rule(facts))
+        return report
+
+    def evaluate(self, rel_path: str, text: str) -> RuleReport:
+        return self.evaluate_facts(self.facts(rel_path, text))
+
+    def evaluate_record(self, record: Any) -> RuleReport:
+        return self.evaluate_facts(self.facts_from_record(record))
+
+    def iter_documents(self, suffixes: Tuple[str, ...] = ('.md',)) -> Iterator[str]:
+        """Relative paths of matching documents, in one walk of the tree"""
+        for root, dirs, files in os.walk(self.root):
+            rel_root = os.path.relpath(root, self.root)
+            rel_root = '' if rel_root == '.' else rel_root
+            dirs[:] = sorted(d for d in dirs if not self.matcher.prunes(os.path.join(rel_root, d)))
+            for file in sorted(files):
+                rel_path = os.path.join(rel_root, file)
+                if file.endswith(suffixes) and self.matcher.matches(rel_path):
+                    yield rel_path
+
+    def evaluate_tree(self, suffixes: Tuple[str, ...] = ('.md',)) -> Iterator[RuleReport]:
+        for rel_path in self.iter_documents(suffixes):
+            try:
+                with open(os.path.join(self.root, rel_path), 'r', encoding='utf-8') as f:
+                    text = f.read()
+            except (OSError, UnicodeDecodeError):
+                continue
+            yield self.evaluate(rel_path, text)
+
+
+def get_engine(root: str = '.') -> RuleEngine:
+    """Shared engine for root; built from docs-config.yml on first use"""
+    key = os.path.abspath(root)
+    if key not in _ENGINE_CACHE:
+        _ENGINE_CACHE[key] = RuleEngine(load_config(root), root)
+    return _ENGINE_CACHE[key]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Apply docs-config.yml validation rules')
+    parser.add_argument('directory', nargs='?', default='.',
+                        help='Directory to check (default: current directory)')
+    parser.add_argument('--errors-only', action='store_true',
+                        help='Only report rule errors')
+    args = parser.parse_args()
+
+    engine = get_engine(args.directory)
+    print(f"📐 Rules compiled: {', '.join(name for name, _ in engine.plan) or 'none'}")
+
+    documents = errors = warnings = 0
+    for report in engine.evaluate_tree():
+        documents += 1
+        errors += len(report.errors)
+        warnings += len(report.warnings)
+        for finding in report.findings:
+            if args.errors_only and finding.severity != 'error':
+                continue
+            icon = '❌' if finding.severity == 'error' else '⚠️ '
+            print(f"  {icon} {report.path}: {finding.message}")
+
+    print(f"\n📊 {documents} documents, {errors} errors, {warnings} warnings")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
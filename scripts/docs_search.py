@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""
+VOITHER Documentation Search
+BM25-ranked full-text search over a persistent positional inverted index
+
+Features:
+- Accent- and case-folded tokenization ("Emergência" matches "emergencia")
+- Positional postings for "quoted phrase" queries
+- Postings carry a precomputed BM25 weight and are read in impact order,
+  so a query touches a bounded number of rows however large the corpus is
+- Updated incrementally from the shared document index: only files that
+  changed since the last update are re-tokenized
+"""
+
+import os
+import re
+import sys
+import math
+import heapq
+import sqlite3
+import argparse
+import unicodedata
+from array import array
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from docs_cache import cache_path
+from docs_index import DocumentIndex, MARKDOWN_SUFFIXES
+from docs_rules import get_engine
+
+SCHEMA_VERSION = 1
+SEARCH_FILE = 'search.sqlite'
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# Postings read per query term, highest impact first. Documents past this
+# point can only matter for terms so common their idf is close to zero.
+MAX_POSTINGS_PER_TERM = 2000
+
+# Stored weights are recomputed when the average document length drifts this much
+REWEIGHT_DRIFT = 0.10
+
+TOKEN_PATTERN = re.compile(r'\w+')
+QUERY_PATTERN = re.compile(r'"([^"]*)"|(\S+)')
+
+
+def fold(text: str) -> str:
+    """Case-fold and strip accents"""
+    decomposed = unicodedata.normalize('NFKD', text.casefold())
+    return ''.join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_PATTERN.findall(fold(text))
+
+
+def parse_query(query: str) -> Tuple[List[str], List[List[str]]]:
+    """Split a query into plain terms and "quoted phrases" (as token lists)"""
+    terms, phrases = [], []
+    for phrase, word in QUERY_PATTERN.findall(query):
+        tokens = tokenize(phrase if phrase else word)
+        if phrase and len(tokens) > 1:
+            phrases.append(tokens)
+        else:
+            terms.extend(tokens)
+    return terms, phrases
+
+
+def term_weight(tf: int, length: int, avgdl: float) -> float:
+    """The tf / length-normalization part of BM25"""
+    return tf * (K1 + 1) / (tf + K1 * (1 - B + B * length / avgdl))
+
+
+def idf(df: int, total_docs: int) -> float:
+    return math.log(1 + (total_docs - df + 0.5) / (df + 0.5))
+
+
+@dataclass
+class SearchHit:
+    path: str
+    score: float
+    line: int = 0
+    snippet: str = ''
+
+
+class SearchIndex:
+    """Positional inverted index stored in .docs-cache/search.sqlite"""
+
+    def __init__(self, root: str = '.', db_path: Optional[str] = None):
+        self.root = os.path.abspath(root)
+        self.db_path = db_path or str(cache_path(self.root, SEARCH_FILE))
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self._ensure_schema()
+
+    def _ensure_schema(self) -> None:
+        self.conn.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+        if self._meta('schema_version') != str(SCHEMA_VERSION):
+            for table in ('postings', 'terms', 'docs'):
+                self.conn.execute(f'DROP TABLE IF EXISTS {table}')
+            self.conn.execute('DELETE FROM meta')
+        self.conn.executescript('''
+            CREATE TABLE IF NOT EXISTS docs (
+                id INTEGER PRIMARY KEY,
+                path TEXT UNIQUE NOT NULL,
+                length INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS terms (
+                id INTEGER PRIMARY KEY,
+                term TEXT UNIQUE NOT NULL,
+                df INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS postings (
+                term_id INTEGER NOT NULL,
+                doc_id INTEGER NOT NULL,
+                tf INTEGER NOT NULL,
+                weight REAL NOT NULL,
+                positions BLOB NOT NULL,
+                PRIMARY KEY (term_id, doc_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS postings_impact ON postings (term_id, weight DESC);
+            CREATE INDEX IF NOT EXISTS postings_doc ON postings (doc_id);
+        ''')
+        self._set_meta('schema_version', SCHEMA_VERSION)
+        self.conn.commit()
+
+    def _meta(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        row = self.conn.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else default
+
+    def _set_meta(self, key: str, value) -> None:
+        self.conn.execute('INSERT OR REPLACE INTO meta VALUES (?, ?)', (key, str(value)))
+
+    def close(self) -> None:
+        self.conn.close()
+
+    @property
+    def total_docs(self) -> int:
+        return int(self._meta('total_docs', '0'))
+
+    @property
+    def total_length(self) -> int:
+        return int(self._meta('total_length', '0'))
+
+    @property
+    def weighted_avgdl(self) -> float:
+        """Average document length the stored weights were computed with"""
+        return float(self._meta('weighted_avgdl', '0'))
+
+    # Indexing
+
+    def update(self, index: DocumentIndex, full: bool = False) -> Tuple[int, int]:
+        """Fold document index changes into the search index; returns (indexed, removed)"""
+        engine = get_engine(self.root)
+        if full or self._meta('epoch') != index.epoch:
+            with self.conn:
+                for table in ('postings', 'terms', 'docs'):
+                    self.conn.execute(f'DELETE FROM {table}')
+                self.conn.execute("DELETE FROM meta WHERE key != 'schema_version'")
+                self._set_meta('epoch', index.epoch)
+
+        changed, removed = index.changes_since(int(self._meta('generation', '0')), tuple(MARKDOWN_SUFFIXES))
+        indexed = dropped = 0
+        with self.conn:
+            for path in removed:
+                dropped += self._remove(path)
+            for record in changed:
+                self._remove(record.path)
+                if not engine.matcher.matches(record.path):
+                    continue
+                try:
+                    text = index.read_text(record.path)
+                except (OSError, UnicodeDecodeError):
+                    continue
+                self._add(record.path, text)
+                indexed += 1
+            self._set_meta('generation', index.generation)
+
+            total_docs = self.total_docs
+            if total_docs:
+                avgdl = self.total_length / total_docs
+                weighted = self.weighted_avgdl
+                if not weighted or abs(avgdl - weighted) / weighted > REWEIGHT_DRIFT:
+                    self._reweight(avgdl)
+        return indexed, dropped
+
+    def _remove(self, path: str) -> int:
+        row = self.conn.execute('SELECT id, length FROM docs WHERE path = ?', (path,)).fetchone()
+        if row is None:
+            return 0
+        doc_id, length = row
+        self.conn.execute(
+            'UPDATE terms SET df = df - 1 WHERE id IN (SELECT term_id FROM postings WHERE doc_id = ?)',
+            (doc_id,)
+        )
+        self.conn.execute('DELETE FROM postings WHERE doc_id = ?', (doc_id,))
+        self.conn.execute('DELETE FROM docs WHERE id = ?', (doc_id,))
+        self._set_meta('total_docs', self.total_docs - 1)
+        self._set_meta('total_length', self.total_length - length)
+        return 1
+
+    def _term_ids(self, terms: Sequence[str], create: bool = False) -> Dict[str, int]:
+        if create:
+            self.conn.executemany('INSERT OR IGNORE INTO terms (term, df) VALUES (?, 0)', [(t,) for t in terms])
+        ids = {}
+        for start in range(0, len(terms), 500):
+            chunk = terms[start:start + 500]
+            ids.update(self.conn.execute(
+                f'SELECT term, id FROM terms WHERE term IN ({", ".join("?" * len(chunk))})', chunk
+            ))
+        return ids
+
+    def _add(self, path: str, text: str) -> None:
+        tokens = tokenize(text)
+        positions: Dict[str, array] = defaultdict(lambda: array('I'))
+        for position, token in enumerate(tokens):
+            positions[token].append(position)
+
+        cursor = self.conn.execute('INSERT INTO docs (path, length) VALUES (?, ?)', (path, len(tokens)))
+        doc_id = cursor.lastrowid
+        term_ids = self._term_ids(list(positions), create=True)
+
+        # Until the first reweight there is no average length to normalize against
+        avgdl = self.weighted_avgdl
+        self.conn.executemany('UPDATE terms SET df = df + 1 WHERE id = ?', [(i,) for i in term_ids.values()])
+        self.conn.executemany('INSERT INTO postings VALUES (?, ?, ?, ?, ?)', [
+            (term_ids[term], doc_id, len(pos),
+             term_weight(len(pos), len(tokens), avgdl) if avgdl else 0.0, pos.tobytes())
+            for term, pos in positions.items()
+        ])
+        self._set_meta('total_docs', self.total_docs + 1)
+        self._set_meta('total_length', self.total_length + len(tokens))
+
+    def _reweight(self, avgdl: float) -> None:
+        """Recompute every stored BM25 weight for a new average document length"""
+        self.conn.execute('''
+            UPDATE postings SET weight = tf * (:k1 + 1.0) / (
+                tf + :k1 * (1 - :b + :b * (SELECT length FROM docs WHERE docs.id = postings.doc_id) / :avgdl)
+            )
+        ''', {'k1': K1, 'b': B, 'avgdl': avgdl})
+        self._set_meta('weighted_avgdl', avgdl)
+
+    # Querying
+
+    def _phrase_matches(self, tokens: List[str]) -> Dict[int, int]:
+        """doc id -> number of occurrences of the phrase"""
+        ids = self._term_ids(list(dict.fromkeys(tokens)))
+        if len(ids) < len(set(tokens)):
+            return {}
+
+        # Walk the rarest term's postings and probe the others by primary key
+        offsets = {}
+        for offset, token in enumerate(tokens):
+            offsets.setdefault(token, []).append(offset)
+        dfs = dict(self.conn.execute(
+            f'SELECT id, df FROM terms WHERE id IN ({", ".join("?" * len(ids))})', list(ids.values())
+        ))
+        anchor = min(offsets, key=lambda t: dfs.get(ids[t], 0))
+
+        matches = {}
+        for doc_id, blob in self.conn.execute(
+            'SELECT doc_id, positions FROM postings WHERE term_id = ?', (ids[anchor],)
+        ):
+            anchor_positions = array('I')
+            anchor_positions.frombytes(blob)
+            starts = {p - offsets[anchor][0] for p in anchor_positions}
+
+            for token, token_offsets in offsets.items():
+                if token == anchor and len(token_offsets) == 1:
+                    continue
+                row = self.conn.execute(
+                    'SELECT positions FROM postings WHERE term_id = ? AND doc_id = ?', (ids[token], doc_id)
+                ).fetchone()
+                if row is None:
+                    starts = set()
+                    break
+                token_positions = array('I')
+                token_positions.frombytes(row[0])
+                present = set(token_positions)
+                starts = {s for s in starts if all(s + o in present for o in token_offsets)}
+                if not starts:
+                    break
+
+            if starts:
+                matches[doc_id] = len(starts)
+        return matches
+
+    def search(self, query: str, limit: int = 10) -> List[SearchHit]:
+        terms, phrases = parse_query(query)
+        total_docs = self.total_docs
+        avgdl = self.weighted_avgdl
+        if not total_docs or not (terms or phrases):
+            return []
+
+        scores: Dict[int, float] = defaultdict(float)
+        for term in dict.fromkeys(terms):
+            row = self.conn.execute('SELECT id, df FROM terms WHERE term = ?', (term,)).fetchone()
+            if row is None or row[1] <= 0:
+                continue
+            term_idf = idf(row[1], total_docs)
+            for doc_id, weight in self.conn.execute(
+                'SELECT doc_id, weight FROM postings WHERE term_id = ? ORDER BY weight DESC LIMIT ?',
+                (row[0], MAX_POSTINGS_PER_TERM)
+            ):
+                scores[doc_id] += term_idf * weight
+
+        # Phrases are required; they also score like a term of their own
+        required: Optional[set] = None
+        for tokens in phrases:
+            matches = self._phrase_matches(tokens)
+            required = set(matches) if required is None else required & set(matches)
+            if not required:
+                return []
+            phrase_idf = idf(len(matches), total_docs)
+            lengths = self._lengths(matches)
+            for doc_id, count in matches.items():
+                scores[doc_id] += phrase_idf * term_weight(count, lengths[doc_id], avgdl or 1.0)
+
+        if required is not None:
+            scores = {doc_id: score for doc_id, score in scores.items() if doc_id in required}
+
+        top = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        paths = self._paths(doc_id for doc_id, _ in top)
+        return [SearchHit(paths[doc_id], score) for doc_id, score in top]
+
+    def _lengths(self, doc_ids: Iterable[int]) -> Dict[int, int]:
+        return self._lookup('length', doc_ids)
+
+    def _paths(self, doc_ids: Iterable[int]) -> Dict[int, str]:
+        return self._lookup('path', doc_ids)
+
+    def _lookup(self, column: str, doc_ids: Iterable[int]) -> Dict:
+        doc_ids = list(doc_ids)
+        values = {}
+        for start in range(0, len(doc_ids), 500):
+            chunk = doc_ids[start:start + 500]
+            values.update(self.conn.execute(
+                f'SELECT id, {column} FROM docs WHERE id IN ({", ".join("?" * len(chunk))})', chunk
+            ))
+        return values
+
+    def add_snippet(self, hit: SearchHit, query: str) -> SearchHit:
+        """Fill in the first line of the hit that contains a query token"""
+        terms, phrases = parse_query(query)
+        wanted = set(terms) | {token for phrase in phrases for token in phrase}
+        try:
+            with open(os.path.join(self.root, hit.path), 'r', encoding='utf-8') as f:
+                for number, line in enumerate(f, 1):
+                    if wanted & set(tokenize(line)):
+                        hit.line, hit.snippet = number, line.strip()
+                        break
+        except (OSError, UnicodeDecodeError):
+            pass
+        return hit
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Search the VOITHER documentation')
+    parser.add_argument('query', nargs='*', help='Search terms; wrap phrases in double quotes')
+    parser.add_argument('--root', default='.', help='Documentation root (default: current directory)')
+    parser.add_argument('--limit', '-n', type=int, default=10, help='Number of results (default: 10)')
+    parser.add_argument('--rebuild', action='store_true', help='Rebuild the search index from scratch')
+    args = parser.parse_args()
+
+    index = DocumentIndex.open(args.root)
+    search = SearchIndex(args.root)
+    try:
+        indexed, removed = search.update(index, full=args.rebuild)
+        if indexed or removed:
+            print(f"🗂️  Search index updated: {indexed} indexed, {removed} removed "
+                  f"({search.total_docs} documents)")
+
+        query = ' '.join(args.query)
+        if not query:
+            return 0
+
+        print(f"🔍 Searching for '{query}'...")
+        hits = search.search(query, args.limit)
+        if not hits:
+            print("No results found")
+        for rank, hit in enumerate(hits, 1):
+            search.add_snippet(hit, query)
+            location = f"{hit.path}:{hit.line}" if hit.line else hit.path
+            print(f"{rank:>3}. {location}  ({hit.score:.2f})")
+            if hit.snippet:
+                print(f"     {hit.snippet[:160]}")
+    finally:
+        search.close()
+        index.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
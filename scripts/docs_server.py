@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+"""
+VOITHER Documentation Server
+Local docs server that renders markdown once and serves it from a cache
+
+Features:
+- Markdown is rendered to HTML into a content-addressed cache under
+  .docs-cache/html; a page is only re-rendered when its content hash changes
+- gzip (and brotli, when the brotli package is installed) variants are
+  precompressed at render time and negotiated via Accept-Encoding
+- Strong ETags with 304 Not Modified for pages and assets
+- Large assets are streamed with sendfile and support Range requests
+- Images built by asset_pipeline.py are served in place of their sources
+  (WebP when the client accepts it) while the build matches the source
+- Threaded front end with HTTP/1.1 keep-alive
+- --bench runs a local load test against an ephemeral instance
+"""
+
+import os
+import re
+import sys
+import gzip
+import html
+import hashlib
+import time
+import argparse
+import mimetypes
+import posixpath
+import threading
+import statistics
+import http.client
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from asset_pipeline import load_manifest, load_settings
+from docs_cache import atomic_write, cache_path, content_hash
+from docs_index import DocumentIndex, PRUNED_DIRS
+
+try:
+    import markdown
+except ImportError:  # pragma: no cover - optional dependency
+    markdown = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+# Bump when the HTML template or renderer changes so cached pages are rebuilt
+RENDER_VERSION = 1
+
+HTML_CACHE = 'html'
+MARKDOWN_EXTENSIONS = ['extra', 'toc', 'sane_lists']
+
+# (suffix, Content-Encoding) in order of preference
+ENCODINGS = [('.br', 'br'), ('.gz', 'gzip')] if brotli else [('.gz', 'gzip')]
+
+RANGE_PATTERN = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+<style>
+body {{ max-width: 52rem; margin: 2rem auto; padding: 0 1rem; font: 16px/1.6 system-ui, sans-serif; color: #1f2328; }}
+pre, code {{ font: 14px ui-monospace, monospace; background: #f6f8fa; }}
+pre {{ padding: 1rem; overflow-x: auto; }}
+table {{ border-collapse: collapse; }} td, th {{ border: 1px solid #d0d7de; padding: .3rem .6rem; }}
+img {{ max-width: 100%; }}
+</style>
+</head>
+<body>
+<nav><a href="/">VOITHER docs</a> / {path}</nav>
+{body}
+</body>
+</html>
+"""
+
+
+def render_markdown(text: str, path: str) -> bytes:
+    """Render a markdown document to a standalone HTML page"""
+    if markdown is not None:
+        body = markdown.markdown(text, extensions=MARKDOWN_EXTENSIONS)
+    else:
+        body = f"<pre>{html.escape(text)}</pre>"
+    title = posixpath.basename(path)
+    for line in text.splitlines():
+        if line.startswith('# '):
+            title = line[2:].strip()
+            break
+    return PAGE_TEMPLATE.format(title=html.escape(title), path=html.escape(path), body=body).encode('utf-8')
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range Range header into an inclusive (start, end)
+
+    Returns None when the header is absent, malformed or asks for several
+    ranges (the full body is served), and (-1, -1) when unsatisfiable.
+    """
+    match = RANGE_PATTERN.match(header.strip()) if header else None
+    if not match or (not match.group(1) and not match.group(2)):
+        return None
+    start, end = match.group(1), match.group(2)
+    if not start:
+        length = int(end)
+        if length == 0:
+            return -1, -1
+        return max(0, size - length), size - 1
+    start = int(start)
+    end = min(int(end), size - 1) if end else size - 1
+    if start >= size or start > end:
+        return -1, -1
+    return start, end
+
+
+class PageCache:
+    """Rendered pages keyed by source hash, with precompressed variants"""
+
+    def __init__(self, root: str):
+        self.root = os.path.abspath(root)
+        self.directory = cache_path(self.root, HTML_CACHE)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # rel path -> (size, mtime_ns, source hash); avoids re-hashing unchanged files
+        self._hashes: Dict[str, Tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+
+    def seed(self, index: DocumentIndex) -> None:
+        """Take known hashes from the document index so startup reads nothing"""
+        for record in index.files():
+            self._hashes[record.path] = (record.size, record.mtime_ns, record.hash)
+
+    def source_hash(self, rel_path: str, stat: os.stat_result) -> str:
+        known = self._hashes.get(rel_path)
+        if known and known[0] == stat.st_size and known[1] == stat.st_mtime_ns:
+            return known[2]
+        with open(os.path.join(self.root, rel_path), 'rb') as f:
+            hasher = hashlib.sha256()
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                hasher.update(chunk)
+            digest = hasher.hexdigest()
+        with self._lock:
+            self._hashes[rel_path] = (stat.st_size, stat.st_mtime_ns, digest)
+        return digest
+
+    def page(self, rel_path: str, stat: os.stat_result) -> Tuple[str, 'os.PathLike']:
+        """(render key, path of the cached HTML), rendering it first if needed"""
+        key = content_hash(f"{RENDER_VERSION}\0{self.source_hash(rel_path, stat)}")[:32]
+        target = self.directory / f"{key}.html"
+        if not target.exists():
+            with open(os.path.join(self.root, rel_path), 'r', encoding='utf-8', errors='replace') as f:
+                page = render_markdown(f.read(), rel_path)
+            # Variants first, so a visible .html always has its siblings
+            atomic_write(self.directory / f"{key}.html.gz", gzip.compress(page, 9, mtime=0))
+            if brotli is not None:
+                atomic_write(self.directory / f"{key}.html.br", brotli.compress(page))
+            atomic_write(target, page)
+        return key, target
+
+    def prerender(self, index: DocumentIndex) -> int:
+        rendered = 0
+        for record in index.markdown():
+            path = os.path.join(self.root, record.path)
+            try:
+                self.page(record.path, os.stat(path))
+                rendered += 1
+            except OSError:
+                continue
+        return rendered
+
+
+class DocsRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    server_version = 'VOITHERDocs/1.0'
+    # Headers and body go out as separate writes; without this keep-alive clients stall on delayed ACKs
+    disable_nagle_algorithm = True
+    cache: PageCache  # set on the subclass created by make_server
+    assets: Dict[str, Dict] = {}  # asset pipeline manifest, path -> entry
+    assets_dir = ''
+    quiet = False
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+    def _resolve(self) -> Optional[str]:
+        """Map the URL path to a relative filesystem path inside the root, or None"""
+        path = posixpath.normpath(unquote(urlsplit(self.path).path)).lstrip('/')
+        if path in ('.', ''):
+            return ''
+        parts = path.split('/')
+        if '..' in parts or any(part in PRUNED_DIRS for part in parts):
+            return None
+        return path
+
+    def do_HEAD(self):
+        self.do_GET(head=True)
+
+    def do_GET(self, head: bool = False):
+        rel_path = self._resolve()
+        if rel_path is None:
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+        full_path = os.path.join(self.cache.root, rel_path)
+        try:
+            stat = os.stat(full_path)
+        except OSError:
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+
+        if os.path.isdir(full_path):
+            self._send_listing(rel_path, head)
+        elif rel_path.endswith('.md') and 'raw' not in parse_qs(urlsplit(self.path).query, keep_blank_values=True):
+            self._send_page(rel_path, stat, head)
+        else:
+            optimized = self._optimized_asset(rel_path, stat)
+            if optimized:
+                self._send_file(*optimized, head, vary='Accept')
+            else:
+                self._send_file(full_path, rel_path, stat, head)
+
+    def _optimized_asset(self, rel_path: str, stat: os.stat_result) -> Optional[Tuple[str, str, os.stat_result]]:
+        """(full path, rel path, stat) of the built image for a source asset, if current"""
+        entry = self.assets.get(rel_path)
+        if not entry or entry['hash'] != self.cache.source_hash(rel_path, stat):
+            return None
+        name = entry['file']
+        if entry.get('webp') and 'image/webp' in self.headers.get('Accept', ''):
+            name = entry['webp']['file']
+        built = posixpath.join(self.assets_dir, name)
+        full_path = os.path.join(self.cache.root, built)
+        try:
+            return full_path, built, os.stat(full_path)
+        except OSError:
+            return None
+
+    def _not_modified(self, etag: str) -> bool:
+        candidates = self.headers.get('If-None-Match')
+        if candidates and (candidates.strip() == '*' or etag in [c.strip() for c in candidates.split(',')]):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return True
+        return False
+
+    def _send_page(self, rel_path: str, stat: os.stat_result, head: bool) -> None:
+        key, target = self.cache.page(rel_path, stat)
+        accepted = self.headers.get('Accept-Encoding', '')
+        body_path, encoding, etag = target, None, f'"{key}"'
+        for suffix, name in ENCODINGS:
+            if name in accepted:
+                body_path, encoding, etag = f"{target}{suffix}", name, f'"{key}-{name}"'
+                break
+
+        if self._not_modified(etag):
+            return
+        with open(body_path, 'rb') as f:
+            body = f.read()
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('Cache-Control', 'no-cache')
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+
+    def _send_file(self, full_path: str, rel_path: str, stat: os.stat_result, head: bool,
+                   vary: Optional[str] = None) -> None:
+        etag = f'"{self.cache.source_hash(rel_path, stat)[:32]}"'
+        if self._not_modified(etag):
+            return
+
+        size = stat.st_size
+        byte_range = None
+        if 'Range' in self.headers and self.headers.get('If-Range', etag) == etag:
+            byte_range = parse_range(self.headers['Range'], size)
+        if byte_range == (-1, -1):
+            self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+            self.send_header('Content-Range', f'bytes */{size}')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        start, end = byte_range or (0, size - 1)
+        length = end - start + 1 if size else 0
+        content_type = mimetypes.guess_type(full_path)[0] or 'application/octet-stream'
+
+        self.send_response(HTTPStatus.PARTIAL_CONTENT if byte_range else HTTPStatus.OK)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(length))
+        self.send_header('Accept-Ranges', 'bytes')
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', 'no-cache')
+        if vary:
+            self.send_header('Vary', vary)
+        if byte_range:
+            self.send_header('Content-Range', f'bytes {start}-{end}/{size}')
+        self.end_headers()
+        if head or not length:
+            return
+
+        with open(full_path, 'rb') as f:
+            # socket.sendfile uses os.sendfile where available: no copy through Python
+            self.connection.sendfile(f, offset=start, count=length)
+
+    def _send_listing(self, rel_path: str, head: bool) -> None:
+        full_path = os.path.join(self.cache.root, rel_path)
+        entries = []
+        for name in sorted(os.listdir(full_path)):
+            if name in PRUNED_DIRS:
+                continue
+            suffix = '/' if os.path.isdir(os.path.join(full_path, name)) else ''
+            href = posixpath.join('/', rel_path, name) + suffix
+            entries.append(f'<li><a href="{html.escape(href)}">{html.escape(name + suffix)}</a></li>')
+        body = PAGE_TEMPLATE.format(
+            title=html.escape(rel_path or 'VOITHER docs'), path=html.escape(rel_path),
+            body=f"<ul>{''.join(entries)}</ul>"
+        ).encode('utf-8')
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+
+
+def make_server(root: str, host: str, port: int, quiet: bool = False) -> ThreadingHTTPServer:
+    cache = PageCache(root)
+    index = DocumentIndex.open(root)
+    try:
+        cache.seed(index)
+        rendered = cache.prerender(index)
+    finally:
+        index.close()
+    if not quiet:
+        print(f"🧾 {rendered} markdown pages ready in {cache.directory}")
+
+    settings = load_settings(root)
+    assets = load_manifest(root, settings)
+    if assets and not quiet:
+        print(f"🖼️  {len(assets)} optimized images from {settings['output_dir']}")
+    handler = type('Handler', (DocsRequestHandler,), {
+        'cache': cache, 'quiet': quiet, 'assets': assets, 'assets_dir': settings['output_dir'].strip('/'),
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def _timed_requests(port: int, requests: List[Tuple[str, Dict[str, str]]]) -> List[float]:
+    """Issue requests over one keep-alive connection; returns latencies in ms"""
+    connection = http.client.HTTPConnection('127.0.0.1', port)
+    latencies = []
+    for path, headers in requests:
+        started = time.perf_counter()
+        connection.request('GET', path, headers=headers)
+        response = connection.getresponse()
+        response.read()
+        latencies.append((time.perf_counter() - started) * 1000)
+    connection.close()
+    return latencies
+
+
+def run_benchmark(root: str, requests: int, concurrency: int) -> Dict[str, Dict[str, float]]:
+    """Load-test an ephemeral server instance with a few request profiles"""
+    server = make_server(root, '127.0.0.1', 0, quiet=True)
+    port = server.server_address[1]
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    index = DocumentIndex.open(root)
+    try:
+        pages = [f"/{record.path}" for record in index.markdown() if not record.path.startswith('raw/')] or ['/']
+        largest = max(index.files(), key=lambda record: record.size, default=None)
+    finally:
+        index.close()
+
+    etag_connection = http.client.HTTPConnection('127.0.0.1', port)
+    etag_connection.request('GET', pages[0], headers={'Accept-Encoding': 'gzip'})
+    response = etag_connection.getresponse()
+    response.read()
+    etag = response.getheader('ETag')
+    etag_connection.close()
+
+    profiles = {
+        'page (gzip)': [(pages[i % len(pages)], {'Accept-Encoding': 'gzip'}) for i in range(requests)],
+        'revalidate (304)': [(pages[0], {'Accept-Encoding': 'gzip', 'If-None-Match': etag})] * requests,
+    }
+    if largest is not None:
+        profiles[f'range 64 KB of {posixpath.basename(largest.path)}'] = [
+            (f"/{largest.path}", {'Range': f"bytes={(i * 65536) % max(1, largest.size - 65536)}-"
+                                            f"{(i * 65536) % max(1, largest.size - 65536) + 65535}"})
+            for i in range(requests)
+        ]
+
+    results = {}
+    for name, profile in profiles.items():
+        batches = [profile[i::concurrency] for i in range(concurrency)]
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            latencies = [ms for batch in pool.map(lambda b: _timed_requests(port, b), batches) for ms in batch]
+        elapsed = time.perf_counter() - started
+        latencies.sort()
+        results[name] = {
+            'requests_per_second': len(latencies) / elapsed,
+            'p50_ms': statistics.median(latencies),
+            'p95_ms': latencies[int(len(latencies) * 0.95) - 1],
+        }
+
+    server.shutdown()
+    server.server_close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve VOITHER documentation with rendered, cached pages')
+    parser.add_argument('directory', nargs='?', default='.',
+                        help='Documentation root (default: current directory)')
+    parser.add_argument('--host', default='127.0.0.1', help='Bind address (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8000, help='Port (default: 8000)')
+    parser.add_argument('--bench', action='store_true', help='Run a local load test and exit')
+    parser.add_argument('--requests', type=int, default=2000, help='Requests per benchmark profile')
+    parser.add_argument('--concurrency', type=int, default=8, help='Concurrent benchmark clients')
+    args = parser.parse_args()
+
+    if args.bench:
+        print(f"🏎️  Benchmarking with {args.requests} requests x {args.concurrency} clients per profile...")
+        for name, result in run_benchmark(args.directory, args.requests, args.concurrency).items():
+            print(f"  {name:<40} {result['requests_per_second']:>8.0f} req/s  "
+                  f"p50 {result['p50_ms']:.2f} ms  p95 {result['p95_ms']:.2f} ms")
+        return 0
+
+    server = make_server(args.directory, args.host, args.port)
+    if markdown is None:
+        print("⚠️  python-markdown not installed - pages are shown as preformatted text")
+    print(f"📡 Server running at http://{args.host}:{args.port}")
+    print("Press Ctrl+C to stop")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+VOITHER Documentation Statistics
+Repository statistics computed in one pass over the shared document index
+
+Features:
+- Per-file line, word and byte counts come from the cached DocumentIndex,
+  so a warm run only stats the tree and never reads file contents
+- Totals per file category, largest files, per-directory breakdown and a
+  size histogram, all from the same pass
+- Human-readable or --json output
+"""
+
+import sys
+import json
+import heapq
+import argparse
+import posixpath
+from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, List, Tuple
+
+from docs_index import DocumentIndex
+from docs_rules import get_engine
+
+CATEGORIES = {
+    'markdown': {'.md'},
+    'python': {'.py'},
+    'images': {'.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp', '.ico'},
+    'video': {'.mp4', '.mov', '.webm'},
+    'config': {'.yml', '.yaml', '.json', '.ini', '.toml', '.cfg'},
+}
+KIND_CATEGORY = {kind: name for name, kinds in CATEGORIES.items() for kind in kinds}
+
+# Upper bounds (exclusive) of the size histogram buckets
+SIZE_BUCKETS: List[Tuple[str, float]] = [
+    ('< 1 KB', 1 << 10),
+    ('1-10 KB', 10 << 10),
+    ('10-100 KB', 100 << 10),
+    ('100 KB-1 MB', 1 << 20),
+    ('1-10 MB', 10 << 20),
+    ('>= 10 MB', float('inf')),
+]
+
+TOP_FILES = 5
+
+
+@dataclass
+class Totals:
+    files: int = 0
+    lines: int = 0
+    words: int = 0
+    bytes: int = 0
+
+    def add(self, size: int, lines: int, words: int) -> None:
+        self.files += 1
+        self.lines += lines
+        self.words += words
+        self.bytes += size
+
+
+@dataclass
+class Statistics:
+    total: Totals = field(default_factory=Totals)
+    categories: Dict[str, Totals] = field(default_factory=dict)
+    directories: Dict[str, Totals] = field(default_factory=dict)
+    histogram: Dict[str, int] = field(default_factory=lambda: {label: 0 for label, _ in SIZE_BUCKETS})
+    largest_markdown: List[Dict[str, Any]] = field(default_factory=list)
+    largest_files: List[Dict[str, Any]] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def category_of(kind: str) -> str:
+    return KIND_CATEGORY.get(kind, 'other')
+
+
+def collect_statistics(index: DocumentIndex, top: int = TOP_FILES) -> Statistics:
+    """Every statistic in one pass over the index"""
+    matcher = get_engine(index.root).matcher
+    stats = Statistics()
+    largest_markdown: List[Tuple[int, str]] = []
+    largest_files: List[Tuple[int, str]] = []
+    pruned: Dict[str, bool] = {}
+
+    for path, kind, size, lines, words in index.summaries():
+        directory = posixpath.dirname(path)
+        if directory not in pruned:
+            pruned[directory] = bool(directory) and matcher.prunes(directory)
+        if pruned[directory]:
+            continue
+
+        lines, words = lines or 0, words or 0
+        stats.total.add(size, lines, words)
+        stats.categories.setdefault(category_of(kind), Totals()).add(size, lines, words)
+        stats.directories.setdefault(path.split('/', 1)[0] if directory else '.', Totals()).add(size, lines, words)
+
+        for label, bound in SIZE_BUCKETS:
+            if size < bound:
+                stats.histogram[label] += 1
+                break
+
+        # Bounded heaps keep the top-N without sorting everything
+        if kind == '.md':
+            entry = (lines, path)
+            if len(largest_markdown) < top:
+                heapq.heappush(largest_markdown, entry)
+            else:
+                heapq.heappushpop(largest_markdown, entry)
+        entry = (size, path)
+        if len(largest_files) < top:
+            heapq.heappush(largest_files, entry)
+        else:
+            heapq.heappushpop(largest_files, entry)
+
+    stats.largest_markdown = [{'path': p, 'lines': n} for n, p in sorted(largest_markdown, reverse=True)]
+    stats.largest_files = [{'path': p, 'bytes': n} for n, p in sorted(largest_files, reverse=True)]
+    stats.directories = dict(sorted(stats.directories.items(), key=lambda item: -item[1].bytes))
+    return stats
+
+
+def format_bytes(size: float) -> str:
+    if size < 1024:
+        return f"{size:.0f} B"
+    for unit in ('KB', 'MB', 'GB'):
+        size /= 1024
+        if size < 1024 or unit == 'GB':
+            break
+    return f"{size:.1f} {unit}"
+
+
+def print_statistics(stats: Statistics) -> None:
+    markdown = stats.categories.get('markdown', Totals())
+    print("📊 VOITHER Documentation Statistics")
+    print("==================================")
+    print(f"Markdown files: {markdown.files}")
+    print(f"Total lines: {markdown.lines:,}")
+    print(f"Total words: {markdown.words:,}")
+    print(f"Python files: {stats.categories.get('python', Totals()).files}")
+    print(f"Image files: {stats.categories.get('images', Totals()).files}")
+    print(f"Video files: {stats.categories.get('video', Totals()).files}")
+    print(f"All files: {stats.total.files} ({format_bytes(stats.total.bytes)})")
+
+    print("\nLargest documents:")
+    for entry in stats.largest_markdown:
+        print(f"  {entry['lines']:>7,} lines  {entry['path']}")
+
+    print("\nLargest files:")
+    for entry in stats.largest_files:
+        print(f"  {format_bytes(entry['bytes']):>10}  {entry['path']}")
+
+    print("\nBy directory:")
+    for name, totals in stats.directories.items():
+        print(f"  {name:<40} {totals.files:>5} files {totals.lines:>9,} lines {format_bytes(totals.bytes):>10}")
+
+    print("\nFile sizes:")
+    widest = max(stats.histogram.values(), default=0) or 1
+    for label, count in stats.histogram.items():
+        bar = '█' * max(1 if count else 0, round(30 * count / widest))
+        print(f"  {label:>12} {count:>6}  {bar}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Show VOITHER documentation statistics')
+    parser.add_argument('directory', nargs='?', default='.',
+                        help='Documentation root (default: current directory)')
+    parser.add_argument('--json', action='store_true', help='Print statistics as JSON')
+    parser.add_argument('--top', type=int, default=TOP_FILES, help='Number of largest files to list')
+    args = parser.parse_args()
+
+    index = DocumentIndex.open(args.directory)
+    try:
+        stats = collect_statistics(index, args.top)
+    finally:
+        index.close()
+
+    if args.json:
+        print(json.dumps(stats.to_dict(), indent=2))
+    else:
+        print_statistics(stats)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
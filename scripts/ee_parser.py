@@ -0,0 +1,1181 @@
+"""
+VOITHER .ee DSL Parser - Urgent Implementation
+Unified language combining .aje, .ire, .e, .Re into single .ee DSL
+Priority: Critical for all VOITHER components
+"""
+
+import re
+import codecs
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterator, List, Any, Optional, Tuple, Union
+from enum import Enum
+
+class EETokenType(Enum):
+    # Core .ee DSL tokens
+    CLINICAL_EVENT = "clinical_event"
+    CORRELATE = "correlate"
+    EXECUTE = "execute"
+    TEMPORAL_MARKER = "temporal"
+    SPATIAL_MARKER = "spatial"
+    EMERGENT_MARKER = "emergent"
+    SEMANTIC_MARKER = "semantic"
+
+    # Legacy DSL integration
+    AJE_CONSTRUCT = "aje_construct"  # From .aje
+    IRE_CONSTRUCT = "ire_construct"  # From .ire
+    E_CONSTRUCT = "e_construct"      # From .e
+    RE_CONSTRUCT = "re_construct"    # From .Re
+
+    # Four Axes integration
+    FOUR_AXES_ANNOTATION = "four_axes"
+
+    # Literals and identifiers
+    STRING = "string"
+    NUMBER = "number"
+    IDENTIFIER = "identifier"
+    OPERATOR = "operator"
+
+# Tokens that open a top-level statement
+STATEMENT_TOKENS = {
+    EETokenType.CLINICAL_EVENT, EETokenType.CORRELATE, EETokenType.EXECUTE,
+    EETokenType.AJE_CONSTRUCT, EETokenType.IRE_CONSTRUCT,
+    EETokenType.E_CONSTRUCT, EETokenType.RE_CONSTRUCT
+}
+
+# Closing delimiter of each legacy construct opener
+LEGACY_CLOSERS = {
+    EETokenType.AJE_CONSTRUCT: "}",
+    EETokenType.IRE_CONSTRUCT: ")",
+    EETokenType.E_CONSTRUCT: "]",
+    EETokenType.RE_CONSTRUCT: ">"
+}
+
+VALUE_TOKENS = {EETokenType.STRING, EETokenType.NUMBER, EETokenType.IDENTIFIER}
+
+# .ee DSL token patterns in priority order: at any position the first pattern
+# that matches wins, even where a later one would match more text
+TOKEN_PATTERNS = [
+    (r'clinical_event\s*\{', EETokenType.CLINICAL_EVENT),
+    (r'correlate\s*\(', EETokenType.CORRELATE),
+    (r'execute\s*\(', EETokenType.EXECUTE),
+    (r'@temporal\[', EETokenType.TEMPORAL_MARKER),
+    (r'@spatial\[', EETokenType.SPATIAL_MARKER),
+    (r'@emergent\[', EETokenType.EMERGENT_MARKER),
+    (r'@semantic\[', EETokenType.SEMANTIC_MARKER),
+    (r'@four_axes\[', EETokenType.FOUR_AXES_ANNOTATION),
+
+    # Legacy DSL integration patterns
+    (r'\.aje\s*\{', EETokenType.AJE_CONSTRUCT),
+    (r'\.ire\s*\(', EETokenType.IRE_CONSTRUCT),
+    (r'\.e\s*\[', EETokenType.E_CONSTRUCT),
+    (r'\.Re\s*<', EETokenType.RE_CONSTRUCT),
+
+    # Basic patterns
+    (r'"[^"]*"', EETokenType.STRING),
+    (r'\d+\.?\d*', EETokenType.NUMBER),
+    (r'[a-zA-Z_][a-zA-Z0-9_]*', EETokenType.IDENTIFIER),
+    (r'[+\-*/=<>!&|]+', EETokenType.OPERATOR),
+]
+
+# Text the tokenizer drops. No token pattern can start with these characters,
+# so skipping a whole run is the same as skipping it one character at a time.
+# `//` stays an operator: comment text has always been tokenized and kept by
+# the parser, and check_delimiters skips comments on its own.
+TRIVIA_PATTERN = r'[\s{}()\[\]:,;]+'
+
+# Anything else no token pattern accepts: runs of characters that cannot start
+# a token, or a single '"', '@' or '.' that starts none (a lone quote, an
+# unknown annotation, a dot outside a legacy construct)
+ERROR_PATTERN = r'[^\sa-zA-Z_\d"@.+\-*/=<>!&|{}()\[\]:,;]+|["@.]'
+
+# Leading trivia, then one token pattern alternative in priority order or an
+# error run. Every match ends in a token or an error, so the scanner steps
+# from token to token and only stops at trailing trivia or the end of input.
+_MASTER_PATTERN = re.compile(
+    f'(?P<TRIVIA>{TRIVIA_PATTERN})?(?:' +
+    '|'.join(f'(?P<{token_type.name}>{pattern})' for pattern, token_type in TOKEN_PATTERNS) +
+    f'|(?P<ERROR>{ERROR_PATTERN}))'
+)
+
+# Compact token type codes, as stored in TokenBuffer.types
+TOKEN_CODES: Dict[EETokenType, int] = {token_type: code for code, token_type in enumerate(EETokenType)}
+_CODE_TYPES: List[EETokenType] = list(EETokenType)
+
+# Scanner match.lastindex -> token type code, None for errors
+_LEXEME_CODES: List[Optional[int]] = [None] * (_MASTER_PATTERN.groups + 1)
+for _, _token_type in TOKEN_PATTERNS:
+    _LEXEME_CODES[_MASTER_PATTERN.groupindex[_token_type.name]] = TOKEN_CODES[_token_type]
+
+_STATEMENT_CODES = frozenset(TOKEN_CODES[token_type] for token_type in STATEMENT_TOKENS)
+_VALUE_CODES = frozenset(TOKEN_CODES[token_type] for token_type in VALUE_TOKENS)
+_IDENTIFIER_CODE = TOKEN_CODES[EETokenType.IDENTIFIER]
+
+# Keys of the dicts tokens used to be, still readable as token["type"] etc.
+TOKEN_FIELDS = ("type", "value", "position", "length")
+
+class Token:
+    """Lightweight view of one token in a TokenBuffer"""
+
+    __slots__ = ("buffer", "index")
+
+    def __init__(self, buffer: "TokenBuffer", index: int):
+        self.buffer = buffer
+        self.index = index
+
+    @property
+    def type(self) -> EETokenType:
+        return _CODE_TYPES[self.buffer.types[self.index]]
+
+    @property
+    def value(self) -> str:
+        return self.buffer.value(self.index)
+
+    @property
+    def position(self) -> int:
+        return self.buffer.base + self.buffer.starts[self.index]
+
+    @property
+    def length(self) -> int:
+        return self.buffer.ends[self.index] - self.buffer.starts[self.index]
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in TOKEN_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __repr__(self) -> str:
+        return f"Token({self.type.name}, {self.value!r}, position={self.position})"
+
+class TokenBuffer:
+    """
+    Tokens of one source text as parallel arrays
+
+    types holds TOKEN_CODES, starts and ends hold offsets into source, and
+    values are sliced from source only when asked for. base is the position
+    of source[0] in the whole input, for buffers over part of a stream.
+    """
+
+    __slots__ = ("source", "base", "types", "starts", "ends")
+
+    def __init__(self, source: str, base: int = 0):
+        self.source = source
+        self.base = base
+        self.types = array("B")
+        self.starts = array("I")
+        self.ends = array("I")
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def __getitem__(self, index: int) -> Token:
+        if index < 0:
+            index += len(self.types)
+        if not 0 <= index < len(self.types):
+            raise IndexError("token index out of range")
+        return Token(self, index)
+
+    def __iter__(self) -> Iterator[Token]:
+        return (Token(self, index) for index in range(len(self.types)))
+
+    def type(self, index: int) -> EETokenType:
+        return _CODE_TYPES[self.types[index]]
+
+    def value(self, index: int) -> str:
+        return self.source[self.starts[index]:self.ends[index]]
+
+    def value_is(self, index: int, text: str) -> bool:
+        """Whether token index reads exactly text, without slicing it out"""
+        start = self.starts[index]
+        return self.ends[index] - start == len(text) and self.source.startswith(text, start)
+
+    def extend(self, other: "TokenBuffer", start: int, stop: int) -> None:
+        """
+        Append tokens [start, stop) of other, a buffer further along the same input
+
+        other.base must fall inside this buffer's text; the text from there
+        on is taken from other.
+        """
+        shift = other.base - self.base
+        self.source = self.source[:shift] + other.source
+        self.types.extend(other.types[start:stop])
+        if shift:
+            self.starts.extend(offset + shift for offset in other.starts[start:stop])
+            self.ends.extend(offset + shift for offset in other.ends[start:stop])
+        else:
+            self.starts.extend(other.starts[start:stop])
+            self.ends.extend(other.ends[start:stop])
+
+def scan(code: str) -> Iterator[Tuple[str, int, int]]:
+    """
+    Yield (kind, start, end) for every lexeme of code
+
+    kind is an EETokenType name for tokens, "TRIVIA" for whitespace and
+    delimiters, and "ERROR" for text that is neither.
+    """
+    end = 0
+    for match in iter(_MASTER_PATTERN.scanner(code).match, None):
+        if match.start("TRIVIA") != -1:
+            yield "TRIVIA", match.start("TRIVIA"), match.end("TRIVIA")
+        yield match.lastgroup, match.start(match.lastindex), match.end()
+        end = match.end()
+    if end < len(code):
+        yield "TRIVIA", end, len(code)
+
+# Characters read from a file-like source at a time
+STREAM_CHUNK_SIZE = 1 << 20
+
+# Statements iter_statements parses into one arena
+STREAM_BATCH = 256
+
+# Longest fixed text a token pattern checks before its `\s*` ("clinical_event"),
+# plus one. The keyword patterns look through whitespace after that prefix for
+# their opening delimiter, so a match near the end of a chunk, or before
+# whitespace that runs to the end, may change once more text arrives.
+_LOOKAHEAD = 16
+
+def _text_chunks(source: Any, chunk_size: int) -> Iterator[str]:
+    """Text of a string, or of anything whose read(size) returns str or bytes (UTF-8)"""
+    if isinstance(source, str):
+        yield source
+        return
+    decoder = None
+    while True:
+        data = source.read(chunk_size)
+        if not data:
+            break
+        if isinstance(data, str):
+            yield data
+            continue
+        if decoder is None:
+            decoder = codecs.getincrementaldecoder("utf-8")()
+        text = decoder.decode(data)
+        if text:
+            yield text
+    if decoder is not None:
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+
+def iter_tokens(source: Union[str, Any], chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[Token]:
+    """
+    Yield the tokens of source one at a time
+
+    source is a string or anything with read(size): an open text or binary
+    file, an io buffer, an mmap. Bytes are decoded as UTF-8 and positions
+    count characters, so tokens match EELanguageParser._tokenize on the
+    decoded text. Only the unscanned tail of the input is kept, so memory
+    stays flat however long the input is; the exception is a stray '"',
+    which holds text back until the next quote, exactly as the tokenizer
+    pairs them.
+    """
+    for tokens in _token_rounds(source, chunk_size):
+        yield from tokens
+
+def _token_rounds(source: Union[str, Any], chunk_size: int) -> Iterator[TokenBuffer]:
+    """
+    Scan source a chunk at a time, yielding each round's settled tokens
+
+    Every round's buffer covers the text from where the previous round
+    stopped, so consecutive buffers can be joined with TokenBuffer.extend.
+    """
+    chunks = _text_chunks(source, chunk_size)
+    lexeme_codes = _LEXEME_CODES
+    buffer = ""
+    offset = 0  # source position of buffer[0]
+    final = False
+
+    while not final:
+        chunk = next(chunks, None)
+        final = chunk is None
+        if chunk:
+            buffer += chunk
+        if final:
+            horizon = limit = len(buffer) + 1
+        else:
+            # Tokens starting at or after the horizon may still grow or change kind
+            limit = len(buffer)
+            horizon = min(limit, len(buffer.rstrip())) - _LOOKAHEAD
+
+        tokens = TokenBuffer(buffer, offset)
+        types, starts, ends = tokens.types, tokens.starts, tokens.ends
+        resume = 0
+        for match in iter(_MASTER_PATTERN.scanner(buffer).match, None):
+            group = match.lastindex
+            start = match.start(group)
+            end = match.end()
+            if start >= horizon or end >= limit:
+                break
+            code = lexeme_codes[group]
+            if code is None:
+                if buffer[start] == '"' and not final:
+                    # An unmatched quote: the string may close in a later chunk
+                    break
+            else:
+                types.append(code)
+                starts.append(start)
+                ends.append(end)
+            resume = end
+
+        yield tokens
+        buffer = buffer[resume:]
+        offset += resume
+
+# Node types the parser produces; other types are registered on first use
+NODE_KINDS: List[str] = [
+    "program", "clinical_event", "correlate", "execute", "legacy_construct",
+    "property", "parameter", "literal", "value"
+]
+_KIND_CODES: Dict[str, int] = {kind: code for code, kind in enumerate(NODE_KINDS)}
+
+# Parent/child/sibling index of "no node"
+NO_NODE = -1
+
+def _kind_code(node_type: str) -> int:
+    code = _KIND_CODES.get(node_type)
+    if code is None:
+        code = _KIND_CODES[node_type] = len(NODE_KINDS)
+        NODE_KINDS.append(node_type)
+    return code
+
+# Value of nodes added without one: an empty dict, created when first read
+_EMPTY_DICT = object()
+
+class ASTArena:
+    """
+    Struct-of-arrays storage for a tree of EEASTNodes
+
+    Nodes are indices. Kind codes (NODE_KINDS) and parent, first-child,
+    next-sibling and last-child links live in flat arrays. A value read
+    from a token is kept as that token's index into the arena's
+    TokenBuffer and sliced when asked for; other values, Four Axes
+    coordinates, metadata and node views live in side tables that only
+    hold entries for the nodes that have them. The parser allocates nodes
+    in document order, so walking a parsed tree reads the arrays front to
+    back. An arena built by parse() also keeps the program's outline for
+    reparse().
+    """
+
+    __slots__ = ("tokens", "kinds", "value_tokens", "values", "parents", "first_children",
+                 "next_siblings", "last_children", "coords", "metadata", "views", "outline")
+
+    def __init__(self, tokens: Optional[TokenBuffer] = None):
+        self.tokens = tokens
+        self.kinds = array("B")
+        self.value_tokens = array("i")
+        self.values: Dict[int, Any] = {}
+        self.parents = array("i")
+        self.first_children = array("i")
+        self.next_siblings = array("i")
+        self.last_children = array("i")
+        self.coords: Dict[int, Tuple[float, float, float, float]] = {}
+        # Metadata dicts, or the TOKEN_CODES of a literal's token until first read
+        self.metadata: Dict[int, Union[Dict[str, Any], int]] = {}
+        self.views: Dict[int, "EEASTNode"] = {}
+        self.outline: Optional[ProgramOutline] = None
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def add(self, node_type: str, value: Any = _EMPTY_DICT, parent: int = NO_NODE, token: int = -1) -> int:
+        """
+        Allocate a node, appended to parent's children unless parent is NO_NODE
+
+        With token, the node's value is that token's text in self.tokens.
+        """
+        index = len(self.kinds)
+        self.kinds.append(_kind_code(node_type))
+        self.value_tokens.append(token)
+        if token < 0 and value is not _EMPTY_DICT:
+            self.values[index] = value
+        self.parents.append(NO_NODE)
+        self.first_children.append(NO_NODE)
+        self.next_siblings.append(NO_NODE)
+        self.last_children.append(NO_NODE)
+        if parent != NO_NODE:
+            self.link(parent, index)
+        return index
+
+    def link(self, parent: int, child: int) -> None:
+        """Append a parentless node to parent's children"""
+        self.parents[child] = parent
+        last = self.last_children[parent]
+        if last == NO_NODE:
+            self.first_children[parent] = child
+        else:
+            self.next_siblings[last] = child
+        self.last_children[parent] = child
+
+    def node_type(self, index: int) -> str:
+        return NODE_KINDS[self.kinds[index]]
+
+    def value(self, index: int) -> Any:
+        token = self.value_tokens[index]
+        if token >= 0:
+            return self.tokens.value(token)
+        value = self.values.get(index, _EMPTY_DICT)
+        if value is _EMPTY_DICT:
+            value = self.values[index] = {}
+        return value
+
+    def set_value(self, index: int, value: Any) -> None:
+        self.value_tokens[index] = -1
+        self.values[index] = value
+
+    def node_metadata(self, index: int) -> Dict[str, Any]:
+        """Metadata of node index, created empty on first read"""
+        metadata = self.metadata.get(index)
+        if metadata is None:
+            metadata = self.metadata[index] = {}
+        elif type(metadata) is int:
+            metadata = self.metadata[index] = {"token_type": _CODE_TYPES[metadata].value}
+        return metadata
+
+    def children(self, index: int) -> Iterator[int]:
+        child = self.first_children[index]
+        next_siblings = self.next_siblings
+        while child != NO_NODE:
+            yield child
+            child = next_siblings[child]
+
+    def walk(self, index: int) -> Iterator[int]:
+        """Preorder indices of the subtree at index"""
+        first_children, next_siblings, parents = self.first_children, self.next_siblings, self.parents
+        node = index
+        while True:
+            yield node
+            child = first_children[node]
+            if child != NO_NODE:
+                node = child
+                continue
+            while node != index and next_siblings[node] == NO_NODE:
+                node = parents[node]
+            if node == index:
+                return
+            node = next_siblings[node]
+
+    def node(self, index: int) -> "EEASTNode":
+        """The view of node index; the same object every time"""
+        view = self.views.get(index)
+        if view is None:
+            view = self.views[index] = EEASTNode._view(self, index)
+        return view
+
+    def adopt(self, node: "EEASTNode") -> int:
+        """
+        Index in this arena of node, to be linked under a parent here
+
+        A parentless node from another arena is moved in with its subtree,
+        and the views already handed out for it are repointed, so callers
+        keep the same objects. A node that already has a parent is copied.
+        """
+        source, index = node.arena, node.index
+        if source is self and self.parents[index] == NO_NODE:
+            return index
+        moved = source.parents[index] == NO_NODE
+        copies: List[Tuple[int, int]] = []
+        root = self._copy(source, index, NO_NODE, copies)
+        if moved:
+            for old, new in copies:
+                view = source.views.pop(old, None)
+                if view is not None:
+                    view.arena, view.index = self, new
+                    self.views[new] = view
+        return root
+
+    def _copy(self, source: "ASTArena", index: int, parent: int, copies: List[Tuple[int, int]]) -> int:
+        new = self.add(source.node_type(index), source.value(index), parent)
+        if index in source.coords:
+            self.coords[new] = source.coords[index]
+        if index in source.metadata:
+            self.metadata[new] = source.metadata[index]
+        copies.append((index, new))
+        for child in list(source.children(index)):
+            self._copy(source, child, new, copies)
+        return new
+
+class EEASTNode:
+    """
+    AST node for .ee DSL with Four Axes annotations
+
+    A view of one node in an ASTArena, with the attributes of the former
+    dataclass. Building one directly gives it an arena of its own;
+    appending it to another node's children moves it into that arena.
+    """
+
+    __slots__ = ("arena", "index")
+    __hash__ = None
+
+    def __init__(self, node_type: str, value: Any,
+                 four_axes_coords: Optional[Tuple[float, float, float, float]] = None,
+                 children: Optional[List["EEASTNode"]] = None,
+                 metadata: Optional[Dict[str, Any]] = None):
+        self.arena = ASTArena()
+        self.index = self.arena.add(node_type, value)
+        self.arena.views[self.index] = self
+        if four_axes_coords is not None:
+            self.arena.coords[self.index] = four_axes_coords
+        if metadata is not None:
+            self.arena.metadata[self.index] = metadata
+        for child in children or ():
+            self.children.append(child)
+
+    @classmethod
+    def _view(cls, arena: ASTArena, index: int) -> "EEASTNode":
+        view = cls.__new__(cls)
+        view.arena = arena
+        view.index = index
+        return view
+
+    @property
+    def node_type(self) -> str:
+        return self.arena.node_type(self.index)
+
+    @node_type.setter
+    def node_type(self, node_type: str) -> None:
+        self.arena.kinds[self.index] = _kind_code(node_type)
+
+    @property
+    def value(self) -> Any:
+        return self.arena.value(self.index)
+
+    @value.setter
+    def value(self, value: Any) -> None:
+        self.arena.set_value(self.index, value)
+
+    @property
+    def four_axes_coords(self) -> Optional[Tuple[float, float, float, float]]:
+        return self.arena.coords.get(self.index)
+
+    @four_axes_coords.setter
+    def four_axes_coords(self, coords: Optional[Tuple[float, float, float, float]]) -> None:
+        if coords is None:
+            self.arena.coords.pop(self.index, None)
+        else:
+            self.arena.coords[self.index] = coords
+
+    @property
+    def children(self) -> "EEChildren":
+        return EEChildren(self)
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        return self.arena.node_metadata(self.index)
+
+    @metadata.setter
+    def metadata(self, metadata: Dict[str, Any]) -> None:
+        self.arena.metadata[self.index] = metadata
+
+    def _fields(self) -> Tuple[Any, ...]:
+        return (self.node_type, self.value, self.four_axes_coords, self.children, self.metadata)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, EEASTNode):
+            return NotImplemented
+        return self is other or self._fields() == other._fields()
+
+    def __repr__(self) -> str:
+        node_type, value, coords, children, metadata = self._fields()
+        return (f"EEASTNode(node_type={node_type!r}, value={value!r}, four_axes_coords={coords!r}, "
+                f"children={list(children)!r}, metadata={metadata!r})")
+
+class EEChildren:
+    """Live, list-like view of a node's children"""
+
+    __slots__ = ("node",)
+
+    def __init__(self, node: EEASTNode):
+        self.node = node
+
+    def __iter__(self) -> Iterator[EEASTNode]:
+        arena = self.node.arena
+        return (arena.node(child) for child in arena.children(self.node.index))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.node.arena.children(self.node.index))
+
+    def __bool__(self) -> bool:
+        return self.node.arena.first_children[self.node.index] != NO_NODE
+
+    def __getitem__(self, index):
+        children = list(self)
+        return children[index]
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (EEChildren, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def append(self, child: EEASTNode) -> None:
+        arena = self.node.arena
+        arena.link(self.node.index, arena.adopt(child))
+
+    def extend(self, children) -> None:
+        for child in list(children):
+            self.append(child)
+
+class ProgramOutline:
+    """
+    Where each top-level statement of a parsed program starts
+
+    starts and ends hold the document offsets of every statement's opening
+    token and nodes the statement's arena index, in program order. A
+    statement's tokens run from its opening token to the next one, which is
+    all reparse() needs to find the statements an edit touches.
+
+    Offsets from index gap on are stored shift characters short, as in an
+    editor's gap buffer: an edit only rewrites the offsets between it and
+    the previous edit, not every offset after it.
+    """
+
+    __slots__ = ("text", "root", "starts", "ends", "nodes", "gap", "shift")
+
+    def __init__(self, text: str, root: int):
+        self.text = text
+        self.root = root
+        self.starts = array("q")
+        self.ends = array("q")
+        self.nodes = array("i")
+        self.gap = 0
+        self.shift = 0
+
+    def offset(self, offsets: array, index: int) -> int:
+        """Document offset of entry index of starts or ends"""
+        return offsets[index] + self.shift if index >= self.gap else offsets[index]
+
+    def find(self, offsets: array, position: int) -> int:
+        """Index of the first entry of starts or ends at or after position"""
+        index = bisect_left(offsets, position, 0, self.gap)
+        if index < self.gap:
+            return index
+        return bisect_left(offsets, position - self.shift, self.gap)
+
+    def splice(self, first: int, resume: int, delta: int,
+               starts: array, ends: array, nodes: array) -> None:
+        """
+        Replace statements [first, resume) with new ones
+
+        starts and ends of the new statements are offsets in the edited
+        text, which is delta characters longer than before from resume on.
+        """
+        gap, shift = self.gap, self.shift
+        head_starts, head_ends = self.starts[:first], self.ends[:first]
+        tail_starts, tail_ends = self.starts[resume:], self.ends[resume:]
+        # Move the gap to the edit: offsets it passes over change storage
+        if gap < first:
+            head_starts[gap:] = array("q", [offset + shift for offset in head_starts[gap:]])
+            head_ends[gap:] = array("q", [offset + shift for offset in head_ends[gap:]])
+        elif gap > resume:
+            moved = gap - resume
+            tail_starts[:moved] = array("q", [offset - shift for offset in tail_starts[:moved]])
+            tail_ends[:moved] = array("q", [offset - shift for offset in tail_ends[:moved]])
+        self.starts = head_starts + starts + tail_starts
+        self.ends = head_ends + ends + tail_ends
+        self.nodes = self.nodes[:first] + nodes + self.nodes[resume:]
+        self.gap = first + len(nodes)
+        self.shift = shift + delta
+
+class EELanguageParser:
+    """
+    .ee DSL Parser - Urgent Production Implementation
+
+    Core Features:
+    - Unifies .aje/.ire/.e/.Re into single .ee syntax
+    - Four Axes coordinate assignment for all constructs
+    - BRRE reasoning engine integration
+    - Clinical workflow native support
+    - Privacy-by-design parsing
+    """
+
+    def __init__(self, four_axes_processor=None):
+        self.four_axes = four_axes_processor
+        self.grammar = self._load_ee_grammar()
+        self.tokens = TokenBuffer("")
+        self.current_token = 0
+        self.arena = ASTArena()
+
+    def parse(self, ee_code: str) -> EEASTNode:
+        """Parse .ee DSL code into AST with Four Axes annotations"""
+
+        # Tokenize
+        self.tokens = self._tokenize(ee_code)
+        self.current_token = 0
+
+        # Parse AST
+        self.arena = ASTArena(self.tokens)
+        ast = self._parse_program()
+
+        # Annotate with Four Axes coordinates
+        if self.four_axes:
+            ast = self._annotate_four_axes(ast)
+
+        return ast
+
+    def iter_statements(self, source: Union[str, Any],
+                        chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[EEASTNode]:
+        """
+        Parse source one top-level statement at a time
+
+        Yields the statements parse() would put under the program node, each
+        annotated with Four Axes coordinates when a processor is configured.
+        Tokens are scanned as for iter_tokens, and completed statements are
+        parsed STREAM_BATCH at a time into an arena of their own, so
+        arbitrarily long event streams parse in memory bounded by the chunk
+        size and the largest statement.
+        """
+
+        pending = None  # tokens from the first statement not yet complete
+        for tokens in _token_rounds(source, chunk_size):
+            types = tokens.types
+            starts = [index for index, code in enumerate(types) if code in _STATEMENT_CODES]
+            if not starts:
+                if pending is not None:
+                    # Also carries the text of rounds that add no statement
+                    pending.extend(tokens, 0, len(types))
+                continue
+            if pending is not None:
+                pending.extend(tokens, 0, starts[0])
+                yield from self._parse_statements(pending)
+            # Tokens ahead of the first statement are skipped by the parser anyway
+            for first in range(0, len(starts) - 1, STREAM_BATCH):
+                batch = TokenBuffer(tokens.source, tokens.base)
+                batch.extend(tokens, starts[first], starts[min(first + STREAM_BATCH, len(starts) - 1)])
+                yield from self._parse_statements(batch)
+            # The last statement may continue in the next round
+            pending = TokenBuffer(tokens.source, tokens.base)
+            pending.extend(tokens, starts[-1], len(types))
+        if pending is not None:
+            yield from self._parse_statements(pending)
+
+    def _parse_statements(self, tokens: TokenBuffer) -> List[EEASTNode]:
+        """
+        Parse the statements of one run of tokens
+
+        A statement body stops at the next statement token, so a run of
+        whole statements parses exactly as it would inside the program.
+        """
+
+        self.tokens = tokens
+        self.current_token = 0
+        # Each run gets its own arena, freed with the statements it yields
+        self.arena = arena = ASTArena(tokens)
+
+        statements = []
+        while self.current_token < len(self.tokens):
+            statement = self._parse_statement()
+            if statement is not None:
+                statement = arena.node(statement)
+                if self.four_axes:
+                    statement = self._annotate_four_axes(statement)
+                statements.append(statement)
+
+        self.tokens = TokenBuffer("")
+        self.current_token = 0
+        self.arena = ASTArena()
+        return statements
+
+    def reparse(self, old_tree: EEASTNode, edit_range: Tuple[int, int], new_text: str) -> EEASTNode:
+        """
+        Update a parsed program after the text in edit_range was replaced by new_text
+
+        old_tree is a program returned by parse() or reparse() and
+        edit_range the (start, end) character offsets of the replaced text in
+        the source it was parsed from. Only the damaged statements are
+        re-tokenized and re-parsed: scanning restarts at the last statement
+        opener the edit cannot reach and stops at the first statement opener
+        past the edit that lines up with an old one. The tree is updated in
+        place and returned, and every statement outside that span keeps its
+        node objects. The result equals parse() of the edited text. A quote
+        that re-pairs the strings after it damages everything up to the end.
+
+        Replaced statements are left detached in the arena; parse() the text
+        again to reclaim them after many edits.
+        """
+
+        arena = old_tree.arena
+        outline = arena.outline
+        if outline is None or outline.root != old_tree.index:
+            raise ValueError("reparse() needs a program returned by parse() or reparse()")
+        old_text = outline.text
+        start, end = edit_range
+        if not 0 <= start <= end <= len(old_text):
+            raise ValueError(f"edit range {edit_range!r} is outside the {len(old_text)}-character program")
+
+        text = old_text[:start] + new_text + old_text[end:]
+        delta = len(new_text) - (end - start)
+        starts, nodes = outline.starts, outline.nodes
+
+        # A token is unaffected when it ends before the edit and starts far
+        # enough ahead that no pattern tried there could look through
+        # whitespace into it (see _LOOKAHEAD). A quote in the new text may
+        # also close the last quote before the edit, if that one was unmatched.
+        horizon = start
+        while horizon and old_text[horizon - 1].isspace():
+            horizon -= 1
+        horizon -= _LOOKAHEAD
+        if '"' in new_text:
+            quote = old_text.rfind('"', 0, start)
+            if quote != -1:
+                horizon = min(horizon, quote)
+        first = min(outline.find(starts, horizon), outline.find(outline.ends, start)) - 1
+        if first < 0:
+            first = restart = 0
+        else:
+            restart = outline.offset(starts, first)
+
+        # Re-scan from there until a statement opener past the edit sits
+        # where an old one did: from that point on the text, and so every
+        # token and statement, is unchanged
+        heap = arena.tokens
+        shift = len(heap.source) - restart
+        types, token_starts, token_ends = array("B"), array("I"), array("I")
+        lexeme_codes = _LEXEME_CODES
+        resume = len(nodes)
+        stop = len(text)
+        floor = start + len(new_text)
+        for match in iter(_MASTER_PATTERN.scanner(text, restart).match, None):
+            group = match.lastindex
+            code = lexeme_codes[group]
+            if code is None:
+                continue
+            token_start = match.start(group)
+            if code in _STATEMENT_CODES and token_start >= floor:
+                old = outline.find(starts, token_start - delta)
+                if old < len(starts) and outline.offset(starts, old) == token_start - delta:
+                    resume, stop = old, token_start
+                    break
+            types.append(code)
+            token_starts.append(token_start + shift)
+            token_ends.append(match.end() + shift)
+
+        # Values of the surviving nodes are read from the old tokens, so the
+        # new ones are appended after them along with the text they cover
+        first_token = len(heap)
+        heap.source += text[restart:stop]
+        heap.types.extend(types)
+        heap.starts.extend(token_starts)
+        heap.ends.extend(token_ends)
+
+        # Detach the damaged statements and parse their replacements in place
+        root = outline.root
+        previous = nodes[first - 1] if first else NO_NODE
+        following = nodes[resume] if resume < len(nodes) else NO_NODE
+        for statement in nodes[first:resume]:
+            arena.parents[statement] = NO_NODE
+            arena.next_siblings[statement] = NO_NODE
+        if previous == NO_NODE:
+            arena.first_children[root] = NO_NODE
+        else:
+            arena.next_siblings[previous] = NO_NODE
+        arena.last_children[root] = previous
+
+        self.tokens = heap
+        self.current_token = first_token
+        self.arena = arena
+        new_starts, new_ends, new_nodes = array("q"), array("q"), array("i")
+        while self.current_token < len(heap):
+            index = self.current_token
+            statement = self._parse_statement()
+            if statement is not None:
+                arena.link(root, statement)
+                new_starts.append(heap.starts[index] - shift)
+                new_ends.append(heap.ends[index] - shift)
+                new_nodes.append(statement)
+                if self.four_axes:
+                    self._annotate_four_axes(arena.node(statement))
+        self.tokens = TokenBuffer("")
+        self.current_token = 0
+        self.arena = ASTArena()
+
+        if following != NO_NODE:
+            last = arena.last_children[root]
+            if last == NO_NODE:
+                arena.first_children[root] = following
+            else:
+                arena.next_siblings[last] = following
+            arena.last_children[root] = nodes[-1]
+
+        outline.text = text
+        outline.splice(first, resume, delta, new_starts, new_ends, new_nodes)
+
+        if self.four_axes:
+            old_tree.four_axes_coords = self.four_axes.calculate_coordinates(old_tree)
+
+        return old_tree
+
+    def _load_ee_grammar(self) -> Dict[str, Any]:
+        """Load the .ee statement grammar"""
+        return {
+            "statements": ["clinical_event", "correlate", "execute"],
+            "legacy_constructs": [".aje", ".ire", ".e", ".Re"],
+            "annotations": ["@temporal", "@spatial", "@emergent", "@semantic", "@four_axes"],
+            "privacy_properties": ["phi_protection", "privacy_level"]
+        }
+
+    def _tokenize(self, code: str) -> TokenBuffer:
+        """Tokenize .ee DSL code in one pass of the master pattern"""
+
+        tokens = TokenBuffer(code)
+        add_type, add_start, add_end = tokens.types.append, tokens.starts.append, tokens.ends.append
+        lexeme_codes = _LEXEME_CODES
+
+        for match in iter(_MASTER_PATTERN.scanner(code).match, None):
+            group = match.lastindex
+            code = lexeme_codes[group]
+            if code is not None:
+                add_type(code)
+                add_start(match.start(group))
+                add_end(match.end())
+
+        return tokens
+
+    def _parse_program(self) -> EEASTNode:
+        """Parse top-level .ee program"""
+
+        arena = self.arena
+        tokens = self.tokens
+        program_node = arena.add("program", "root")
+        arena.outline = outline = ProgramOutline(tokens.source, program_node)
+
+        while self.current_token < len(tokens):
+            index = self.current_token
+            statement = self._parse_statement()
+            if statement is not None:
+                arena.link(program_node, statement)
+                outline.starts.append(tokens.starts[index])
+                outline.ends.append(tokens.ends[index])
+                outline.nodes.append(statement)
+
+        return arena.node(program_node)
+
+    # The _parse_* methods below build nodes in self.arena and return their
+    # indices; a statement is left without a parent for the caller to link
+
+    def _parse_statement(self) -> Optional[int]:
+        """Parse individual .ee statement"""
+
+        if self.current_token >= len(self.tokens):
+            return None
+
+        token_type = self.tokens.type(self.current_token)
+
+        if token_type == EETokenType.CLINICAL_EVENT:
+            return self._parse_clinical_event()
+        elif token_type == EETokenType.CORRELATE:
+            return self._parse_correlate()
+        elif token_type == EETokenType.EXECUTE:
+            return self._parse_execute()
+        elif token_type in LEGACY_CLOSERS:
+            return self._parse_legacy_construct()
+        else:
+            # Skip unknown tokens
+            self.current_token += 1
+            return None
+
+    def _at_statement_end(self, closing: str) -> bool:
+        """A statement body ends at its closing delimiter or where the next statement begins"""
+        index = self.current_token
+        types = self.tokens.types
+        if index >= len(types):
+            return True
+        return types[index] in _STATEMENT_CODES or self.tokens.value_is(index, closing)
+
+    def _parse_clinical_event(self) -> int:
+        """Parse clinical_event construct"""
+
+        self.current_token += 1  # Skip 'clinical_event{'
+
+        event_node = self.arena.add("clinical_event")
+
+        # Parse event properties
+        while not self._at_statement_end("}"):
+            self._parse_property(event_node)
+
+        return event_node
+
+    def _parse_correlate(self) -> int:
+        """Parse correlate construct"""
+
+        self.current_token += 1  # Skip 'correlate('
+
+        correlate_node = self.arena.add("correlate")
+
+        # Parse correlation parameters
+        while not self._at_statement_end(")"):
+            self._parse_parameter(correlate_node)
+
+        return correlate_node
+
+    def _parse_execute(self) -> int:
+        """Parse execute construct"""
+
+        self.current_token += 1  # Skip 'execute('
+
+        execute_node = self.arena.add("execute")
+
+        # Parse execution parameters
+        while not self._at_statement_end(")"):
+            self._parse_parameter(execute_node)
+
+        return execute_node
+
+    def _parse_legacy_construct(self) -> int:
+        """Parse .aje/.ire/.e/.Re construct carried over from the legacy DSLs"""
+
+        token_type = self.tokens.type(self.current_token)
+        self.current_token += 1  # Skip construct opener
+
+        legacy_node = self.arena.add("legacy_construct", token_type.value)
+
+        while not self._at_statement_end(LEGACY_CLOSERS[token_type]):
+            self._parse_parameter(legacy_node)
+
+        return legacy_node
+
+    def _parse_property(self, parent: int) -> int:
+        """Parse `key: value` property inside a clinical_event body"""
+        return self._parse_pair("property", parent)
+
+    def _parse_parameter(self, parent: int) -> int:
+        """Parse `name: value` parameter inside correlate/execute/legacy constructs"""
+        return self._parse_pair("parameter", parent)
+
+    def _parse_pair(self, node_type: str, parent: int) -> int:
+        """Parse an identifier followed by an optional value under parent; always consumes a token"""
+
+        tokens = self.tokens
+        arena = self.arena
+        index = self.current_token
+        self.current_token += 1
+
+        if tokens.types[index] != _IDENTIFIER_CODE:
+            # Operators, annotations and stray literals are kept as bare values
+            literal_node = arena.add("literal", parent=parent, token=index)
+            arena.metadata[literal_node] = tokens.types[index]  # {"token_type": ...} once read
+            return literal_node
+
+        pair_node = arena.add(node_type, parent=parent, token=index)
+
+        if self.current_token < len(tokens.types):
+            if tokens.types[self.current_token] in _VALUE_CODES:
+                arena.add("value", parent=pair_node, token=self.current_token)
+                self.current_token += 1
+
+        return pair_node
+
+    def _annotate_four_axes(self, ast: EEASTNode) -> EEASTNode:
+        """Annotate AST with Four Axes coordinates"""
+
+        if self.four_axes:
+            ast.four_axes_coords = self.four_axes.calculate_coordinates(ast)
+
+        # Recursively annotate children
+        for child in ast.children:
+            self._annotate_four_axes(child)
+
+        return ast
+
+    def validate(self, ast: EEASTNode) -> Dict[str, Any]:
+        """Validate .ee DSL AST for correctness and compliance"""
+
+        validation_result = {
+            "valid": True,
+            "errors": [],
+            "warnings": [],
+            "four_axes_coverage": 0.0,
+            "legacy_constructs_count": 0,
+            "privacy_compliance": True
+        }
+
+        # Validate AST structure
+        self._validate_ast_structure(ast, validation_result)
+
+        # Validate Four Axes annotations
+        self._validate_four_axes_coverage(ast, validation_result)
+
+        # Check privacy compliance
+        self._validate_privacy_compliance(ast, validation_result)
+
+        return validation_result
+
+    def _validate_ast_structure(self, ast: EEASTNode, validation_result: Dict[str, Any]) -> None:
+        """Check that every statement carries a body"""
+
+        arena = ast.arena
+        for statement in arena.children(ast.index):
+            node_type = arena.node_type(statement)
+            if node_type == "legacy_construct":
+                validation_result["legacy_constructs_count"] += 1
+            elif arena.first_children[statement] == NO_NODE:
+                validation_result["warnings"].append(f"Empty {node_type} statement")
+
+    def _validate_four_axes_coverage(self, ast: EEASTNode, validation_result: Dict[str, Any]) -> None:
+        """Fraction of nodes annotated with Four Axes coordinates"""
+
+        coords = ast.arena.coords
+        total = annotated = 0
+        for node in ast.arena.walk(ast.index):
+            total += 1
+            if node in coords:
+                annotated += 1
+
+        validation_result["four_axes_coverage"] = annotated / total if total else 0.0
+
+    def _validate_privacy_compliance(self, ast: EEASTNode, validation_result: Dict[str, Any]) -> None:
+        """Flag statements that explicitly disable PHI protection"""
+
+        arena = ast.arena
+        first_children = arena.first_children
+        privacy_properties = set(self.grammar["privacy_properties"])
+        for statement in arena.children(ast.index):
+            for child in arena.children(statement):
+                value = arena.value(child)
+                if value in privacy_properties and first_children[child] != NO_NODE:
+                    if str(arena.value(first_children[child])).strip('"').lower() in ("none", "disabled", "off"):
+                        validation_result["privacy_compliance"] = False
+                        validation_result["valid"] = False
+                        validation_result["errors"].append(
+                            f"{arena.node_type(statement)} disables {value}"
+                        )
+
+def check_delimiters(code: str) -> List[str]:
+    """Report unbalanced (), [], {} and unterminated strings, skipping // comments"""
+
+    pairs = {")": "(", "]": "[", "}": "{"}
+    stack: List[Tuple[str, int]] = []
+    errors = []
+    line = 1
+    position = 0
+
+    while position < len(code):
+        char = code[position]
+        if char == "\n":
+            line += 1
+        elif char == "/" and code.startswith("//", position):
+            end = code.find("\n", position)
+            position = len(code) if end == -1 else end
+            continue
+        elif char == '"':
+            end = code.find('"', position + 1)
+            newline = code.find("\n", position + 1)
+            if end == -1 or (newline != -1 and newline < end):
+                errors.append(f"line {line}: unterminated string")
+                position = len(code) if newline == -1 else newline
+                continue
+            position = end
+        elif char in "([{":
+            stack.append((char, line))
+        elif char in pairs:
+            if not stack or stack[-1][0] != pairs[char]:
+                errors.append(f"line {line}: unexpected '{char}'")
+            else:
+                stack.pop()
+        position += 1
+
+    for opener, opened_at in stack:
+        errors.append(f"line {opened_at}: unclosed '{opener}'")
+
+    return errors
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+VOITHER Frontmatter Rewriter
+Fills in missing frontmatter fields without reformatting anything else
+
+Features:
+- Patches are planned from the shared document index, so files that already
+  have every field are never opened
+- Only the frontmatter lines that change are spliced in; existing keys,
+  comments, quoting and the document body keep their exact bytes
+- Every write goes through a temp file + rename
+- last_updated comes from the file's last commit (one `git log` stream for
+  the whole tree), falling back to today for untracked files
+- Large batches run across a process pool
+- --dry-run prints a unified diff instead of writing
+"""
+
+import os
+import re
+import sys
+import json
+import difflib
+import argparse
+import posixpath
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from docs_cache import atomic_write, content_hash
+from docs_index import DocumentIndex, FileRecord
+from docs_rules import get_engine, split_frontmatter
+from git_history import GitHistory
+
+# Below this many files the pool start-up costs more than it saves
+POOL_THRESHOLD = 64
+
+WORDS_PER_MINUTE = 250
+
+FRONTMATTER_OPEN = re.compile(r'---[ \t]*(\r?\n)')
+FRONTMATTER_CLOSE = re.compile(r'^---[ \t]*\r?$', re.MULTILINE)
+TOP_LEVEL_KEY = re.compile(r'^(?P<key>[A-Za-z_][\w-]*)[ \t]*:(?P<value>.*)$')
+
+
+def _title(record: FileRecord, metadata: Dict[str, Any], today: str) -> str:
+    return posixpath.splitext(posixpath.basename(record.path))[0].replace('_', ' ').title()
+
+
+def _description(record: FileRecord, metadata: Dict[str, Any], today: str) -> str:
+    return f"Documentation for {metadata.get('title') or _title(record, metadata, today)}"
+
+
+def _reading_time(record: FileRecord, metadata: Dict[str, Any], today: str) -> str:
+    minutes = max(1, round((record.body_words or 0) / WORDS_PER_MINUTE))
+    return f"{minutes} minute{'s' if minutes != 1 else ''}"
+
+
+# Fields filled in when missing or empty, in the order they are appended
+DEFAULT_FIELDS: List[Tuple[str, Callable[[FileRecord, Dict[str, Any], str], Any]]] = [
+    ('title', _title),
+    ('description', _description),
+    ('version', lambda record, metadata, today: "1.0"),
+    ('last_updated', lambda record, metadata, today: today),
+    ('audience', lambda record, metadata, today: ["general"]),
+    ('priority', lambda record, metadata, today: "important"),
+    ('reading_time', _reading_time),
+    ('tags', lambda record, metadata, today: ["documentation"]),
+]
+
+
+@dataclass
+class Patch:
+    """Frontmatter values to add to one document"""
+    path: str
+    hash: str                        # content hash the patch was planned against
+    values: Dict[str, Any] = field(default_factory=dict)
+    has_frontmatter: bool = True
+
+
+def format_value(value: Any) -> str:
+    """Render a value in the repo's frontmatter style: "quoted" strings, ["flow"] lists"""
+    return json.dumps(value, ensure_ascii=False)
+
+
+def plan_patch(record: FileRecord, today: str) -> Optional[Patch]:
+    """Work out the missing fields of one document from its index record"""
+    metadata = dict(record.frontmatter)
+    values: Dict[str, Any] = {}
+    for name, default in DEFAULT_FIELDS:
+        if not metadata.get(name):
+            values[name] = metadata[name] = default(record, metadata, today)
+    if not values:
+        return None
+    return Patch(record.path, record.hash, values, record.body_offset > 0)
+
+
+def splice_frontmatter(text: str, values: Dict[str, Any]) -> str:
+    """
+    Set values in the frontmatter block of text, touching nothing else
+
+    Keys that exist with an empty value have their line replaced in place;
+    new keys are appended just before the closing `---`. A document without
+    frontmatter gets a new block with only the given keys.
+    """
+    opening = FRONTMATTER_OPEN.match(text)
+    if not opening:
+        newline = '\r\n' if '\r\n' in text[:4096] else '\n'
+        block = ''.join(f"{key}: {format_value(value)}{newline}" for key, value in values.items())
+        return f"---{newline}{block}---{newline}{newline}{text}"
+
+    newline = opening.group(1)
+    closing = FRONTMATTER_CLOSE.search(text, opening.end())
+    if closing is None:
+        raise ValueError("unterminated frontmatter block")
+
+    lines = text[opening.end():closing.start()].splitlines(keepends=True)
+    pending = dict(values)
+    for i, line in enumerate(lines):
+        match = TOP_LEVEL_KEY.match(line.rstrip('\r\n'))
+        if not match or match.group('key') not in pending:
+            continue
+        # A value continued on indented lines is not empty; leave it alone
+        following = lines[i + 1] if i + 1 < len(lines) else ''
+        if following[:1] in (' ', '\t', '-'):
+            pending.pop(match.group('key'))
+            continue
+        key = match.group('key')
+        ending = line[len(line.rstrip('\r\n')):] or newline
+        lines[i] = f"{key}: {format_value(pending.pop(key))}{ending}"
+
+    if lines and not lines[-1].endswith('\n'):
+        lines[-1] += newline
+    lines.extend(f"{key}: {format_value(value)}{newline}" for key, value in pending.items())
+
+    return text[:opening.end()] + ''.join(lines) + text[closing.start():]
+
+
+def _rewrite_job(job: Tuple[str, Patch, bool]) -> Tuple[str, str, str]:
+    """Apply one patch; returns (path, status, diff)"""
+    root, patch, dry_run = job
+    path = os.path.join(root, patch.path)
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+        if content_hash(data) != patch.hash:
+            return patch.path, 'skipped: changed since it was indexed', ''
+        text = data.decode('utf-8')
+
+        if not patch.has_frontmatter and text.startswith('---'):
+            return patch.path, 'skipped: frontmatter block could not be parsed', ''
+
+        updated = splice_frontmatter(text, patch.values)
+        if not patch.values.keys() <= split_frontmatter(updated)[0].keys():
+            return patch.path, 'skipped: patched frontmatter did not parse', ''
+    except (OSError, UnicodeDecodeError, ValueError) as e:
+        return patch.path, f'error: {e}', ''
+
+    diff = ''
+    if dry_run:
+        diff = ''.join(difflib.unified_diff(
+            text.splitlines(keepends=True), updated.splitlines(keepends=True),
+            fromfile=f"a/{patch.path}", tofile=f"b/{patch.path}"
+        ))
+    else:
+        atomic_write(path, updated.encode('utf-8'))
+    return patch.path, 'updated', diff
+
+
+class FrontmatterRewriter:
+    """Plans frontmatter patches from the document index and applies them in batches"""
+
+    def __init__(self, root: str = '.', workers: Optional[int] = None):
+        self.root = os.path.abspath(root)
+        self.workers = workers
+        self.engine = get_engine(self.root)
+
+    def plan(self, index: DocumentIndex, today: Optional[str] = None,
+             history: Optional[GitHistory] = None) -> List[Patch]:
+        today = today or datetime.now().strftime('%Y-%m-%d')
+        patches = []
+        for record in index.markdown():
+            if not self.engine.matcher.matches(record.path):
+                continue
+            # The date stamped into last_updated: the last commit touching the file
+            date = (history.last_updated(record.path) if history else None) or today
+            patch = plan_patch(record, date)
+            if patch is not None:
+                patches.append(patch)
+        return patches
+
+    def apply(self, patches: List[Patch], dry_run: bool = False) -> List[Tuple[str, str, str]]:
+        jobs = [(self.root, patch, dry_run) for patch in patches]
+        if len(jobs) >= POOL_THRESHOLD and self.workers != 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                return list(pool.map(_rewrite_job, jobs, chunksize=32))
+        return [_rewrite_job(job) for job in jobs]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Add missing frontmatter fields to VOITHER documentation')
+    parser.add_argument('directory', nargs='?', default='.',
+                        help='Documentation root (default: current directory)')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Print a unified diff instead of writing files')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes (default: CPU count)')
+    args = parser.parse_args()
+
+    rewriter = FrontmatterRewriter(args.directory, args.workers)
+    history = GitHistory.open(rewriter.root)
+    index = DocumentIndex.open(rewriter.root)
+    try:
+        patches = rewriter.plan(index, history=history if history.head else None)
+    finally:
+        index.close()
+
+    print(f"🏷️  {len(patches)} documents need frontmatter fields")
+    results = rewriter.apply(patches, dry_run=args.dry_run)
+
+    updated = 0
+    for path, status, diff in results:
+        if status == 'updated':
+            updated += 1
+            if args.dry_run:
+                sys.stdout.write(diff)
+            else:
+                print(f"  ✅ {path}")
+        else:
+            print(f"  ⚠️  {path}: {status}")
+
+    verb = 'would be updated' if args.dry_run else 'updated'
+    print(f"\n📊 {updated} documents {verb}, {len(results) - updated} skipped")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+VOITHER Git History
+Per-path history metadata folded from a single `git log` stream
+
+Features:
+- One `git log --name-status` subprocess covers the whole history: last
+  commit, last modified date, authors and change count for every path
+- Renames carry a file's history to its new path; deleted paths drop out
+- The folded map is persisted under .docs-cache/ together with the last
+  processed commit, so later runs only stream the new commits
+- Used for accurate `last_updated` values and churn hotspots
+"""
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+from dataclasses import dataclass, field, asdict
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from docs_cache import atomic_write, cache_path
+
+STATE_FILE = 'git_history.json'
+# Bump when the shape of the persisted map changes
+STATE_VERSION = 1
+
+RECORD = '\x1e'
+FIELD = '\x1f'
+LOG_FORMAT = '%x1e%H%x1f%aI%x1f%aN'
+
+CHUNK_SIZE = 1 << 16
+
+
+@dataclass
+class FileHistory:
+    """History of one path as of the last processed commit"""
+    commit: str = ''         # last commit touching the path
+    date: str = ''           # author date of that commit (ISO 8601)
+    author: str = ''         # author of that commit
+    created: str = ''        # date the path was added (or first seen)
+    changes: int = 0         # commits that touched the path
+    authors: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def day(self) -> str:
+        """The last modified date as YYYY-MM-DD"""
+        return self.date[:10]
+
+
+@dataclass
+class Commit:
+    sha: str
+    date: str
+    author: str
+    changes: List[Tuple[str, ...]]  # (status, path) or (status, old path, new path)
+
+
+def _git(root: str, *args: str) -> Optional[str]:
+    try:
+        result = subprocess.run(['git', '-C', root, *args], capture_output=True, text=True)
+    except OSError:
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def _parse_record(record: str) -> Optional[Commit]:
+    header, _, body = record.partition('\0')
+    parts = header.split(FIELD)
+    if len(parts) != 3:
+        return None
+    tokens = body.lstrip('\n').split('\0')
+    changes = []
+    index = 0
+    while index < len(tokens) and tokens[index]:
+        status = tokens[index]
+        # Renames and copies name two paths, everything else one
+        width = 3 if status[:1] in ('R', 'C') else 2
+        changes.append(tuple([status[:1]] + tokens[index + 1:index + width]))
+        index += width
+    return Commit(parts[0], parts[1], parts[2], changes)
+
+
+def stream_commits(root: str, since: Optional[str] = None) -> Iterator[Commit]:
+    """Commits oldest first, streamed from one `git log` process"""
+    command = ['git', '-C', root, '-c', 'core.quotepath=off', 'log', '--reverse', '-z',
+               '--name-status', '-M', '--relative', f'--format={LOG_FORMAT}']
+    command.append(f'{since}..HEAD' if since else 'HEAD')
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                               encoding='utf-8', errors='surrogateescape')
+    buffer = ''
+    try:
+        while True:
+            chunk = process.stdout.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            buffer += chunk
+            records = buffer.split(RECORD)
+            buffer = records.pop()
+            for record in records:
+                commit = _parse_record(record) if record else None
+                if commit:
+                    yield commit
+        if buffer:
+            commit = _parse_record(buffer)
+            if commit:
+                yield commit
+    finally:
+        process.stdout.close()
+        process.wait()
+
+
+class GitHistory:
+    """path -> FileHistory, kept current with the repository HEAD"""
+
+    def __init__(self, root: str = '.'):
+        self.root = os.path.abspath(root)
+        self.state_path = cache_path(self.root, STATE_FILE)
+        self.head: Optional[str] = None
+        self.files: Dict[str, FileHistory] = {}
+        self.commits = 0
+        self.shallow = False
+
+    @classmethod
+    def open(cls, root: str = '.', update: bool = True) -> 'GitHistory':
+        history = cls(root)
+        history.load()
+        if update:
+            history.update()
+        return history
+
+    def load(self) -> None:
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return
+        if state.get('version') != STATE_VERSION:
+            return
+        self.head = state.get('head')
+        self.commits = state.get('commits', 0)
+        self.files = {path: FileHistory(**data) for path, data in state.get('files', {}).items()}
+
+    def save(self) -> None:
+        state = {
+            'version': STATE_VERSION,
+            'head': self.head,
+            'commits': self.commits,
+            'files': {path: asdict(entry) for path, entry in self.files.items()},
+        }
+        atomic_write(self.state_path, json.dumps(state, ensure_ascii=False))
+
+    def update(self) -> int:
+        """Fold in commits made since the last run; returns how many were processed"""
+        head = _git(self.root, 'rev-parse', 'HEAD')
+        if head is None:
+            return 0  # not a git checkout
+        self.shallow = _git(self.root, 'rev-parse', '--is-shallow-repository') == 'true'
+        if head == self.head:
+            return 0
+
+        since = self.head
+        # A rewritten history (rebase, force push) invalidates the folded map
+        if since and _git(self.root, 'merge-base', '--is-ancestor', since, head) is None:
+            since = None
+        if since is None:
+            self.files = {}
+            self.commits = 0
+
+        processed = 0
+        for commit in stream_commits(self.root, since):
+            self.apply(commit)
+            processed += 1
+        self.head = head
+        self.commits += processed
+        self.save()
+        return processed
+
+    def apply(self, commit: Commit) -> None:
+        for change in commit.changes:
+            status, path = change[0], change[-1]
+            if status == 'D':
+                self.files.pop(path, None)
+                continue
+            if status == 'R':
+                entry = self.files.pop(change[1], None) or FileHistory()
+            elif status == 'C':
+                entry = FileHistory()
+            else:
+                entry = self.files.get(path) or FileHistory()
+            if not entry.created:
+                entry.created = commit.date
+            entry.commit = commit.sha
+            entry.date = commit.date
+            entry.author = commit.author
+            entry.changes += 1
+            entry.authors[commit.author] = entry.authors.get(commit.author, 0) + 1
+            self.files[path] = entry
+
+    def get(self, path: str) -> Optional[FileHistory]:
+        return self.files.get(path)
+
+    def last_updated(self, path: str) -> Optional[str]:
+        """YYYY-MM-DD of the last commit touching path, if it is tracked"""
+        entry = self.files.get(path)
+        return entry.day if entry else None
+
+    def hotspots(self, count: int = 10, prefix: str = '') -> List[Tuple[str, FileHistory]]:
+        """Paths with the most changes"""
+        entries = [(path, entry) for path, entry in self.files.items() if path.startswith(prefix)]
+        entries.sort(key=lambda item: (-item[1].changes, item[0]))
+        return entries[:count]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Per-file git history: last change, authors and churn')
+    parser.add_argument('directory', nargs='?', default='.',
+                        help='Repository root (default: current directory)')
+    parser.add_argument('--path', action='append', default=[], dest='paths',
+                        help='Show the history of this path (repeatable)')
+    parser.add_argument('--top', type=int, default=10, help='Number of churn hotspots to list')
+    parser.add_argument('--prefix', default='', help='Only list hotspots under this path prefix')
+    parser.add_argument('--json', action='store_true', help='Print the per-path map as JSON')
+    args = parser.parse_args()
+
+    history = GitHistory(args.directory)
+    history.load()
+    processed = history.update()
+    if history.head is None:
+        print("⚠️  Not a git repository")
+        return 0
+
+    if args.json:
+        print(json.dumps({path: asdict(entry) for path, entry in sorted(history.files.items())},
+                         indent=2, ensure_ascii=False))
+        return 0
+
+    print(f"📜 {len(history.files)} tracked paths over {history.commits} commits "
+          f"({processed} new since the last run)")
+    if history.shallow:
+        print("⚠️  Shallow clone: dates and change counts only cover the fetched history")
+
+    for path in args.paths:
+        entry = history.get(path)
+        if entry is None:
+            print(f"  ❔ {path}: not tracked")
+            continue
+        authors = ', '.join(f"{name} ({n})" for name, n in sorted(entry.authors.items(), key=lambda a: -a[1]))
+        print(f"  📄 {path}: last changed {entry.day} by {entry.author} ({entry.commit[:8]}), "
+              f"{entry.changes} changes since {entry.created[:10]}; authors: {authors}")
+
+    if not args.paths:
+        print("\n🔥 Churn hotspots:")
+        for path, entry in history.hotspots(args.top, args.prefix):
+            print(f"  {entry.changes:>5}  {entry.day}  {path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""
+VOITHER Documentation Index Generator
+Keeps docs/DOCUMENTATION_INDEX.md and docs/TABLE_OF_CONTENTS.md up to date
+
+Features:
+- Per-file stats come from the shared document index (cached by content hash)
+- Totals are updated as deltas from the files changed since the last run
+- Both pages are split into marker-delimited sections, one per directory,
+  and only the sections containing changed files are re-rendered
+- A full regeneration happens only on first run, after an index rebuild,
+  or when a page has lost its section markers
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+import posixpath
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from docs_cache import atomic_write, cache_path
+from docs_index import DocumentIndex, FileRecord, MARKDOWN_SUFFIXES
+from docs_rules import get_engine
+
+STATE_VERSION = 1
+STATE_FILE = 'index_generator.json'
+
+DOCS_DIR = 'docs'
+STATISTICS = 'statistics'
+SECTION_PREFIX = 'dir:'
+
+SECTION_BLOCK = re.compile(
+    r'<!-- section: (?P<name>[^>]+?) -->\n.*?<!-- /section: (?P=name) -->\n?', re.DOTALL
+)
+LAST_UPDATED = re.compile(r'^last_updated: .*$', re.MULTILINE)
+
+WORDS_PER_MINUTE = 200
+
+
+def github_anchor(text: str) -> str:
+    """Heading anchor as generated by GitHub's markdown renderer"""
+    text = re.sub(r'[^\w\- ]', '', text.strip().lower())
+    return text.replace(' ', '-')
+
+
+def _cell(value: Any) -> str:
+    if isinstance(value, (list, tuple)):
+        value = ', '.join(str(v) for v in value)
+    return str(value or '').replace('|', '\\|').replace('\n', ' ')
+
+
+def section_of(path: str) -> str:
+    return SECTION_PREFIX + (posixpath.dirname(path) or '.')
+
+
+def document_title(record: FileRecord) -> str:
+    title = record.frontmatter.get('title')
+    if title:
+        return str(title)
+    for heading in record.headings:
+        if heading['level'] == 1:
+            return heading['text']
+    return posixpath.splitext(posixpath.basename(record.path))[0]
+
+
+def reading_time(record: FileRecord) -> str:
+    declared = record.frontmatter.get('reading_time')
+    if declared:
+        return str(declared)
+    minutes = max(1, round((record.body_words or 0) / WORDS_PER_MINUTE))
+    return f"{minutes} minute{'s' if minutes != 1 else ''}"
+
+
+class Page:
+    """A generated page made of free text and named, marker-delimited sections"""
+
+    def __init__(self, text: str):
+        self.parts: List[Tuple[Optional[str], str]] = []
+        position = 0
+        for match in SECTION_BLOCK.finditer(text):
+            if match.start() > position:
+                self.parts.append((None, text[position:match.start()]))
+            self.parts.append((match.group('name'), match.group(0)))
+            position = match.end()
+        if position < len(text):
+            self.parts.append((None, text[position:]))
+
+    @property
+    def sections(self) -> Set[str]:
+        return {name for name, _ in self.parts if name}
+
+    def replace(self, name: str, body: Optional[str]) -> None:
+        """Replace, insert or drop a section; directories stay sorted after the other sections"""
+        block = f"<!-- section: {name} -->\n{body}<!-- /section: {name} -->\n" if body is not None else None
+        for i, (existing, _) in enumerate(self.parts):
+            if existing == name:
+                if block is None:
+                    del self.parts[i]
+                else:
+                    self.parts[i] = (name, block)
+                return
+        if block is None:
+            return
+
+        position = None
+        for i, (existing, _) in enumerate(self.parts):
+            if existing and existing.startswith(SECTION_PREFIX):
+                if not name.startswith(SECTION_PREFIX) or existing > name:
+                    position = i
+                    break
+                position = i + 1
+        if position is None:
+            position = len(self.parts)
+        self.parts.insert(position, (name, block + '\n'))
+
+    def touch(self, date: str) -> None:
+        """Update last_updated in the frontmatter block"""
+        name, text = self.parts[0]
+        if name is None and text.startswith('---'):
+            self.parts[0] = (None, LAST_UPDATED.sub(f'last_updated: "{date}"', text, count=1))
+
+    def render(self) -> str:
+        return ''.join(text for _, text in self.parts)
+
+
+class IndexGenerator:
+    """Maintains the index and table of contents pages from document index changes"""
+
+    def __init__(self, root: str = '.'):
+        self.root = os.path.abspath(root)
+        self.engine = get_engine(self.root)
+        documentation = self.engine.config.get('documentation') or {}
+        generation = self.engine.config.get('generation') or {}
+
+        self.index_path = posixpath.join(DOCS_DIR, documentation.get('index_file', 'DOCUMENTATION_INDEX.md'))
+        self.toc_path = posixpath.join(DOCS_DIR, documentation.get('nav_file', 'TABLE_OF_CONTENTS.md'))
+        self.toc_options = generation.get('toc') or {}
+        self.index_options = generation.get('index') or {}
+        self.generated = {
+            name for name in documentation.get('auto_generated') or [] if not name.endswith('/')
+        }
+
+        self.state_path = cache_path(self.root, STATE_FILE)
+        self.state = self._load_state()
+
+    def _load_state(self) -> Dict[str, Any]:
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            if state.get('version') == STATE_VERSION:
+                return state
+        except (OSError, ValueError):
+            pass
+        return self._empty_state('')
+
+    @staticmethod
+    def _empty_state(epoch: str) -> Dict[str, Any]:
+        return {
+            'version': STATE_VERSION,
+            'epoch': epoch,
+            'generation': 0,
+            'totals': {'documents': 0, 'lines': 0, 'words': 0},
+            'documents': {},
+        }
+
+    def _included(self, record: FileRecord) -> bool:
+        return (
+            record.path not in (self.index_path, self.toc_path)
+            and posixpath.basename(record.path) not in self.generated
+            and self.engine.matcher.matches(record.path)
+        )
+
+    def _apply(self, path: str, entry: Optional[Dict[str, Any]], affected: Set[str]) -> None:
+        """Swap one document's contribution to the totals"""
+        documents = self.state['documents']
+        totals = self.state['totals']
+        old = documents.pop(path, None)
+        if old:
+            totals['documents'] -= 1
+            totals['lines'] -= old['lines']
+            totals['words'] -= old['words']
+            affected.add(old['section'])
+        if entry:
+            documents[path] = entry
+            totals['documents'] += 1
+            totals['lines'] += entry['lines']
+            totals['words'] += entry['words']
+            affected.add(entry['section'])
+
+    def collect_changes(self, index: DocumentIndex, full: bool = False) -> Set[str]:
+        """Fold index changes into the totals; returns the sections to re-render"""
+        if full or self.state['epoch'] != index.epoch:
+            self.state = self._empty_state(index.epoch)
+
+        changed, removed = index.changes_since(self.state['generation'], tuple(MARKDOWN_SUFFIXES))
+        affected: Set[str] = set()
+
+        for record in changed:
+            entry = None
+            if self._included(record):
+                entry = {
+                    'hash': record.hash,
+                    'section': section_of(record.path),
+                    'lines': record.lines or 0,
+                    'words': record.body_words or 0,
+                }
+            if entry != self.state['documents'].get(record.path):
+                self._apply(record.path, entry, affected)
+        for path in removed:
+            if path in self.state['documents']:
+                self._apply(path, None, affected)
+
+        self.state['generation'] = index.generation
+        if affected:
+            affected.add(STATISTICS)
+        return affected
+
+    def _members(self, index: DocumentIndex, section: str) -> List[FileRecord]:
+        paths = sorted(p for p, e in self.state['documents'].items() if e['section'] == section)
+        return [record for record in map(index.get, paths) if record is not None]
+
+    def _link(self, path: str) -> str:
+        return posixpath.relpath(path, DOCS_DIR)
+
+    def render_statistics(self, date: str) -> str:
+        totals = self.state['totals']
+        sections = {e['section'] for e in self.state['documents'].values()}
+        return (
+            "## 📊 Statistics\n\n"
+            f"- **Total Documents**: {totals['documents']}\n"
+            f"- **Total Lines**: {totals['lines']:,}\n"
+            f"- **Total Words**: {totals['words']:,}\n"
+            f"- **Directories**: {len(sections)}\n"
+            f"- **Last Updated**: {date}\n\n"
+        )
+
+    def render_index_section(self, section: str, records: List[FileRecord]) -> str:
+        columns = ['Document', 'Description', 'Audience', 'Priority', 'Reading Time', 'Lines']
+        if self.index_options.get('include_word_count', True):
+            columns.append('Words')
+        if self.index_options.get('include_status', True):
+            columns.append('Status')
+
+        lines = [
+            f"## 📁 {section[len(SECTION_PREFIX):]}\n",
+            '| ' + ' | '.join(columns) + ' |',
+            '|' + '---|' * len(columns),
+        ]
+        for record in records:
+            metadata = record.frontmatter
+            row = [
+                f"[{_cell(document_title(record))}]({self._link(record.path)})",
+                _cell(metadata.get('description')),
+                _cell(metadata.get('audience')),
+                _cell(metadata.get('priority')),
+                _cell(reading_time(record)),
+                str(record.lines or 0),
+            ]
+            if 'Words' in columns:
+                row.append(str(record.body_words or 0))
+            if 'Status' in columns:
+                row.append(_cell(metadata.get('status')))
+            lines.append('| ' + ' | '.join(row) + ' |')
+        return '\n'.join(lines) + '\n\n'
+
+    def render_toc_section(self, section: str, records: List[FileRecord]) -> str:
+        max_depth = int(self.toc_options.get('max_depth', 3))
+        with_time = self.toc_options.get('include_reading_time', True)
+
+        lines = [f"## 📁 {section[len(SECTION_PREFIX):]}\n"]
+        for record in records:
+            entry = f"- [{document_title(record)}]({self._link(record.path)})"
+            if with_time:
+                entry += f" — *{reading_time(record)}*"
+            lines.append(entry)
+
+            seen: Dict[str, int] = {}
+            for heading in record.headings:
+                anchor = github_anchor(heading['text'])
+                count = seen.get(anchor, 0)
+                seen[anchor] = count + 1
+                # The document itself is depth 1, so its h2 headings are depth 2
+                if 2 <= heading['level'] <= max_depth:
+                    indent = '  ' * (heading['level'] - 1)
+                    suffix = f"-{count}" if count else ''
+                    lines.append(f"{indent}- [{heading['text']}]({self._link(record.path)}#{anchor}{suffix})")
+        return '\n'.join(lines) + '\n\n'
+
+    def _header(self, title: str, description: str, date: str) -> str:
+        return (
+            "---\n"
+            f'title: "{title}"\n'
+            f'description: "{description}"\n'
+            'version: "1.0"\n'
+            f'last_updated: "{date}"\n'
+            'audience: ["all"]\n'
+            'priority: "essential"\n'
+            'tags: ["index", "navigation", "auto_generated"]\n'
+            "---\n\n"
+            f"# {title}\n\n"
+            "*Generated by `scripts/index_generator.py`. Edit text outside the section markers only.*\n\n"
+        )
+
+    def update_page(self, index: DocumentIndex, rel_path: str, affected: Set[str], date: str,
+                    render_section, header: Tuple[str, str], with_statistics: bool) -> bool:
+        """Re-render the affected sections of one page; returns True if it was written"""
+        path = os.path.join(self.root, rel_path)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                page = Page(f.read())
+        except FileNotFoundError:
+            page = Page('')
+
+        wanted = {e['section'] for e in self.state['documents'].values()}
+        if with_statistics:
+            wanted.add(STATISTICS)
+        stale = page.sections - wanted
+
+        if not page.sections:
+            # First run, or the markers were removed: rebuild the whole page
+            page = Page(self._header(*header, date))
+            affected = wanted
+        elif not affected and not stale:
+            return False
+
+        for name in sorted(affected | stale):
+            if name == STATISTICS:
+                page.replace(name, self.render_statistics(date) if with_statistics else None)
+            else:
+                records = self._members(index, name)
+                page.replace(name, render_section(name, records) if records else None)
+
+        page.touch(date)
+        atomic_write(path, page.render())
+        return True
+
+    def run(self, full: bool = False) -> Dict[str, Any]:
+        index = DocumentIndex.open(self.root)
+        try:
+            affected = self.collect_changes(index, full)
+            date = datetime.now().strftime('%Y-%m-%d')
+            written = []
+
+            if self.index_options.get('enabled', True) and self.update_page(
+                index, self.index_path, affected, date, self.render_index_section,
+                ('VOITHER Documentation Index', 'Every VOITHER document with its audience, reading time and size'),
+                with_statistics=True
+            ):
+                written.append(self.index_path)
+            if self.toc_options.get('enabled', True) and self.update_page(
+                index, self.toc_path, affected, date, self.render_toc_section,
+                ('VOITHER Table of Contents', 'Navigation tree of the VOITHER documentation by directory'),
+                with_statistics=False
+            ):
+                written.append(self.toc_path)
+
+            # Pages we just wrote show up as changes next time; they are excluded, so that is a no-op
+            atomic_write(self.state_path, json.dumps(self.state))
+        finally:
+            index.close()
+
+        return {
+            'affected_sections': sorted(s for s in affected if s != STATISTICS),
+            'written': written,
+            'totals': dict(self.state['totals']),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Update the VOITHER documentation index and table of contents')
+    parser.add_argument('directory', nargs='?', default='.',
+                        help='Documentation root (default: current directory)')
+    parser.add_argument('--full', action='store_true',
+                        help='Ignore saved state and regenerate both pages completely')
+    args = parser.parse_args()
+
+    result = IndexGenerator(args.directory).run(full=args.full)
+    totals = result['totals']
+
+    print(f"📝 Documentation index: {totals['documents']} documents, "
+          f"{totals['lines']:,} lines, {totals['words']:,} words")
+    if result['affected_sections']:
+        print(f"   🔄 Sections updated: {len(result['affected_sections'])}")
+    for path in result['written']:
+        print(f"   ✅ Wrote {path}")
+    if not result['written']:
+        print("   ✨ Already up to date")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
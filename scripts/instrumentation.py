@@ -0,0 +1,193 @@
+"""
+VOITHER Instrumentation
+Opt-in profiling and tracing shared by the command line entry points
+
+Features:
+- --profile: cProfile statistics (.pstats) plus tracemalloc peak and top allocation sites
+- --trace: Chrome trace JSON (chrome://tracing, Perfetto) of named phase spans
+- span() costs one global lookup when neither flag is given
+
+Usage from an entry point:
+
+    parser = argparse.ArgumentParser(...)
+    instrumentation.add_arguments(parser)
+    args = parser.parse_args()
+    with instrumentation.from_args('validate-docs', args):
+        with instrumentation.span('links'):
+            ...
+"""
+
+import os
+import sys
+import json
+import time
+import pstats
+import cProfile
+import threading
+import tracemalloc
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+TOP_FUNCTIONS = 15
+TOP_ALLOCATIONS = 10
+
+_NULL_SPAN = nullcontext()
+_active: Optional['Instrumentation'] = None
+
+
+def add_arguments(parser) -> None:
+    """Add the shared --profile / --trace options to an argparse parser"""
+    group = parser.add_argument_group('instrumentation')
+    group.add_argument('--profile', nargs='?', const='', default=None, metavar='PATH',
+                       help='Write cProfile stats (default: <tool>.pstats) and report memory peaks')
+    group.add_argument('--trace', nargs='?', const='', default=None, metavar='PATH',
+                       help='Write a Chrome trace of phase spans (default: <tool>.trace.json)')
+
+
+def from_args(name: str, args) -> 'Instrumentation':
+    """Build the instrumentation context for parsed command line arguments"""
+    profile = getattr(args, 'profile', None)
+    trace = getattr(args, 'trace', None)
+    return Instrumentation(
+        name,
+        profile=(profile or f'{name}.pstats') if profile is not None else None,
+        trace=(trace or f'{name}.trace.json') if trace is not None else None,
+    )
+
+
+def span(name: str, **args: Any):
+    """Context manager recording a named phase while tracing is active"""
+    if _active is None or _active.trace_path is None:
+        return _NULL_SPAN
+    return _Span(_active, name, args)
+
+
+class _Span:
+    """One complete ('X') event in the Chrome trace format"""
+
+    __slots__ = ('owner', 'name', 'args', 'start')
+
+    def __init__(self, owner: 'Instrumentation', name: str, args: Dict[str, Any]):
+        self.owner = owner
+        self.name = name
+        self.args = args
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        event = {
+            'name': self.name,
+            'cat': self.owner.name,
+            'ph': 'X',
+            'ts': (self.start - self.owner.origin) / 1000,
+            'dur': (end - self.start) / 1000,
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+        }
+        if self.args or exc_type is not None:
+            event['args'] = {key: _jsonable(value) for key, value in self.args.items()}
+            if exc_type is not None:
+                event['args']['error'] = exc_type.__name__
+        self.owner.events.append(event)
+        return False
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
+
+
+class Instrumentation:
+    """Profiles and traces the enclosed block; does nothing when both outputs are None"""
+
+    def __init__(self, name: str, profile: Optional[str] = None, trace: Optional[str] = None):
+        self.name = name
+        self.profile_path = Path(profile) if profile else None
+        self.trace_path = Path(trace) if trace else None
+        self.events: List[Dict[str, Any]] = []
+        self.origin = 0
+        self._profiler: Optional[cProfile.Profile] = None
+        self._started_tracemalloc = False
+        self._previous: Optional['Instrumentation'] = None
+        self._root: Optional[_Span] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.profile_path is not None or self.trace_path is not None
+
+    def __enter__(self):
+        global _active
+        if not self.enabled:
+            return self
+        self._previous, _active = _active, self
+        self.origin = time.perf_counter_ns()
+        if self.trace_path is not None:
+            self._root = _Span(self, self.name, {'argv': ' '.join(sys.argv[1:])})
+            self._root.__enter__()
+        if self.profile_path is not None:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+            tracemalloc.reset_peak()
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # Runs for sys.exit() too, so tools that exit from main() still report
+        global _active
+        if not self.enabled:
+            return False
+        if self._profiler is not None:
+            self._profiler.disable()
+        if self._root is not None:
+            self._root.__exit__(exc_type, exc, tb)
+        _active = self._previous
+        if self._profiler is not None:
+            self._write_profile()
+        if self.trace_path is not None:
+            self._write_trace()
+        return False
+
+    def _write_profile(self) -> None:
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+
+        self._profiler.dump_stats(str(self.profile_path))
+        out = sys.stderr
+        print(f"\n⏱️  Profile written to {self.profile_path} (open with: python -m pstats {self.profile_path})",
+              file=out)
+        stats = pstats.Stats(self._profiler, stream=out)
+        stats.sort_stats('cumulative').print_stats(TOP_FUNCTIONS)
+
+        print(f"🧠 Memory: peak {peak / 1024 / 1024:.1f} MiB, {current / 1024 / 1024:.1f} MiB still allocated",
+              file=out)
+        snapshot = snapshot.filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        ))
+        for stat in snapshot.statistics('lineno')[:TOP_ALLOCATIONS]:
+            frame = stat.traceback[0]
+            print(f"  {stat.size / 1024:10.1f} KiB {stat.count:8d} blocks  {frame.filename}:{frame.lineno}",
+                  file=out)
+
+    def _write_trace(self) -> None:
+        self.trace_path.parent.mkdir(parents=True, exist_ok=True)
+        trace = {
+            'traceEvents': sorted(self.events, key=lambda event: event['ts']),
+            'displayTimeUnit': 'ms',
+            'otherData': {'tool': self.name},
+        }
+        with open(self.trace_path, 'w', encoding='utf-8') as f:
+            json.dump(trace, f)
+        print(f"🧵 Trace written to {self.trace_path} ({len(self.events)} spans; load in chrome://tracing)",
+              file=sys.stderr)
@@ -0,0 +1,465 @@
+"""
+VOITHER Mermaid Validator
+Pure-Python syntax check for the mermaid diagrams used in the documentation
+
+Features:
+- flowchart / graph: node shapes, link operators, link labels, subgraphs,
+  classDef / class / style / click references
+- sequenceDiagram: participants, messages, notes, activations and the
+  loop / alt / opt / par / critical / break / rect / box blocks
+- classDiagram: class blocks, members, relations, annotations, notes
+- Errors are "line N: message" relative to the block, like the other
+  code block validators; other diagram types are accepted unchecked
+"""
+
+import re
+import difflib
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+# Diagram types that are recognised but not checked
+UNCHECKED_DIAGRAMS = {
+    'stateDiagram', 'stateDiagram-v2', 'erDiagram', 'gantt', 'pie', 'journey',
+    'gitGraph', 'mindmap', 'timeline', 'quadrantChart', 'requirementDiagram',
+    'C4Context', 'C4Container', 'C4Component', 'C4Dynamic', 'C4Deployment',
+    'sankey-beta', 'xychart-beta', 'block-beta', 'packet-beta', 'architecture-beta',
+    'zenuml', 'kanban', 'radar-beta',
+}
+
+COMMON_STATEMENT = re.compile(r'^(?:accTitle\s*:|accDescr\s*[:{]|title(?:\s|$))')
+
+# --- flowchart -------------------------------------------------------------
+
+DIRECTIONS = {'TB', 'TD', 'BT', 'RL', 'LR'}
+
+NODE_ID = re.compile(r'[^\s\[\](){}<>|&;:"=~,.\-]+(?:[.\-][^\s\[\](){}<>|&;:"=~,.\-]+)*')
+# Longest openers first: (((text))), ((text)), ([text]), [[text]], [(text)], {{text}}, ...
+NODE_SHAPES: List[Tuple[str, Tuple[str, ...]]] = [
+    ('(((', (')))',)),
+    ('((', ('))',)),
+    ('([', ('])',)),
+    ('[[', (']]',)),
+    ('[(', (')]',)),
+    ('{{', ('}}',)),
+    ('[/', ('/]', '\\]')),
+    ('[\\', ('\\]', '/]')),
+    ('[', (']',)),
+    ('(', (')',)),
+    ('{', ('}',)),
+    ('>', (']',)),
+]
+LINK = re.compile(
+    r'\s*(?:'
+    r'(?P<texted>[<ox]?(?:--|==|-\.)(?![->=.ox]))\s*(?P<inline>[^\n]*?)\s*(?P<close>-{2,}[>ox]?|={2,}[>ox]?|\.+-[>ox]?)'
+    r'|(?P<plain>[<ox]?(?:-{2,}|={2,}|-\.+-|~{3,})[>ox]?)'
+    r')'
+)
+LINK_LABEL = re.compile(r'\s*\|(?P<label>[^|\n]*)\|')
+CLASS_SUFFIX = re.compile(r':::[\w-]+')
+
+SUBGRAPH = re.compile(r'^subgraph(?:\s+(?P<rest>.*))?$')
+FLOW_DIRECTIVE = re.compile(r'^(?P<keyword>classDef|class|style|linkStyle|click|direction)\b\s*(?P<rest>.*)$')
+
+
+def _split_statements(line: str) -> List[str]:
+    """Split a line on `;` outside quotes, brackets and link labels"""
+    parts, depth, quoted, start = [], 0, False, 0
+    for index, char in enumerate(line):
+        if char == '"':
+            quoted = not quoted
+        elif quoted:
+            continue
+        elif char in '[({':
+            depth += 1
+        elif char in '])}':
+            depth = max(depth - 1, 0)
+        elif char == ';' and depth == 0:
+            parts.append(line[start:index])
+            start = index + 1
+    parts.append(line[start:])
+    return [part.strip() for part in parts if part.strip()]
+
+
+class _FlowchartChecker:
+    def __init__(self):
+        self.errors: List[str] = []
+        self.nodes: Set[str] = set()
+        self.class_defs: Set[str] = {'default'}
+        self.references: List[Tuple[int, str, str]] = []  # (line, kind, id)
+        self.subgraphs: List[int] = []
+
+    def error(self, line: int, message: str) -> None:
+        self.errors.append(f"line {line}: {message}")
+
+    def node(self, text: str, position: int, line: int) -> Optional[int]:
+        """Parse one node reference at position; the position after it, or None"""
+        match = NODE_ID.match(text, position)
+        if not match:
+            return None
+        node_id = match.group()
+        position = match.end()
+        if node_id == 'end':
+            self.error(line, "'end' cannot be used as a node id (capitalize it or rename it)")
+        self.nodes.add(node_id)
+
+        for opener, closers in NODE_SHAPES:
+            if not text.startswith(opener, position):
+                continue
+            start = position + len(opener)
+            if text.startswith('"', start):
+                quote_end = text.find('"', start + 1)
+                if quote_end == -1:
+                    self.error(line, f"unterminated quoted text in node '{node_id}'")
+                    return len(text)
+                start = quote_end + 1
+            ends = [text.find(closer, start) for closer in closers]
+            ends = [(end, closer) for end, closer in zip(ends, closers) if end != -1]
+            if not ends:
+                self.error(line, f"unterminated shape '{opener}' in node '{node_id}'")
+                return len(text)
+            end, closer = min(ends)
+            position = end + len(closer)
+            break
+
+        suffix = CLASS_SUFFIX.match(text, position)
+        if suffix:
+            self.references.append((line, 'class', suffix.group()[3:]))
+            position = suffix.end()
+        return position
+
+    def nodes_group(self, text: str, position: int, line: int) -> Optional[int]:
+        """node (& node)*"""
+        position = self.node(text, self._skip(text, position), line)
+        while position is not None:
+            after = self._skip(text, position)
+            if not text.startswith('&', after):
+                break
+            position = self.node(text, self._skip(text, after + 1), line)
+            if position is None:
+                self.error(line, "expected a node after '&'")
+                return None
+        return position
+
+    @staticmethod
+    def _skip(text: str, position: int) -> int:
+        while position < len(text) and text[position] in ' \t':
+            position += 1
+        return position
+
+    def chain(self, text: str, line: int) -> None:
+        position = self.nodes_group(text, 0, line)
+        if position is None:
+            self.error(line, f"unrecognized statement: {text[:40]}")
+            return
+        while True:
+            position = self._skip(text, position)
+            if position >= len(text):
+                return
+            link = LINK.match(text, position)
+            if not link:
+                self.error(line, f"expected a link or end of statement, found '{text[position:position + 20]}'")
+                return
+            position = link.end()
+            label = LINK_LABEL.match(text, position)
+            if label:
+                position = label.end()
+            elif text.startswith('|', self._skip(text, position)):
+                self.error(line, "unterminated link label '|'")
+                return
+            following = self.nodes_group(text, position, line)
+            if following is None:
+                self.error(line, "link is missing its target node")
+                return
+            position = following
+
+    def directive(self, keyword: str, rest: str, line: int) -> None:
+        if keyword == 'classDef':
+            names = rest.split(None, 1)
+            if not names:
+                self.error(line, "classDef needs a class name")
+                return
+            self.class_defs.update(name.strip() for name in names[0].split(','))
+        elif keyword == 'class':
+            parts = rest.rsplit(None, 1)
+            if len(parts) != 2:
+                self.error(line, "class needs node ids and a class name")
+                return
+            for node_id in parts[0].split(','):
+                self.references.append((line, 'node', node_id.strip()))
+            self.references.append((line, 'class', parts[1]))
+        elif keyword in ('style', 'click'):
+            target = rest.split(None, 1)
+            if not target:
+                self.error(line, f"{keyword} needs a node id")
+                return
+            self.references.append((line, 'node', target[0]))
+        elif keyword == 'direction':
+            if rest.strip() not in DIRECTIONS:
+                self.error(line, f"unknown direction '{rest.strip()}'")
+
+    def statement(self, text: str, line: int) -> None:
+        subgraph = SUBGRAPH.match(text)
+        if subgraph:
+            self.subgraphs.append(line)
+            rest = (subgraph.group('rest') or '').strip()
+            if rest and not rest.startswith('"'):
+                self.node(rest, 0, line)
+            return
+        if text == 'end':
+            if not self.subgraphs:
+                self.error(line, "'end' without a matching subgraph")
+            else:
+                self.subgraphs.pop()
+            return
+        directive = FLOW_DIRECTIVE.match(text)
+        if directive and not LINK.match(text, len(directive.group('keyword'))):
+            self.directive(directive.group('keyword'), directive.group('rest'), line)
+            return
+        self.chain(text, line)
+
+    def finish(self) -> List[str]:
+        for line in self.subgraphs:
+            self.error(line, "subgraph is never closed with 'end'")
+        for line, kind, name in self.references:
+            if kind == 'node' and name not in self.nodes:
+                self.error(line, f"undefined node '{name}'")
+            elif kind == 'class' and name not in self.class_defs:
+                self.error(line, f"undefined class '{name}' (no classDef)")
+        return self.errors
+
+
+def check_flowchart(lines: List[Tuple[int, str]], header: Tuple[int, str]) -> List[str]:
+    checker = _FlowchartChecker()
+    number, text = header
+    declaration, _, rest = text.partition(';')
+    direction = declaration.split()[1:2]
+    if direction and direction[0] not in DIRECTIONS:
+        checker.error(number, f"unknown direction '{direction[0]}'")
+    if rest.strip():
+        lines = [(number, rest)] + lines
+    for number, text in lines:
+        for statement in _split_statements(text):
+            checker.statement(statement, number)
+    return checker.finish()
+
+
+# --- sequenceDiagram -------------------------------------------------------
+
+PARTICIPANT = re.compile(r'^(?:create\s+)?(?:participant|actor)\s+(?P<name>.+?)(?:\s+as\s+.+)?$')
+MESSAGE = re.compile(
+    r'^(?P<source>[^\s:+\-<>][^:]*?)\s*'
+    r'(?P<arrow><<-->>|<<->>|-->>|->>|-->|->|--x|-x|--\)|-\))'
+    r'\s*(?P<activation>[+-]?)\s*(?P<target>[^:]+?)\s*(?P<colon>:|$)'
+)
+NOTE = re.compile(r'^[Nn]ote\s+(?:left of|right of|over)\s+(?P<names>[^:]+?)\s*:')
+ACTIVATION = re.compile(r'^(?:activate|deactivate|destroy)\s+(?P<name>.+)$')
+SEQUENCE_BLOCK = re.compile(r'^(?P<keyword>loop|alt|opt|par|critical|break|rect|box)\b')
+SEQUENCE_BRANCH = re.compile(r'^(?P<keyword>else|and|option)\b')
+BRANCH_PARENTS = {'else': {'alt'}, 'and': {'par'}, 'option': {'critical'}}
+SEQUENCE_KEYWORDS = re.compile(r'^(?:autonumber|links?\s|properties\s|details\s)')
+
+
+def check_sequence(lines: List[Tuple[int, str]], header: Tuple[int, str]) -> List[str]:
+    errors: List[str] = []
+    declared: Set[str] = set()
+    used: List[Tuple[int, str]] = []
+    blocks: List[Tuple[int, str]] = []
+
+    for number, text in lines:
+        participant = PARTICIPANT.match(text)
+        if participant:
+            declared.add(participant.group('name').strip())
+            continue
+        block = SEQUENCE_BLOCK.match(text)
+        if block:
+            blocks.append((number, block.group('keyword')))
+            continue
+        branch = SEQUENCE_BRANCH.match(text)
+        if branch:
+            keyword = branch.group('keyword')
+            if not blocks or blocks[-1][1] not in BRANCH_PARENTS[keyword]:
+                parent = '/'.join(sorted(BRANCH_PARENTS[keyword]))
+                errors.append(f"line {number}: '{keyword}' is only valid inside {parent}")
+            continue
+        if text == 'end':
+            if blocks:
+                blocks.pop()
+            else:
+                errors.append(f"line {number}: 'end' without an open block")
+            continue
+        note = NOTE.match(text)
+        if note:
+            used.extend((number, name.strip()) for name in note.group('names').split(','))
+            continue
+        activation = ACTIVATION.match(text)
+        if activation:
+            used.append((number, activation.group('name').strip()))
+            continue
+        if SEQUENCE_KEYWORDS.match(text) or COMMON_STATEMENT.match(text):
+            continue
+        message = MESSAGE.match(text)
+        if message:
+            if message.group('colon') != ':':
+                errors.append(f"line {number}: message is missing ': text'")
+            used.append((number, message.group('source').strip()))
+            used.append((number, message.group('target').strip()))
+            continue
+        errors.append(f"line {number}: unrecognized statement: {text[:40]}")
+
+    for number, keyword in blocks:
+        errors.append(f"line {number}: '{keyword}' block is never closed with 'end'")
+    # Mermaid creates participants on first use, even alongside declared
+    # ones, so only a name that nearly matches a declared one is a typo
+    reported: Set[str] = set()
+    for number, name in used:
+        if name in declared or name in reported:
+            continue
+        reported.add(name)
+        intended = _near_miss(name, declared)
+        if intended:
+            errors.append(f"line {number}: undefined participant '{name}' (did you mean '{intended}'?)")
+    return errors
+
+
+def _near_miss(name: str, declared: Set[str]) -> Optional[str]:
+    """The declared participant name is most likely a misspelling of, if any"""
+    for candidate in sorted(declared):
+        if candidate.lower() == name.lower():
+            return candidate
+    close = difflib.get_close_matches(name, sorted(declared), n=1, cutoff=0.8)
+    return close[0] if close else None
+
+
+# --- classDiagram ----------------------------------------------------------
+
+CLASS_NAME = r'[\w`]+(?:~[^~]+~)?'
+CLASS_DECLARATION = re.compile(rf'^class\s+(?P<name>{CLASS_NAME})\s*(?:\["[^"]*"\])?\s*(?::::[\w-]+)?\s*(?P<brace>\{{)?\s*$')
+CLASS_MEMBER = re.compile(rf'^(?P<name>{CLASS_NAME})\s*:\s*\S')
+CLASS_RELATION = re.compile(
+    rf'^(?P<left>{CLASS_NAME})\s*(?:"[^"]*"\s*)?'
+    r'(?:<\||\*|o|<)?(?:--|\.\.)(?:\|>|\*|o|>)?'
+    rf'\s*(?:"[^"]*"\s*)?(?P<right>{CLASS_NAME})\s*(?::.*)?$'
+)
+CLASS_ANNOTATION = re.compile(rf'^<<[^>]+>>\s*(?P<name>{CLASS_NAME})?$')
+CLASS_REFERENCE = re.compile(
+    r'^(?:note\s+for\s+(?P<note>\S+)\s+"[^"]*"|note\s+"[^"]*"'
+    r'|(?:style|click|link|callback)\s+(?P<target>\S+).*'
+    r'|cssClass\s+"(?P<css>[^"]+)"\s+\S+)$'
+)
+CLASS_KEYWORDS = re.compile(r'^(?:direction\s+(?:TB|TD|BT|RL|LR)|classDef\s+\S+)')
+NAMESPACE = re.compile(r'^namespace\s+\S+\s*\{$')
+
+
+def check_class(lines: List[Tuple[int, str]], header: Tuple[int, str]) -> List[str]:
+    errors: List[str] = []
+    classes: Set[str] = set()
+    references: List[Tuple[int, str]] = []
+    open_blocks: List[Tuple[int, str]] = []
+
+    for number, text in lines:
+        if open_blocks and open_blocks[-1][1] == 'class':
+            if text == '}':
+                open_blocks.pop()
+                continue
+            if '{' in text or text.startswith('class '):
+                errors.append(f"line {number}: class body is not closed before '{text[:30]}'")
+                open_blocks.pop()
+            else:
+                continue  # member line
+        if text == '}':
+            if open_blocks:
+                open_blocks.pop()
+            else:
+                errors.append(f"line {number}: unmatched '}}'")
+            continue
+        if NAMESPACE.match(text):
+            open_blocks.append((number, 'namespace'))
+            continue
+        declaration = CLASS_DECLARATION.match(text)
+        if declaration:
+            classes.add(declaration.group('name').split('~')[0])
+            if declaration.group('brace'):
+                open_blocks.append((number, 'class'))
+            continue
+        annotation = CLASS_ANNOTATION.match(text)
+        if annotation:
+            if annotation.group('name'):
+                references.append((number, annotation.group('name').split('~')[0]))
+            continue
+        relation = CLASS_RELATION.match(text)
+        if relation:
+            classes.add(relation.group('left').split('~')[0])
+            classes.add(relation.group('right').split('~')[0])
+            continue
+        member = CLASS_MEMBER.match(text)
+        if member:
+            classes.add(member.group('name').split('~')[0])
+            continue
+        reference = CLASS_REFERENCE.match(text)
+        if reference:
+            name = reference.group('note') or reference.group('target') or reference.group('css')
+            if name:
+                references.extend((number, n.strip()) for n in name.split(','))
+            continue
+        if CLASS_KEYWORDS.match(text) or COMMON_STATEMENT.match(text):
+            continue
+        errors.append(f"line {number}: unrecognized statement: {text[:40]}")
+
+    for number, kind in open_blocks:
+        errors.append(f"line {number}: {kind} block is never closed with '}}'")
+    for number, name in references:
+        if name not in classes:
+            errors.append(f"line {number}: undefined class '{name}'")
+    return errors
+
+
+# --- entry point -----------------------------------------------------------
+
+CHECKERS: Dict[str, Callable[[List[Tuple[int, str]], Tuple[int, str]], List[str]]] = {
+    'graph': check_flowchart,
+    'flowchart': check_flowchart,
+    'flowchart-elk': check_flowchart,
+    'sequenceDiagram': check_sequence,
+    'classDiagram': check_class,
+    'classDiagram-v2': check_class,
+}
+
+
+def _statements(code: str) -> List[Tuple[int, str]]:
+    """(line number, text) of every non-blank line outside comments and directives"""
+    lines = []
+    in_directive = False
+    for number, raw in enumerate(code.split('\n'), 1):
+        text = raw.strip()
+        if in_directive:
+            in_directive = '}%%' not in text
+            continue
+        if text.startswith('%%{'):
+            in_directive = '}%%' not in text
+            continue
+        if not text or text.startswith('%%'):
+            continue
+        lines.append((number, text))
+    return lines
+
+
+def validate_mermaid(code: str) -> List[str]:
+    """Syntax errors of one mermaid diagram as "line N: message" strings"""
+    lines = _statements(code)
+    # Front matter (---\ntitle: ...\n---) may precede the diagram type
+    if lines and lines[0][1] == '---':
+        closing = next((i for i, (_, text) in enumerate(lines[1:], 1) if text == '---'), None)
+        if closing is None:
+            return [f"line {lines[0][0]}: front matter is never closed with '---'"]
+        lines = lines[closing + 1:]
+    if not lines:
+        return ["line 1: empty diagram"]
+
+    number, header = lines[0]
+    diagram = header.split()[0].split(';')[0]
+    if diagram in UNCHECKED_DIAGRAMS:
+        return []
+    checker = CHECKERS.get(diagram)
+    if checker is None:
+        return [f"line {number}: unknown diagram type '{diagram}'"]
+    errors = checker(lines[1:], lines[0])
+    return sorted(errors, key=lambda error: int(error.split(':', 1)[0][5:]))
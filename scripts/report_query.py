@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+"""
+VOITHER Report Query
+Pull values out of large JSON reports without loading them into memory
+
+Features:
+- Incremental JSON reader: containers on a selector's path are walked one
+  child at a time and each subtree goes through the C decoder, so memory is
+  bounded by the largest element rather than the whole report
+- JSONPath-like selectors: $.a.b, ['key'], [0], [*], .length() and filters
+  such as $.detailed_results.documents[?(@.quality_score < 70)].file
+- Several named queries answered in one pass, printed as NAME=value lines,
+  shell assignments (--shell) or appended to $GITHUB_OUTPUT
+- Reading stops as soon as every fixed-path selector has its value
+"""
+
+import os
+import re
+import sys
+import json
+import shlex
+import argparse
+from typing import Any, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+CHUNK_SIZE = 1 << 16
+
+WHITESPACE = re.compile(r'[ \t\r\n]*')
+VALUE_END = frozenset(' \t\r\n,]}')
+DECODER = json.JSONDecoder()
+
+
+class JSONReader:
+    """Walks a JSON document on a text stream without holding all of it
+
+    Containers on the way to a selector are read structurally, one key or
+    element at a time; every subtree that is needed whole (or skipped) goes
+    through the C decoder, so memory is bounded by the largest such subtree.
+    """
+
+    def __init__(self, stream: TextIO, chunk_size: int = CHUNK_SIZE):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.position = 0
+        self.offset = 0  # characters dropped before buffer[0], for error messages
+        self.eof = False
+
+    def _fill(self, size: int) -> bool:
+        chunk = self.stream.read(size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.offset += self.position
+        self.buffer = self.buffer[self.position:] + chunk
+        self.position = 0
+        return True
+
+    def error(self, message: str) -> ValueError:
+        return ValueError(f"{message} at character {self.offset + self.position}")
+
+    def peek(self) -> Optional[str]:
+        """The next non-whitespace character, or None at the end of input"""
+        while True:
+            self.position = WHITESPACE.match(self.buffer, self.position).end()
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self._fill(self.chunk_size):
+                return None
+
+    def take(self) -> str:
+        char = self.peek()
+        if char is None:
+            raise self.error("unexpected end of input")
+        self.position += 1
+        return char
+
+    def value(self) -> Any:
+        """Decode the next complete value, reading more input until it fits"""
+        if self.peek() is None:
+            raise self.error("unexpected end of input")
+        size = self.chunk_size
+        while True:
+            try:
+                value, end = DECODER.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError as e:
+                if self._fill(size):
+                    size *= 2  # keeps re-decoding a large subtree linear overall
+                    continue
+                raise ValueError(f"{e.msg} at character {self.offset + e.pos}") from None
+            # A number or literal is only complete once a delimiter follows it;
+            # "86." at the end of a chunk decodes as 86
+            if self.buffer[self.position] not in '{["' and (
+                    end == len(self.buffer) or self.buffer[end] not in VALUE_END) and self._fill(size):
+                continue
+            self.position = end
+            return value
+
+    def children(self) -> Iterator[Any]:
+        """Keys (objects) or indexes (arrays) of the container starting here;
+        the caller consumes each child's value before asking for the next"""
+        opening = self.take()
+        closing = '}' if opening == '{' else ']'
+        if self.peek() == closing:
+            self.position += 1
+            return
+        index = 0
+        while True:
+            if opening == '{':
+                if self.peek() != '"':
+                    raise self.error("expected an object key")
+                key = self.value()
+                if self.take() != ':':
+                    raise self.error("expected ':'")
+                yield key
+            else:
+                yield index
+            char = self.take()
+            if char == closing:
+                return
+            if char != ',':
+                raise self.error(f"expected ',' or '{closing}'")
+            index += 1
+
+
+# --- selectors -------------------------------------------------------------
+
+STEP = re.compile(
+    r'\.(?P<name>[^.\[\]()]+?)(?P<call>\(\))?(?=[.\[]|$)'
+    r'|\[(?P<index>-?\d+)\]'
+    r'|\[(?P<quote>[\'"])(?P<key>.*?)(?P=quote)\]'
+    r'|\[(?P<star>\*)\]'
+    r'|\[\?\((?P<filter>.*?)\)\](?=[.\[]|$)'
+)
+CONDITION = re.compile(
+    r'^\s*@(?P<path>(?:\.[\w-]+|\[\d+\])*)\s*'
+    r'(?:(?P<op>==|!=|<=|>=|<|>)\s*(?P<literal>.+?))?\s*$'
+)
+OPERATORS = {
+    '==': lambda a, b: a == b,
+    '!=': lambda a, b: a != b,
+    '<': lambda a, b: a < b,
+    '<=': lambda a, b: a <= b,
+    '>': lambda a, b: a > b,
+    '>=': lambda a, b: a >= b,
+}
+FUNCTIONS = {'length'}
+
+# A step is (kind, argument): ('key', name) ('index', n) ('wild', None)
+# ('filter', (path, op, literal)) or ('call', name)
+Step = Tuple[str, Any]
+
+
+def parse_selector(text: str) -> List[Step]:
+    """Compile a JSONPath-like selector into steps"""
+    selector = text.strip()
+    if selector.startswith('$'):
+        selector = selector[1:]
+    steps: List[Step] = []
+    position = 0
+    while position < len(selector):
+        if selector.startswith('..', position):
+            raise ValueError(f"recursive descent is not supported: {text}")
+        match = STEP.match(selector, position)
+        if not match:
+            raise ValueError(f"cannot parse selector at '{selector[position:]}': {text}")
+        position = match.end()
+        if match.group('name') is not None:
+            name = match.group('name')
+            if match.group('call'):
+                if name not in FUNCTIONS:
+                    raise ValueError(f"unknown function {name}(): {text}")
+                steps.append(('call', name))
+            else:
+                steps.append(('wild', None) if name == '*' else ('key', name))
+        elif match.group('index') is not None:
+            steps.append(('index', int(match.group('index'))))
+        elif match.group('key') is not None:
+            steps.append(('key', match.group('key')))
+        elif match.group('star'):
+            steps.append(('wild', None))
+        else:
+            condition = CONDITION.match(match.group('filter'))
+            if not condition:
+                raise ValueError(f"cannot parse filter '{match.group('filter')}': {text}")
+            path = parse_selector(condition.group('path')) if condition.group('path') else []
+            literal = condition.group('literal')
+            if literal is not None:
+                literal = literal.strip()
+                if literal[:1] == "'" and literal[-1:] == "'":
+                    literal = json.dumps(literal[1:-1])
+                literal = json.loads(literal)
+            steps.append(('filter', (path, condition.group('op'), literal)))
+        if steps[-1][0] == 'call' and position < len(selector):
+            raise ValueError(f"{steps[-1][1]}() must be the last step: {text}")
+    return steps
+
+
+def _children(value: Any) -> Iterator[Any]:
+    if isinstance(value, dict):
+        return iter(value.values())
+    if isinstance(value, list):
+        return iter(value)
+    return iter(())
+
+
+def _test(condition: Tuple[List[Step], Optional[str], Any], value: Any) -> bool:
+    path, op, literal = condition
+    found = list(evaluate(path, value))
+    if op is None:
+        return bool(found)
+    for item in found:
+        try:
+            if OPERATORS[op](item, literal):
+                return True
+        except TypeError:
+            continue
+    return False
+
+
+def evaluate(steps: List[Step], value: Any) -> Iterator[Any]:
+    """Apply selector steps to an in-memory value"""
+    if not steps:
+        yield value
+        return
+    (kind, argument), rest = steps[0], steps[1:]
+    if kind == 'key':
+        if isinstance(value, dict) and argument in value:
+            yield from evaluate(rest, value[argument])
+    elif kind == 'index':
+        if isinstance(value, list) and -len(value) <= argument < len(value):
+            yield from evaluate(rest, value[argument])
+    elif kind == 'wild':
+        for child in _children(value):
+            yield from evaluate(rest, child)
+    elif kind == 'filter':
+        for child in _children(value):
+            if _test(argument, child):
+                yield from evaluate(rest, child)
+    elif kind == 'call':
+        if isinstance(value, (dict, list, str)):
+            yield len(value)
+
+
+class Query:
+    """A selector split into the part matched while streaming and the rest"""
+
+    def __init__(self, name: Optional[str], selector: str, fmt: Optional[str] = None):
+        self.name = name
+        self.selector = selector
+        self.format = fmt
+        self.steps = steps = parse_selector(selector)
+        # Leading keys, non-negative indexes and wildcards are matched while
+        # walking; materialization starts where they end
+        split = 0
+        while split < len(steps) and (steps[split][0] in ('key', 'wild') or
+                                       (steps[split][0] == 'index' and steps[split][1] >= 0)):
+            split += 1
+        self.prefix = steps[:split]
+        self.rest = steps[split:]
+        # A filter is tested per child, so only one child is held at a time
+        self.per_child = bool(self.rest) and self.rest[0][0] == 'filter'
+        # length() straight after the prefix just counts children
+        self.counts = self.rest == [('call', 'length')]
+        self.depth = len(self.prefix) + (1 if self.per_child else 0)
+        self.definite = all(kind in ('key', 'index') for kind, _ in self.prefix) and not self.per_child
+        self.results: List[Any] = []
+        self.matched = 0
+        self.keep = True  # False when only the number of matches is wanted
+        self.done = False
+
+    def matches(self, path: List[Any]) -> bool:
+        for (kind, argument), component in zip(self.prefix, path):
+            if kind == 'wild':
+                continue
+            if kind == 'key' and component != argument:
+                return False
+            if kind == 'index' and component != argument:
+                return False
+        return True
+
+    def add(self, values: Iterable[Any]) -> None:
+        for value in values:
+            self.matched += 1
+            if self.keep:
+                self.results.append(value)
+
+    def accept(self, value: Any) -> None:
+        if self.per_child:
+            condition = self.rest[0][1]
+            if _test(condition, value):
+                self.add(evaluate(self.rest[1:], value))
+        else:
+            self.add(evaluate(self.rest, value))
+        if self.definite:
+            self.done = True
+
+
+class _Finished(Exception):
+    """Every query has its value; the rest of the input is not needed"""
+
+
+def _collect(queries: List[Query], depth: int, value: Any) -> None:
+    for query in queries:
+        if query.per_child and query.depth == depth:
+            query.accept(value)
+        else:
+            # Whatever the selector still needs is evaluated in memory
+            query.add(evaluate(query.steps[depth:], value))
+            query.done = query.definite
+
+
+def _walk(reader: JSONReader, path: List[Any], queries: List[Query],
+          finish: Optional[List[Query]]) -> None:
+    """
+    Consume the value at path, answering the queries that reach it
+
+    finish is every query of the run when all of them are definite: once
+    all have their value, reading stops. It is checked as a whole, since a
+    deeper query can be done while an ancestor's length() is still counting.
+    """
+    active = [query for query in queries if not query.done and query.matches(path)]
+    depth = len(path)
+    targets = [query for query in active if query.depth == depth]
+
+    if reader.peek() not in ('{', '[') or any(not query.counts for query in targets):
+        # Needed whole, or a scalar: one call into the C decoder
+        _collect(active, depth, reader.value())
+    else:
+        deeper = [query for query in active if query.depth > depth]
+        count = 0
+        for key in reader.children():
+            if deeper:
+                path.append(key)
+                _walk(reader, path, deeper, finish)
+                path.pop()
+            else:
+                reader.value()  # skipped one child at a time
+            count += 1
+        for query in targets:
+            query.add([count])
+            query.done = query.definite
+
+    if finish and active and all(query.done for query in finish):
+        raise _Finished
+
+
+def run_queries(stream: TextIO, queries: List[Query]) -> None:
+    """
+    Answer every query in one pass over the report
+
+    >>> import io
+    >>> queries = [Query(None, '$.a.b'), Query(None, '$.a.length()')]
+    >>> run_queries(io.StringIO('{"a": {"x": 1, "b": [""]}, "b": {}}'), queries)
+    >>> [query.results for query in queries]
+    [[['']], [2]]
+    """
+    reader = JSONReader(stream)
+    finish = queries if all(query.definite for query in queries) else None
+    try:
+        _walk(reader, [], queries, finish)
+    except _Finished:
+        return
+    if reader.peek() is not None:
+        raise reader.error("unexpected data after the document")
+
+
+def render(value: Any, fmt: Optional[str] = None) -> str:
+    """A value as shell-friendly text: raw strings, JSON for everything else"""
+    if fmt and not isinstance(value, (dict, list)):
+        try:
+            return fmt.format(value)
+        except (ValueError, TypeError):
+            pass
+    if isinstance(value, str):
+        return value
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def parse_query(argument: str) -> Query:
+    """NAME=SELECTOR or SELECTOR, optionally followed by ' | {format}'"""
+    name = None
+    head = re.match(r'^(?P<name>[A-Za-z_]\w*)=(?=\$|\.|\[)', argument)
+    if head:
+        name = head.group('name')
+        argument = argument[head.end():]
+    fmt = None
+    pipe = re.search(r'\s*\|\s*(\{[^{}]*\})\s*$', argument)
+    if pipe:
+        fmt = pipe.group(1)
+        argument = argument[:pipe.start()]
+    return Query(name, argument, fmt)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Query large JSON reports with JSONPath-like selectors in one streaming pass')
+    parser.add_argument('report', help="JSON report to read ('-' for stdin)")
+    parser.add_argument('queries', nargs='+', metavar='QUERY',
+                        help="[NAME=]SELECTOR[ | {format}], e.g. "
+                             "'SCORE=$.detailed_results.average_quality_score | {:.1f}'")
+    parser.add_argument('--shell', action='store_true',
+                        help='Print NAME=value lines as shell assignments (for eval)')
+    parser.add_argument('--github-output', action='store_true',
+                        help='Also append name=value lines (lower-case names) to $GITHUB_OUTPUT')
+    parser.add_argument('--default', default=None,
+                        help='Value for queries that match nothing (default: empty)')
+    parser.add_argument('--count', action='store_true',
+                        help='Print the number of matches instead of the values')
+    args = parser.parse_args()
+
+    try:
+        queries = [parse_query(argument) for argument in args.queries]
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+    for query in queries:
+        query.keep = not args.count
+
+    try:
+        if args.report == '-':
+            run_queries(sys.stdin, queries)
+        else:
+            with open(args.report, 'r', encoding='utf-8') as f:
+                run_queries(f, queries)
+    except (OSError, ValueError) as e:
+        print(f"❌ {args.report}: {e}", file=sys.stderr)
+        return 1
+
+    outputs = []
+    for query in queries:
+        if args.count:
+            values = [str(query.matched)]
+        elif query.results:
+            values = [render(value, query.format) for value in query.results]
+        else:
+            values = [args.default] if args.default is not None else ([''] if query.name else [])
+        if query.name is None:
+            for value in values:
+                print(value)
+            continue
+        # Several matches for a named query become one JSON array
+        text = values[0] if len(values) == 1 else json.dumps(query.results, ensure_ascii=False)
+        outputs.append((query.name, text))
+        print(f"{query.name}={shlex.quote(text)}" if args.shell else f"{query.name}={text}")
+
+    output_file = os.environ.get('GITHUB_OUTPUT')
+    if args.github_output and output_file:
+        with open(output_file, 'a', encoding='utf-8') as f:
+            for name, text in outputs:
+                f.write(f"{name.lower()}={text}\n")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+"""
+VOITHER Security Scan
+Secret, high-entropy token and compliance keyword scanner for the repository
+
+Features:
+- Every secret and compliance pattern lives in one compiled alternation with
+  named groups; it only runs in small windows around literal trigger words,
+  which are located with bytes.find on the lower-cased file
+- Line numbers from a per-file newline offset index (bisect), built only for
+  files with findings
+- Shannon-entropy check for long tokens that are assigned or quoted
+- Process pool for large trees; results cached by file hash so unchanged
+  files are never re-read, and identical copies are scanned once
+- Writes the security_compliance_report.json consumed by the workflows
+"""
+
+import os
+import re
+import sys
+import json
+import math
+import bisect
+import argparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from blob_map import BlobMap
+from docs_cache import ResultCache
+from docs_index import DocumentIndex
+
+# Bump when patterns or the result shape change so cached results are discarded
+SCANNER_VERSION = 2
+
+# Below this many unscanned files the pool start-up costs more than it saves
+POOL_THRESHOLD = 64
+
+SCANNED_SUFFIXES = ('.py', '.js', '.ts', '.json', '.yml', '.yaml', '.md', '.txt', '.env')
+SKIPPED_DIRS = {'build', 'dist', 'node_modules'}
+
+# name -> pattern; the value group (if any) is what gets redacted and measured
+SECRET_PATTERNS = {
+    'api_key': rb'api[_-]?key["\']?\s*[:=]\s*["\']?(?P<v_api_key>[a-zA-Z0-9_-]{20,})',
+    'password': rb'password["\']?\s*[:=]\s*["\']?(?P<v_password>[^"\'\s]{6,})',
+    'token': rb'token["\']?\s*[:=]\s*["\']?(?P<v_token>[a-zA-Z0-9_-]{20,})',
+    'secret': rb'secret["\']?\s*[:=]\s*["\']?(?P<v_secret>[a-zA-Z0-9_-]{20,})',
+    'connection_string': rb'(?:mongodb|postgres|mysql|redis)://[^\s"\']+',
+    'aws_key': rb'AKIA[0-9A-Z]{16}',
+    'github_token': rb'ghp_[a-zA-Z0-9]{36}',
+}
+
+COMPLIANCE_PATTERNS = {
+    'HIPAA': rb'\bHIPAA\b',
+    'LGPD': rb'\bLGPD\b',
+    'GDPR': rb'\bGDPR\b',
+    'PHI': rb'\bPHI\b|\bprotected health information\b',
+    'PII': rb'\bPII\b|\bpersonally identifiable information\b',
+    'medical_data': rb'\bmedical data\b|\bhealth data\b|\bclinical data\b',
+}
+
+# Secrets and compliance keywords are separate alternations: each resumes
+# after its own matches, so a keyword inside a secret is still reported
+SECRET_SCANNER = re.compile(
+    b'|'.join(b'(?P<s_%s>%s)' % (name.encode(), pattern) for name, pattern in SECRET_PATTERNS.items()),
+    re.IGNORECASE
+)
+COMPLIANCE_SCANNER = re.compile(
+    b'|'.join(b'(?P<c_%s>%s)' % (name.encode(), pattern) for name, pattern in COMPLIANCE_PATTERNS.items()),
+    re.IGNORECASE
+)
+SECRET_GROUPS = {f's_{name}': name for name in SECRET_PATTERNS}
+COMPLIANCE_GROUPS = {f'c_{name}': name for name in COMPLIANCE_PATTERNS}
+
+# Every match of either scanner contains one of these (lower-cased) trigger words,
+# mapped to how far before the trigger the match can start
+TRIGGERS = {
+    b'api': 0, b'password': 0, b'token': 0, b'secret': 0, b'akia': 0, b'ghp_': 0,
+    b'://': len(b'postgres'),
+    b'hipaa': 0, b'lgpd': 0, b'gdpr': 0, b'phi': 0, b'pii': 0,
+    b'health': len(b'protected '),
+    b'personally identifiable': 0, b'medical data': 0, b'clinical data': 0,
+}
+
+# Tokens assigned (`key: value`, `key=value`) or quoted are entropy candidates
+ENTROPY_CANDIDATE = re.compile(rb'[:="\'][ \t]*["\']?(?P<token>[A-Za-z0-9+/_-]{24,}={0,2})')
+# Bits per character; random base64 of 24+ characters scores above 4.2.
+# Hex digests (content hashes, commit ids) are everywhere in the reports and
+# never mix case, so only mixed-case tokens with digits are considered
+ENTROPY_THRESHOLD = 4.2
+SHANNON_CAP = 0.9  # never require more than this share of log2(len(token))
+MIXED_CASE = (re.compile(rb'[0-9]'), re.compile(rb'[A-Z]'), re.compile(rb'[a-z]'))
+
+SENSITIVE_FILES = [
+    r'\.env',
+    r'\.key$',
+    r'\.pem$',
+    r'\.p12$',
+    r'config\.json$',
+    r'secrets\..*',
+]
+
+CONTEXT = 20
+
+
+def shannon_entropy(token: bytes) -> float:
+    """Bits per character of the token's own character distribution"""
+    if not token:
+        return 0.0
+    length = len(token)
+    return -sum(count / length * math.log2(count / length) for count in Counter(token).values())
+
+
+def is_high_entropy(token: bytes) -> Tuple[bool, float]:
+    """(flagged, entropy) for a candidate token"""
+    entropy = shannon_entropy(token)
+    if not all(pattern.search(token) for pattern in MIXED_CASE):
+        return False, entropy
+    threshold = min(ENTROPY_THRESHOLD, SHANNON_CAP * math.log2(len(token)))
+    return entropy >= threshold, entropy
+
+
+class LineIndex:
+    """Offset -> 1-based line number via bisect over newline offsets"""
+
+    def __init__(self, data: bytes):
+        self.newlines = [m.start() for m in re.finditer(b'\n', data)]
+
+    def line_of(self, offset: int) -> int:
+        return bisect.bisect_left(self.newlines, offset) + 1
+
+
+def _windows(lowered: bytes) -> List[Tuple[int, int]]:
+    """Merged [start, end) ranges in which a scanner match may start"""
+    hits = []
+    for trigger, lookback in TRIGGERS.items():
+        position = lowered.find(trigger)
+        while position != -1:
+            hits.append((max(0, position - lookback), position + 1))
+            position = lowered.find(trigger, position + 1)
+    hits.sort()
+    windows: List[Tuple[int, int]] = []
+    for start, end in hits:
+        if windows and start <= windows[-1][1]:
+            windows[-1] = (windows[-1][0], max(windows[-1][1], end))
+        else:
+            windows.append((start, end))
+    return windows
+
+
+def _context(data: bytes, start: int, end: int) -> str:
+    return data[max(0, start - CONTEXT):end + CONTEXT].decode('utf-8', errors='replace')
+
+
+def _scan_windows(scanner: re.Pattern, data: bytes, windows: List[Tuple[int, int]]) -> Iterator[re.Match]:
+    """Non-overlapping matches of scanner that start inside windows"""
+    resume = 0
+    for start, end in windows:
+        position = max(start, resume)
+        # The window bounds where a match starts, not where it ends
+        while position < end:
+            match = scanner.match(data, position)
+            if match is None:
+                position += 1
+                continue
+            yield match
+            position = resume = max(match.end(), match.start() + 1)
+
+
+def scan_bytes(data: bytes) -> Dict[str, Any]:
+    """Findings for one file's content (no path; results are cached by hash)"""
+    secrets: List[Dict[str, Any]] = []
+    compliance: List[str] = []
+    high_entropy: List[Dict[str, Any]] = []
+    lines: Optional[LineIndex] = None
+
+    def line_of(offset: int) -> int:
+        nonlocal lines
+        if lines is None:
+            lines = LineIndex(data)
+        return lines.line_of(offset)
+
+    windows = _windows(data.lower())
+    for match in _scan_windows(SECRET_SCANNER, data, windows):
+        kind = SECRET_GROUPS[match.lastgroup]
+        value = match.group(f'v_{kind}') if f'v_{kind}' in SECRET_SCANNER.groupindex else match.group()
+        secrets.append({
+            'type': kind,
+            'line': line_of(match.start()),
+            'context': _context(data, match.start(), match.end()),
+            'entropy': round(shannon_entropy(value), 2),
+        })
+    for match in _scan_windows(COMPLIANCE_SCANNER, data, windows):
+        if COMPLIANCE_GROUPS[match.lastgroup] not in compliance:
+            compliance.append(COMPLIANCE_GROUPS[match.lastgroup])
+
+    for match in ENTROPY_CANDIDATE.finditer(data):
+        token = match.group('token')
+        flagged, entropy = is_high_entropy(token)
+        if flagged:
+            high_entropy.append({
+                'line': line_of(match.start('token')),
+                'entropy': round(entropy, 2),
+                'context': _context(data, match.start('token'), match.end('token')),
+            })
+
+    return {'secrets': secrets, 'compliance': compliance, 'high_entropy': high_entropy}
+
+
+def check_file_name(path: str) -> List[Dict[str, str]]:
+    """Sensitive file name patterns (.env, keys, secrets.*)"""
+    name = os.path.basename(path)
+    return [
+        {'type': 'sensitive_file_pattern', 'file': path, 'pattern': pattern, 'risk_level': 'high'}
+        for pattern in SENSITIVE_FILES if re.search(pattern, name, re.IGNORECASE)
+    ]
+
+
+def _scan_job(job: Tuple[str, str, str]) -> Tuple[str, Optional[Dict[str, Any]]]:
+    key, root, path = job
+    try:
+        with open(os.path.join(root, path), 'rb') as f:
+            return key, scan_bytes(f.read())
+    except OSError:
+        return key, None
+
+
+def find_files(index: DocumentIndex) -> List[str]:
+    """Scanned file types outside hidden and build directories"""
+    files = []
+    for record in index.files(kinds=SCANNED_SUFFIXES):
+        directories = record.path.split('/')[:-1]
+        if any(part.startswith('.') or part in SKIPPED_DIRS for part in directories):
+            continue
+        files.append(record.path)
+    return files
+
+
+class SecurityScanner:
+    """Scans distinct blobs through a hash-keyed cache and a worker pool"""
+
+    def __init__(self, root: str = '.', cache: Optional[ResultCache] = None, workers: Optional[int] = None):
+        self.root = os.path.abspath(root)
+        self.cache = cache
+        self.workers = workers
+        self.scanned = 0
+        self.cached = 0
+
+    def scan(self, groups: Dict[str, List[str]]) -> Dict[str, Dict[str, Any]]:
+        """hash -> findings for each group of identical files"""
+        results: Dict[str, Dict[str, Any]] = {}
+        jobs = []
+        for key, paths in groups.items():
+            if self.cache is not None and key in self.cache:
+                results[key] = self.cache.get(key)
+            else:
+                jobs.append((key, self.root, paths[0]))
+        self.cached = len(results)
+
+        if len(jobs) >= POOL_THRESHOLD and self.workers != 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                scanned = list(pool.map(_scan_job, jobs, chunksize=8))
+        else:
+            scanned = [_scan_job(job) for job in jobs]
+
+        for key, findings in scanned:
+            if findings is None:
+                continue
+            results[key] = findings
+            self.scanned += 1
+            if self.cache is not None:
+                self.cache.put(key, findings)
+        if self.cache is not None:
+            self.cache.retain(groups)
+            self.cache.save()
+        return results
+
+
+def build_report(groups: Dict[str, List[str]], results: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """The security_compliance_report.json structure"""
+    report: Dict[str, Any] = {
+        'timestamp': datetime.now().isoformat(),
+        'files_scanned': 0,
+        'secrets_found': 0,
+        'compliance_flags': 0,
+        'high_entropy_tokens': 0,
+        'security_score': 100,
+        'findings': {
+            'secrets': [],
+            'compliance': [],
+            'file_structure': [],
+            'high_entropy': [],
+        },
+    }
+    findings = report['findings']
+    for key, paths in sorted(groups.items(), key=lambda item: item[1][0]):
+        result = results.get(key)
+        for path in sorted(paths):
+            findings['file_structure'].extend(check_file_name(path))
+            if result is None:
+                continue
+            report['files_scanned'] += 1
+            for secret in result['secrets']:
+                findings['secrets'].append({'type': secret['type'], 'file': path, 'line': secret['line'],
+                                            'context': secret['context'], 'entropy': secret['entropy']})
+            for area in result['compliance']:
+                findings['compliance'].append({'compliance_area': area, 'file': path, 'requires_review': True})
+            for token in result['high_entropy']:
+                findings['high_entropy'].append({'file': path, **token})
+
+    report['secrets_found'] = len(findings['secrets'])
+    report['compliance_flags'] = len(findings['compliance'])
+    report['high_entropy_tokens'] = len(findings['high_entropy'])
+    # High-entropy tokens are informational: they are not scored or remediated
+    deductions = report['secrets_found'] * 20 + len(findings['file_structure']) * 10
+    report['security_score'] = max(0, 100 - deductions)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Scan the repository for secrets and compliance-relevant content')
+    parser.add_argument('directory', nargs='?', default='.',
+                        help='Directory to scan (default: current directory)')
+    parser.add_argument('--output', default='security_compliance_report.json',
+                        help='Report path (default: security_compliance_report.json)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes (default: CPU count)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Ignore and do not update the scan cache')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='List every finding')
+    args = parser.parse_args()
+
+    directory = os.path.abspath(args.directory)
+    print("🛡️ Starting integrated security and compliance scan...")
+
+    index = DocumentIndex.open(directory)
+    try:
+        files = find_files(index)
+        groups = BlobMap.from_index(index, SCANNED_SUFFIXES).distinct(files)
+    finally:
+        index.close()
+
+    cache = None if args.no_cache else ResultCache('security_scan', directory, SCANNER_VERSION)
+    scanner = SecurityScanner(directory, cache, args.workers)
+    report = build_report(groups, scanner.scan(groups))
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    findings = report['findings']
+    print("📊 Security & Compliance Results:")
+    print(f"   Files scanned: {report['files_scanned']} "
+          f"({len(groups)} distinct, {scanner.scanned} read, {scanner.cached} from cache)")
+    print(f"   Security score: {report['security_score']}/100")
+    print(f"   Secrets found: {report['secrets_found']}")
+    print(f"   High-entropy tokens: {report['high_entropy_tokens']}")
+    print(f"   Compliance flags: {report['compliance_flags']}")
+
+    if report['secrets_found'] > 0:
+        print("\n🚨 SECURITY ALERT: Potential secrets found!")
+        for secret in findings['secrets'] if args.verbose else findings['secrets'][:3]:
+            print(f"   📄 {secret['file']}:{secret['line']}")
+            print(f"      Type: {secret['type']}")
+
+    if args.verbose:
+        for token in findings['high_entropy']:
+            print(f"   🎲 {token['file']}:{token['line']} high-entropy token ({token['entropy']} bits/char)")
+        for issue in findings['file_structure']:
+            print(f"   🗂️  {issue['file']}: matches {issue['pattern']}")
+
+    if report['compliance_flags'] > 0:
+        print("\n⚖️ Compliance areas detected:")
+        for area in sorted({item['compliance_area'] for item in findings['compliance']}):
+            print(f"   • {area}")
+
+    if report['security_score'] == 100:
+        print("✅ No security issues detected!")
+    print(f"📄 Report written to {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
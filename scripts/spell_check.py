@@ -0,0 +1,532 @@
+#!/usr/bin/env python3
+"""
+VOITHER Spell Checker
+Pure-Python symmetric-delete (SymSpell) spell checking for the documentation
+
+Features:
+- Honors validation.spell_check in docs-config.yml (enabled, languages,
+  word_lists, custom_dictionary, max_edit_distance)
+- en_US and pt_BR word lists (hunspell .dic or plain word-per-line files),
+  project-local or from the system, plus the custom dictionary, precompiled
+  to an mmap-able index under .docs-cache/ and rebuilt only when a source
+  list changes
+- Without a word list for every configured language, unknown words are
+  reported but no corrections are suggested
+- Words used across several documents count as known project vocabulary
+- Code fences, inline code spans, URLs, link targets, HTML and frontmatter
+  are skipped
+- Extracted words are cached per file hash; each distinct word is looked
+  up once per run
+"""
+
+import os
+import re
+import sys
+import mmap
+import zlib
+import array
+import bisect
+import struct
+import hashlib
+import argparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate, chain
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from blob_map import BlobMap
+from code_blocks import FENCE_OPEN
+from docs_cache import ResultCache, atomic_write, cache_path
+from docs_index import DocumentIndex
+from docs_rules import get_engine, split_frontmatter
+
+# Bump when word extraction changes so cached results are discarded
+EXTRACTOR_VERSION = 1
+
+INDEX_FILE = 'spell_index.bin'
+INDEX_MAGIC = b'VSYM'
+INDEX_FORMAT = 1
+# magic, format, max distance, prefix length, words, keys, postings, source digest
+INDEX_HEADER = struct.Struct('<4sIIIIII32s4x')
+
+DEFAULT_MAX_DISTANCE = 2
+PREFIX_LENGTH = 7
+
+# Words shorter than this are never reported, and words shorter than
+# SHORT_WORD only get single-edit suggestions
+MIN_WORD_LENGTH = 4
+SHORT_WORD = 6
+
+# A word used in at least this many distinct documents is project vocabulary
+CORPUS_MIN_DOCUMENTS = 3
+# A suggestion drawn only from project vocabulary must be this many times
+# more common than the word it replaces
+VOCABULARY_RATIO = 5
+
+# Inflections accepted when the stem is known: (suffix, replacement). Word
+# lists without affix expansion (hunspell .dic stems) only carry the stem.
+INFLECTIONS = [
+    ("'s", ''), ('ies', 'y'), ('ied', 'y'), ('es', ''), ('s', ''),
+    ('ed', ''), ('ed', 'e'), ('ing', ''), ('ing', 'e'), ('ly', ''),
+    ('er', ''), ('ers', ''), ('ment', ''), ('ments', ''), ('al', ''),
+]
+
+POOL_THRESHOLD = 64
+
+WORD_LISTS = {
+    'en_US': [
+        '/usr/share/hunspell/en_US.dic',
+        '/usr/share/myspell/en_US.dic',
+        '/usr/share/dict/american-english',
+        '/usr/share/dict/words',
+    ],
+    'pt_BR': [
+        '/usr/share/hunspell/pt_BR.dic',
+        '/usr/share/myspell/pt_BR.dic',
+        '/usr/share/dict/brazilian',
+    ],
+}
+
+WORD = re.compile(r"[^\W\d_]+(?:['’][^\W\d_]+)*")
+SKIPPED_SPANS = re.compile(
+    r'`+[^`\n]*`+'                 # inline code
+    r'|\]\([^)\n]*\)'              # link targets
+    r'|<[^>\n]*>'                  # HTML tags and autolinks
+    r'|\b(?:https?|ftp)://\S+'     # bare URLs
+    r'|\b[\w.+-]+@[\w-]+\.[\w.]+'  # e-mail addresses
+    r'|\S+[/\\]\S+'                # paths
+)
+
+
+def extract_words(text: str) -> Dict[str, List[int]]:
+    """Checkable words of a markdown document -> the lines they appear on"""
+    _, body, offset = split_frontmatter(text)
+    first_line = text.count('\n', 0, offset) + 1
+    words: Dict[str, List[int]] = {}
+    fence: Optional[str] = None
+
+    for number, line in enumerate(body.split('\n'), first_line):
+        if fence is not None:
+            stripped = line.strip()
+            if stripped.startswith(fence) and not stripped.strip(fence[0]):
+                fence = None
+            continue
+        opening = FENCE_OPEN.match(line)
+        if opening:
+            fence = opening.group('fence')
+            continue
+        if line.startswith(('    ', '\t')):
+            continue  # indented code
+        for match in WORD.finditer(SKIPPED_SPANS.sub(' ', line)):
+            word = match.group()
+            # Acronyms, camelCase identifiers and very short words are not prose
+            if len(word) < MIN_WORD_LENGTH or not word[1:].islower():
+                continue
+            lines = words.setdefault(word, [])
+            if not lines or lines[-1] != number:
+                lines.append(number)
+    return words
+
+
+def _extract_job(job: Tuple[str, str]) -> Tuple[str, Optional[Dict[str, List[int]]]]:
+    key, path = job
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return key, extract_words(f.read())
+    except (OSError, UnicodeDecodeError):
+        return key, None
+
+
+def normalize(word: str) -> str:
+    return word.replace('’', "'").lower()
+
+
+def deletes(word: str, distance: int) -> set:
+    """Every string reachable from word by up to `distance` deletions"""
+    found = {word}
+    frontier = [word]
+    for _ in range(distance):
+        following = []
+        for item in frontier:
+            for index in range(len(item)):
+                shorter = item[:index] + item[index + 1:]
+                if shorter not in found:
+                    found.add(shorter)
+                    following.append(shorter)
+        frontier = following
+    return found
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Optimal string alignment distance, or limit + 1 once it exceeds limit"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                value = min(value, previous2[j - 2] + 1)
+            current[j] = value
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1] if previous[-1] <= limit else limit + 1
+
+
+def delete_key(text: str) -> int:
+    # Collisions only add candidates; every candidate is verified by distance
+    return zlib.crc32(text.encode('utf-8'))
+
+
+class SymSpell:
+    """Symmetric-delete lookup over an in-memory lexicon"""
+
+    def __init__(self, max_distance: int = DEFAULT_MAX_DISTANCE, prefix_length: int = PREFIX_LENGTH):
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.words: List[str] = []
+        self.frequencies: List[int] = []
+        self.ids: Dict[str, int] = {}
+        self.buckets: Dict[int, List[int]] = {}
+
+    def add(self, word: str, frequency: int = 1) -> None:
+        word_id = self.ids.get(word)
+        if word_id is not None:
+            self.frequencies[word_id] += frequency
+            return
+        word_id = self.ids[word] = len(self.words)
+        self.words.append(word)
+        self.frequencies.append(frequency)
+        for deleted in deletes(word[:self.prefix_length], self.max_distance):
+            self.buckets.setdefault(delete_key(deleted), []).append(word_id)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.ids
+
+    def candidates(self, key: int) -> Iterable[int]:
+        return self.buckets.get(key, ())
+
+    def word(self, word_id: int) -> str:
+        return self.words[word_id]
+
+    def frequency(self, word_id: int) -> int:
+        return self.frequencies[word_id]
+
+    def lookup(self, word: str, max_distance: Optional[int] = None) -> Optional[Tuple[str, int, int]]:
+        """Best (suggestion, distance, frequency) within max_distance, if any"""
+        limit = self.max_distance if max_distance is None else min(max_distance, self.max_distance)
+        best: Optional[Tuple[str, int, int]] = None
+        seen = set()
+        for deleted in deletes(word[:self.prefix_length], limit):
+            for word_id in self.candidates(delete_key(deleted)):
+                if word_id in seen:
+                    continue
+                seen.add(word_id)
+                candidate = self.word(word_id)
+                distance = edit_distance(word, candidate, limit if best is None else best[1])
+                if distance > limit:
+                    continue
+                frequency = self.frequency(word_id)
+                if best is None or (distance, -frequency) < (best[1], -best[2]):
+                    best = (candidate, distance, frequency)
+                    if distance == 0:
+                        return best
+        return best
+
+    def save(self, path: str, digest: bytes) -> None:
+        """Write the lexicon and its delete index in the mmap-able format"""
+        encoded = [word.encode('utf-8') for word in self.words]
+        word_offsets = array.array('I', [0])
+        for data in encoded:
+            word_offsets.append(word_offsets[-1] + len(data))
+        buckets = sorted(self.buckets.items())
+        keys = array.array('I', (key for key, _ in buckets))
+        posting_offsets = array.array('I', [0])
+        posting_offsets.extend(accumulate(len(ids) for _, ids in buckets))
+        postings = array.array('I', chain.from_iterable(ids for _, ids in buckets))
+
+        header = INDEX_HEADER.pack(
+            INDEX_MAGIC, INDEX_FORMAT, self.max_distance, self.prefix_length,
+            len(self.words), len(keys), len(postings), digest
+        )
+        atomic_write(path, b''.join([
+            header,
+            word_offsets.tobytes(),
+            array.array('I', self.frequencies).tobytes(),
+            keys.tobytes(),
+            posting_offsets.tobytes(),
+            postings.tobytes(),
+            b''.join(encoded),
+        ]))
+
+
+class MappedSymSpell(SymSpell):
+    """SymSpell lookup served straight from a memory-mapped index file"""
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, max_distance, prefix_length,
+         word_count, key_count, posting_count, self.digest) = INDEX_HEADER.unpack_from(self._map)
+        if magic != INDEX_MAGIC or version != INDEX_FORMAT:
+            self._map.close()
+            raise ValueError(f"{path}: not a spell index (format {INDEX_FORMAT})")
+        super().__init__(max_distance, prefix_length)
+
+        view = memoryview(self._map)
+        position = INDEX_HEADER.size
+
+        def section(count: int) -> memoryview:
+            nonlocal position
+            start, position = position, position + 4 * count
+            return view[start:position].cast('I')
+
+        self._word_offsets = section(word_count + 1)
+        self._frequencies = section(word_count)
+        self._keys = section(key_count)
+        self._posting_offsets = section(key_count + 1)
+        self._postings = section(posting_count)
+        self._text = position
+        self.word_count = word_count
+
+    def __contains__(self, word: str) -> bool:
+        found = self.lookup(word, 0)
+        return found is not None
+
+    def candidates(self, key: int) -> Iterable[int]:
+        slot = bisect.bisect_left(self._keys, key)
+        if slot == len(self._keys) or self._keys[slot] != key:
+            return ()
+        return self._postings[self._posting_offsets[slot]:self._posting_offsets[slot + 1]]
+
+    def word(self, word_id: int) -> str:
+        start = self._text + self._word_offsets[word_id]
+        end = self._text + self._word_offsets[word_id + 1]
+        return self._map[start:end].decode('utf-8')
+
+    def frequency(self, word_id: int) -> int:
+        return self._frequencies[word_id]
+
+    def add(self, word: str, frequency: int = 1) -> None:
+        raise TypeError("a mapped spell index is read-only")
+
+
+def read_word_list(path: str) -> Iterator[Tuple[str, int]]:
+    """(word, frequency) pairs from a hunspell .dic, a 'word count' list or a plain list"""
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        first = True
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            if first and path.endswith('.dic') and line.isdigit():
+                first = False
+                continue  # hunspell word count
+            first = False
+            word, _, rest = line.partition('/') if path.endswith('.dic') else line.partition(' ')
+            word = word.split()[0] if word.split() else ''
+            frequency = rest.strip().split()[0] if rest.strip() else ''
+            if word:
+                yield normalize(word), int(frequency) if frequency.isdigit() else 1
+
+
+class SpellChecker:
+    """Spelling configuration from docs-config.yml and the lexicons it names"""
+
+    def __init__(self, root: str, settings: Dict):
+        self.root = os.path.abspath(root)
+        self.enabled = settings.get('enabled', True)
+        languages = settings.get('languages') or [settings.get('language', 'en_US')]
+        self.languages: List[str] = [str(language) for language in languages]
+        self.max_distance = int(settings.get('max_edit_distance', DEFAULT_MAX_DISTANCE))
+        custom = settings.get('custom_dictionary')
+        self.custom_dictionary = os.path.join(self.root, custom) if custom else None
+        # language -> project-local word list, tried before the system ones
+        local_lists = settings.get('word_lists') or {}
+
+        self.sources: List[str] = []
+        self.missing: List[str] = []
+        for language in self.languages:
+            candidates = list(WORD_LISTS.get(language, []))
+            if local_lists.get(language):
+                candidates.insert(0, os.path.join(self.root, local_lists[language]))
+            found = [path for path in candidates if os.path.isfile(path)]
+            if found:
+                self.sources.append(found[0])
+            else:
+                self.missing.append(language)
+        if self.custom_dictionary and os.path.isfile(self.custom_dictionary):
+            self.sources.append(self.custom_dictionary)
+
+        self.dictionary = self._load_dictionary()
+        self.vocabulary = SymSpell(self.max_distance)
+        self.document_frequency: Counter = Counter()
+        self._verdicts: Dict[str, Optional[Tuple[str, int, int]]] = {}
+
+    def _digest(self) -> bytes:
+        fingerprint = hashlib.sha256(f"{INDEX_FORMAT}:{self.max_distance}:{PREFIX_LENGTH}".encode())
+        for path in self.sources:
+            status = os.stat(path)
+            fingerprint.update(f"\0{path}\0{status.st_size}\0{status.st_mtime_ns}".encode())
+        return fingerprint.digest()
+
+    def _load_dictionary(self) -> SymSpell:
+        path = str(cache_path(self.root, INDEX_FILE))
+        digest = self._digest()
+        try:
+            mapped = MappedSymSpell(path)
+            if mapped.digest == digest:
+                return mapped
+        except (OSError, ValueError, struct.error):
+            pass
+
+        lexicon = SymSpell(self.max_distance)
+        for source in self.sources:
+            for word, frequency in read_word_list(source):
+                lexicon.add(word, frequency)
+        lexicon.save(path, digest)
+        return MappedSymSpell(path)
+
+    def learn(self, document_frequency: Counter) -> None:
+        """Words used across enough documents become known vocabulary"""
+        self.document_frequency = document_frequency
+        for word, count in document_frequency.items():
+            if count >= CORPUS_MIN_DOCUMENTS:
+                self.vocabulary.add(word, count)
+
+    def check(self, word: str) -> Optional[Tuple[str, int, int]]:
+        """
+        None when the word is known, otherwise the best suggestion
+
+        The suggestion is ('', 0, 0) when nothing is within edit distance.
+        """
+        key = normalize(word)
+        if key not in self._verdicts:
+            self._verdicts[key] = self._check(key)
+        return self._verdicts[key]
+
+    def known(self, word: str) -> bool:
+        if word in self.vocabulary or word in self.dictionary:
+            return True
+        for suffix, replacement in INFLECTIONS:
+            if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+                stem = word[:-len(suffix)] + replacement
+                if stem in self.vocabulary or stem in self.dictionary:
+                    return True
+        # Contractions of known words (you're, don't, it's)
+        return "'" in word and word.split("'")[0] in self.dictionary
+
+    def _check(self, word: str) -> Optional[Tuple[str, int, int]]:
+        if self.known(word):
+            return None
+        if self.missing:
+            # Valid words of an uncovered language would be "corrected" into
+            # whatever the remaining lexicons hold
+            return ('', 0, 0)
+        limit = 1 if len(word) < SHORT_WORD else self.max_distance
+        found = self.dictionary.lookup(word, limit)
+        if found is None:
+            # Project vocabulary alone only vouches for near-identical, far
+            # more common spellings
+            suggestion = self.vocabulary.lookup(word, 1)
+            used = self.document_frequency.get(word, 0)
+            if suggestion and suggestion[2] >= VOCABULARY_RATIO * max(used, 1):
+                found = suggestion
+        return found or ('', 0, 0)
+
+
+def find_documents(index: DocumentIndex) -> List[str]:
+    """Indexed markdown outside the directories docs-config.yml excludes"""
+    matcher = get_engine(index.root).matcher
+    return [record.path for record in index.files(kinds=('.md',))
+            if not matcher.in_excluded_dir(record.path)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Spell check VOITHER documentation')
+    parser.add_argument('directory', nargs='?', default='.',
+                        help='Documentation root (default: current directory)')
+    parser.add_argument('--verbose', '-v', action='store_true',
+                        help='Also list unknown words that have no close suggestion')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes (default: CPU count)')
+    args = parser.parse_args()
+
+    directory = os.path.abspath(args.directory)
+    settings = get_engine(directory).spell_check
+    if not settings.get('enabled', True):
+        print("🔤 Spell check disabled in docs-config.yml")
+        return 0
+
+    checker = SpellChecker(directory, settings)
+    for language in checker.missing:
+        print(f"⚠️  {language} unavailable: no word list found, so no corrections will be suggested")
+        print(f"   Set spell_check.word_lists.{language} in docs-config.yml or install "
+              f"hunspell-{language.lower().replace('_', '-')}")
+
+    index = DocumentIndex.open(directory)
+    try:
+        documents = find_documents(index)
+        groups = BlobMap.from_index(index, ('.md',)).distinct(documents)
+    finally:
+        index.close()
+
+    # Words per distinct document, extracted once per content hash
+    cache = ResultCache('spell_check', directory, EXTRACTOR_VERSION)
+    words_by_blob: Dict[str, Dict[str, List[int]]] = {}
+    jobs = []
+    for key, paths in groups.items():
+        if key in cache:
+            words_by_blob[key] = cache.get(key)
+        else:
+            jobs.append((key, os.path.join(directory, paths[0])))
+    if len(jobs) >= POOL_THRESHOLD and args.workers != 1:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            extracted = list(pool.map(_extract_job, jobs, chunksize=8))
+    else:
+        extracted = [_extract_job(job) for job in jobs]
+    for key, words in extracted:
+        if words is not None:
+            words_by_blob[key] = words
+            cache.put(key, words)
+    cache.retain(groups)
+    cache.save()
+
+    document_frequency: Counter = Counter()
+    for words in words_by_blob.values():
+        document_frequency.update({normalize(word) for word in words})
+    checker.learn(document_frequency)
+
+    print(f"🔤 Spell checking {len(documents)} documents ({len(groups)} distinct, "
+          f"{len(document_frequency)} distinct words, {checker.dictionary.word_count} dictionary words)...")
+
+    misspelled = unknown = 0
+    for key, paths in sorted(groups.items(), key=lambda item: item[1][0]):
+        for word, lines in sorted(words_by_blob.get(key, {}).items(), key=lambda item: item[1][0]):
+            verdict = checker.check(word)
+            if verdict is None:
+                continue
+            suggestion = verdict[0]
+            if suggestion:
+                misspelled += len(paths)
+            else:
+                unknown += len(paths)
+                if not args.verbose:
+                    continue
+            hint = f" → {suggestion}" if suggestion else ""
+            where = ','.join(str(line) for line in lines[:5]) + (',…' if len(lines) > 5 else '')
+            for rel_path in paths:
+                print(f"  {'❌' if suggestion else '❔'} {rel_path}:{where} {word}{hint}")
+
+    print(f"\n📊 Spelling: {misspelled} likely misspellings, {unknown} unknown words without a suggestion")
+    if checker.missing:
+        print(f"   Suggestions skipped; languages unavailable: {', '.join(checker.missing)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
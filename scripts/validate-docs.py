@@ -5,49 +5,27 @@ Simple script to validate internal links in markdown files
 """
 
 import os
-import re
 import sys
-from pathlib import Path
-from urllib.parse import urlparse
+import posixpath
 import argparse
 
-def find_markdown_files(directory):
-    """Find all markdown files in directory"""
-    md_files = []
-    for root, dirs, files in os.walk(directory):
-        # Skip hidden directories, build directories, and raw folder (unprocessed backups)
-        dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['build', 'dist', 'node_modules', 'raw']]
-        
-        for file in files:
-            if file.endswith('.md'):
-                md_files.append(os.path.join(root, file))
-    
-    return md_files
+import instrumentation
+from asset_pipeline import check_budget
+from docs_index import DocumentIndex
+from docs_rules import get_engine
 
-def extract_links(content, file_path):
-    """Extract internal links from markdown content"""
-    # Pattern for markdown links: [text](link)
-    link_pattern = r'\[([^\]]*)\]\(([^)]+)\)'
-    links = []
-    
-    for match in re.finditer(link_pattern, content):
-        text = match.group(1)
-        url = match.group(2)
-        
-        # Skip external URLs and anchors
-        if url.startswith(('http://', 'https://', '#', 'mailto:')):
-            continue
-            
-        links.append({
-            'text': text,
-            'url': url,
-            'line': content[:match.start()].count('\n') + 1
-        })
-    
-    return links
+def find_markdown_files(index, engine):
+    """Indexed markdown files selected by docs-config.yml (hidden, build and raw folders excluded)"""
+    return [record for record in index.markdown() if engine.matcher.matches(record.path)]
+
+def internal_links(record):
+    """Internal links of an indexed markdown file"""
+    # Skip external URLs and anchors
+    return [link for link in record.links
+            if not link['url'].startswith(('http://', 'https://', '#', 'mailto:'))]
 
-def check_file_exists(link_url, base_path):
-    """Check if a linked file exists"""
+def check_file_exists(link_url, base_path, index):
+    """Check if a linked file exists, relative to base_path inside the index root"""
     # Handle different link formats
     if link_url.startswith('./'):
         link_url = link_url[2:]  # Remove ./
@@ -62,48 +40,53 @@ def check_file_exists(link_url, base_path):
     if not link_url:
         return True
     
-    # Build full path
-    full_path = os.path.join(base_path, link_url)
+    # Resolve against the index; links leaving the root fall back to the filesystem
+    rel_path = posixpath.normpath(posixpath.join(base_path, link_url))
+    if rel_path == '..' or rel_path.startswith('../'):
+        return os.path.exists(os.path.join(index.root, base_path, link_url))
     
-    return os.path.exists(full_path)
+    return index.exists(rel_path)
 
 def validate_documentation_links(directory):
     """Validate all internal links in documentation"""
-    md_files = find_markdown_files(directory)
-    errors = []
-    total_links = 0
-    valid_links = 0
-    
-    print(f"🔍 Checking links in {len(md_files)} markdown files...")
-    
-    for md_file in md_files:
-        try:
-            with open(md_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except Exception as e:
-            errors.append(f"❌ Error reading {md_file}: {e}")
-            continue
+    index = DocumentIndex.open(directory)
+    try:
+        engine = get_engine(directory)
+        md_files = find_markdown_files(index, engine)
+        errors = []
+        rule_findings = []
+        total_links = 0
+        valid_links = 0
+    
+        print(f"🔍 Checking links in {len(md_files)} markdown files...")
+    
+        for record in md_files:
+            rel_path = record.path
         
-        # Get relative path for display
-        rel_path = os.path.relpath(md_file, directory)
-        links = extract_links(content, md_file)
+            # docs-config.yml rules run on the same indexed facts as the link check
+            report = engine.evaluate_record(record)
+            rule_findings.extend((rel_path, finding) for finding in report.findings)
         
-        if not links:
-            continue
+            links = internal_links(record)
+        
+            if not links:
+                continue
             
-        print(f"  📄 {rel_path} ({len(links)} links)")
+            print(f"  📄 {rel_path} ({len(links)} links)")
         
-        for link in links:
-            total_links += 1
-            base_path = os.path.dirname(md_file)
+            for link in links:
+                total_links += 1
+                base_path = posixpath.dirname(rel_path)
             
-            if check_file_exists(link['url'], base_path):
-                valid_links += 1
-                print(f"    ✅ Line {link['line']}: {link['url']}")
-            else:
-                error_msg = f"    ❌ Line {link['line']}: {link['url']} -> File not found"
-                errors.append(f"{rel_path}:{link['line']} - {link['url']}")
-                print(error_msg)
+                if check_file_exists(link['url'], base_path, index):
+                    valid_links += 1
+                    print(f"    ✅ Line {link['line']}: {link['url']}")
+                else:
+                    error_msg = f"    ❌ Line {link['line']}: {link['url']} -> File not found"
+                    errors.append(f"{rel_path}:{link['line']} - {link['url']}")
+                    print(error_msg)
+    finally:
+        index.close()
     
     # Summary
     print(f"\n📊 Link Validation Summary:")
@@ -111,12 +94,24 @@ def validate_documentation_links(directory):
     print(f"  🔗 Total links: {total_links}")
     print(f"  ✅ Valid links: {valid_links}")
     print(f"  ❌ Broken links: {len(errors)}")
+    print(f"  📐 Rule errors: {sum(1 for _, f in rule_findings if f.severity == 'error')}")
+    print(f"  ⚠️  Rule warnings: {sum(1 for _, f in rule_findings if f.severity == 'warning')}")
+    
+    if rule_findings:
+        print("\n📐 docs-config.yml Rule Findings:")
+        for rel_path, finding in rule_findings:
+            icon = "❌" if finding.severity == "error" else "⚠️ "
+            print(f"  {icon} {rel_path}: {finding.message}")
     
     if errors:
         print(f"\n💥 Broken Links Found:")
         for error in errors:
             print(f"  ❌ {error}")
         return False
+    elif any(f.severity == "error" for _, f in rule_findings):
+        rule_errors = sum(1 for _, f in rule_findings if f.severity == "error")
+        print(f"\n❌ {rule_errors} docs-config.yml rule errors")
+        return False
     else:
         print(f"\n🎉 All links are valid!")
         return True
@@ -151,15 +146,41 @@ def check_required_files(directory):
         print(f"\n🎉 All required files present!")
         return True
 
+def check_asset_budget(directory):
+    """Check images against the per-asset size budget in docs-config.yml"""
+    index = DocumentIndex.open(directory)
+    try:
+        over_budget = check_budget(index)
+    finally:
+        index.close()
+    
+    print("\n🖼️  Checking asset size budget...")
+    
+    if over_budget:
+        for rel_path, size, budget in over_budget:
+            print(f"  ❌ {rel_path}: {size / 1024:.0f} KB (budget {budget / 1024:.0f} KB)")
+        print("  💡 Run 'make assets' to optimize, or shrink the source image")
+        return False
+    else:
+        print("  ✅ All assets within budget")
+        return True
+
 def main():
     parser = argparse.ArgumentParser(description='Validate VOITHER documentation links')
     parser.add_argument('directory', nargs='?', default='.', 
                         help='Directory to check (default: current directory)')
     parser.add_argument('--quick', action='store_true',
                         help='Quick check - skip detailed link validation')
+    instrumentation.add_arguments(parser)
     
     args = parser.parse_args()
     
+    with instrumentation.from_args('validate-docs', args):
+        run(args)
+
+def run(args):
+    """Run the validation phases for parsed arguments; always exits"""
+    
     directory = os.path.abspath(args.directory)
     
     if not os.path.exists(directory):
@@ -171,15 +192,21 @@ def main():
     print("=" * 50)
     
     # Check required files
-    required_files_ok = check_required_files(directory)
+    with instrumentation.span('required-files'):
+        required_files_ok = check_required_files(directory)
+    
+    # Check image sizes
+    with instrumentation.span('asset-budget'):
+        assets_ok = check_asset_budget(directory)
     
     if not args.quick:
         # Check links
-        links_ok = validate_documentation_links(directory)
+        with instrumentation.span('links'):
+            links_ok = validate_documentation_links(directory)
         
-        overall_success = required_files_ok and links_ok
+        overall_success = required_files_ok and assets_ok and links_ok
     else:
-        overall_success = required_files_ok
+        overall_success = required_files_ok and assets_ok
     
     print("=" * 50)
     
@@ -0,0 +1,462 @@
+#!/usr/bin/env python3
+"""
+VOITHER Workflow Trigger Coverage
+Evaluates the path filters of every GitHub Actions workflow against the real file list
+
+Features:
+- Parses .github/workflows/*.yml once (including YAML's `on:` -> True quirk)
+- paths / paths-ignore globs compiled with GitHub's filter semantics
+  (*, **, ?, +, [], and ! negation where the last matching pattern wins)
+- Each distinct pattern is matched against the whole file list once;
+  suffix, prefix and literal patterns skip the regex engine entirely
+- Reports which files trigger which workflows and which trigger none
+- Produces the file-processing matrix compliance report used in CI
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import bisect
+import argparse
+import posixpath
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import yaml
+
+from docs_index import DocumentIndex
+
+WORKFLOWS_DIR = '.github/workflows'
+
+# Events whose runs can be narrowed by paths / paths-ignore
+PATH_EVENTS = ('push', 'pull_request', 'pull_request_target')
+
+GLOB_CHARS = re.compile(r'[*?+\[\]!]')
+SUFFIX_PATTERN = re.compile(r'\*\*(?:/\*)?(\.[^*?+\[\]!/]+)')
+PREFIX_PATTERN = re.compile(r'([^*?+\[\]!]+)/\*\*')
+
+# File processing matrix: the types every documentation workflow is expected to react to
+EXPECTED_FILE_TYPES = ['.md', '.py', '.js', '.ts', '.json', '.yml', '.yaml']
+MIN_TYPES_COVERED = 5
+
+DOCUMENTED_WORKFLOWS = {
+    "integrated-documentation-validation.yml": "Security & validation workflow",
+    "auto-documentation-update.yml": "Automatic documentation updates",
+    "ai-orchestration-setup.yml": "AI coordination and setup",
+    "copilot-documentation-agent.yml": "Copilot-powered documentation agent",
+    "file-processing-matrix-verification.yml": "Matrix compliance verification",
+    "github-models-documentation-enhancer.yml": "GitHub Models AI enhancement",
+}
+
+
+def glob_to_regex(pattern: str) -> str:
+    """Translate a GitHub Actions filter pattern to a regex over one line of a path list"""
+    atoms: List[str] = []
+    index = 0
+    while index < len(pattern):
+        if pattern.startswith('**/', index):
+            atoms.append('(?:.*/)?')
+            index += 3
+            continue
+        if pattern.startswith('**', index):
+            atoms.append('.*')
+            index += 2
+            continue
+        char = pattern[index]
+        if char == '*':
+            atoms.append('[^/\\n]*')
+        elif char in '?+' and atoms:
+            # GitHub: zero-or-one / one-or-more of the preceding character
+            atoms[-1] = f'(?:{atoms[-1]}){char}'
+        elif char == '[':
+            end = pattern.find(']', index + 1)
+            if end == -1:
+                atoms.append(re.escape(char))
+            else:
+                members = pattern[index + 1:end]
+                if members[:1] in ('!', '^'):
+                    members = '^\\n' + members[1:]
+                atoms.append(f'[{members}]')
+                index = end
+        else:
+            atoms.append(re.escape(char))
+        index += 1
+    return ''.join(atoms)
+
+
+class FileSet:
+    """The repository file list with the lookups compiled patterns need
+
+    Paths are sorted and numbered; a set of files is an int bitmask over those
+    numbers, so combining patterns, events and workflows is word-wide integer
+    arithmetic. Paths are also joined into one newline-separated text, so a
+    regex pattern is a single scan of that text (narrowed to the pattern's
+    literal directory prefix) rather than one match call per path.
+    """
+
+    def __init__(self, paths: List[str]):
+        self.paths = sorted(set(paths))
+        self.all = (1 << len(self.paths)) - 1
+        self.text = '\n'.join(self.paths)
+        self.offsets: List[int] = []
+        self.by_extension: Dict[str, List[int]] = {}
+        offset = 0
+        for number, path in enumerate(self.paths):
+            self.offsets.append(offset)
+            offset += len(path) + 1
+            dot = path.rfind('.')
+            extension = path[dot:] if dot > path.rfind('/') else ''
+            self.by_extension.setdefault(extension, []).append(number)
+        self._matches: Dict[str, int] = {}
+
+    def mask(self, numbers: Iterable[int]) -> int:
+        bits = ['0'] * len(self.paths)
+        for number in numbers:
+            bits[number] = '1'
+        return int(''.join(reversed(bits)) or '0', 2)
+
+    def select(self, mask: int) -> List[str]:
+        """Paths in a bitmask, in sorted order"""
+        bits = bin(mask)[:1:-1]
+        paths = []
+        number = bits.find('1')
+        while number != -1:
+            paths.append(self.paths[number])
+            number = bits.find('1', number + 1)
+        return paths
+
+    def number_of(self, path: str) -> Optional[int]:
+        number = bisect.bisect_left(self.paths, path)
+        return number if number < len(self.paths) and self.paths[number] == path else None
+
+    def matches(self, pattern: str) -> int:
+        """Files matching one pattern; each distinct pattern is evaluated once"""
+        if pattern not in self._matches:
+            self._matches[pattern] = self._evaluate(pattern)
+        return self._matches[pattern]
+
+    def _range(self, prefix: str) -> Tuple[int, int]:
+        low = bisect.bisect_left(self.paths, prefix)
+        high = bisect.bisect_left(self.paths, prefix + '\U0010ffff', low)
+        return low, high
+
+    def _evaluate(self, pattern: str) -> int:
+        if not GLOB_CHARS.search(pattern):
+            number = self.number_of(pattern)
+            return 0 if number is None else 1 << number
+        suffix = SUFFIX_PATTERN.fullmatch(pattern)
+        if suffix:
+            ending = suffix.group(1)
+            if ending.count('.') == 1:
+                return self.mask(self.by_extension.get(ending, ()))
+            return self.mask(n for n, path in enumerate(self.paths) if path.endswith(ending))
+        prefix = PREFIX_PATTERN.fullmatch(pattern)
+        if prefix:
+            low, high = self._range(prefix.group(1) + '/')
+            return ((1 << (high - low)) - 1) << low
+
+        # Only paths sharing the pattern's literal leading directories can match
+        literal = pattern[:GLOB_CHARS.search(pattern).start()]
+        low, high = self._range(literal[:literal.rfind('/') + 1])
+        if low == high:
+            return 0
+        end = self.offsets[high - 1] + len(self.paths[high - 1])
+        found = compile_pattern(pattern).finditer(self.text, self.offsets[low], end)
+        return self.mask(bisect.bisect_right(self.offsets, m.start()) - 1 for m in found)
+
+
+def compile_pattern(pattern: str) -> 're.Pattern[str]':
+    """Regex matching a pattern inside a newline-separated path list"""
+    head = re.match(r'\*\*/([^*?+\[\]!/]+)', pattern)
+    end = head.end() if head else 0
+    if head and pattern[end:end + 1] in ('?', '+'):
+        end -= 1  # the modifier applies to the literal's last character
+    if end > 3:
+        # `**/name...`: start on the literal so the regex engine can scan for
+        # it directly, then check it begins a path component
+        name = pattern[3:end]
+        rest = glob_to_regex(pattern[end:])
+        return re.compile(f'{re.escape(name)}(?<![^/\\n].{{{len(name)}}})(?:{rest})$', re.MULTILINE)
+    return re.compile(f'^(?:{glob_to_regex(pattern)})$', re.MULTILINE)
+
+
+@dataclass
+class PathFilter:
+    """One event's paths or paths-ignore list, in declaration order"""
+    patterns: List[str]
+    ignore: bool = False
+
+    def evaluate(self, files: FileSet) -> int:
+        """Bitmask of the files that trigger the event under this filter"""
+        # Apply patterns in order: ! removes, the rest add; the last match wins
+        selected = 0
+        for pattern in self.patterns:
+            if pattern.startswith('!'):
+                selected &= ~files.matches(pattern[1:])
+            else:
+                selected |= files.matches(pattern)
+        return files.all & ~selected if self.ignore else selected
+
+
+@dataclass
+class Workflow:
+    name: str
+    path: str
+    events: Dict[str, Optional[PathFilter]] = field(default_factory=dict)  # None: any file
+    other_events: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def declared_patterns(self) -> List[str]:
+        return [p for f in self.events.values() if f for p in f.patterns]
+
+
+def _trigger_config(data: Dict[Any, Any]) -> Any:
+    # YAML 1.1 reads a bare `on:` key as the boolean True
+    return data.get('on', data.get(True)) if isinstance(data, dict) else None
+
+
+def parse_workflow(path: str, rel_path: str) -> Workflow:
+    workflow = Workflow(name=posixpath.splitext(posixpath.basename(rel_path))[0], path=rel_path)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = yaml.safe_load(f)
+    except (OSError, yaml.YAMLError) as e:
+        workflow.error = str(e).split('\n')[0]
+        return workflow
+
+    triggers = _trigger_config(data)
+    if isinstance(triggers, str):
+        triggers = {triggers: None}
+    elif isinstance(triggers, list):
+        triggers = {event: None for event in triggers}
+    elif not isinstance(triggers, dict):
+        triggers = {}
+
+    for event, config in triggers.items():
+        if event not in PATH_EVENTS:
+            workflow.other_events.append(str(event))
+            continue
+        config = config if isinstance(config, dict) else {}
+        if config.get('paths') is not None:
+            workflow.events[event] = PathFilter([str(p) for p in config['paths']])
+        elif config.get('paths-ignore') is not None:
+            workflow.events[event] = PathFilter([str(p) for p in config['paths-ignore']], ignore=True)
+        else:
+            workflow.events[event] = None
+    return workflow
+
+
+def load_workflows(root: str) -> List[Workflow]:
+    directory = os.path.join(root, WORKFLOWS_DIR)
+    try:
+        names = sorted(n for n in os.listdir(directory) if n.endswith(('.yml', '.yaml')))
+    except OSError:
+        return []
+    return [parse_workflow(os.path.join(directory, n), f"{WORKFLOWS_DIR}/{n}") for n in names]
+
+
+@dataclass
+class Coverage:
+    """Which files trigger which workflows"""
+    files: FileSet
+    workflows: List[Workflow]
+    triggered: Dict[str, Dict[str, int]] = field(default_factory=dict)  # workflow -> event -> file mask
+
+    def mask_for(self, workflow: str) -> int:
+        mask = 0
+        for events in self.triggered.get(workflow, {}).values():
+            mask |= events
+        return mask
+
+    def files_for(self, workflow: str) -> List[str]:
+        return self.files.select(self.mask_for(workflow))
+
+    def untriggered(self) -> List[str]:
+        covered = 0
+        for workflow in self.workflows:
+            covered |= self.mask_for(workflow.name)
+        return self.files.select(self.files.all & ~covered)
+
+    def workflows_for(self, path: str) -> List[str]:
+        number = self.files.number_of(path)
+        if number is None:
+            return []
+        return [w.name for w in self.workflows if self.mask_for(w.name) >> number & 1]
+
+
+def compute_coverage(workflows: List[Workflow], paths: List[str]) -> Coverage:
+    files = FileSet(paths)
+    coverage = Coverage(files, workflows)
+    for workflow in workflows:
+        coverage.triggered[workflow.name] = {
+            event: files.all if path_filter is None else path_filter.evaluate(files)
+            for event, path_filter in workflow.events.items()
+        }
+    return coverage
+
+
+@lru_cache(maxsize=None)
+def probe_files(ext: str) -> FileSet:
+    return FileSet([f"docs/example{ext}"])
+
+
+def types_covered(coverage: Coverage, workflow: Workflow) -> List[str]:
+    """Expected file types the workflow reacts to
+
+    A type counts when the workflow triggers on a real file of that type, or,
+    when the repository has none, on a probe path of that type.
+    """
+    triggered = coverage.mask_for(workflow.name)
+    covered = []
+    for ext in EXPECTED_FILE_TYPES:
+        real = coverage.files.matches(f"**/*{ext}")
+        if real:
+            hit = bool(triggered & real)
+        else:
+            probe = probe_files(ext)
+            hit = any(
+                f is None or f.evaluate(probe) for f in workflow.events.values()
+            )
+        if hit:
+            covered.append(ext)
+    return covered
+
+
+def matrix_report(root: str, coverage: Coverage) -> Dict[str, Any]:
+    """The file processing matrix compliance report (matrix_verification_report.json)"""
+    report: Dict[str, Any] = {
+        "verification_timestamp": datetime.now().isoformat(),
+        "matrix_compliance": {},
+        "workflow_coverage": {},
+        "missing_implementations": [],
+        "files_triggering_no_workflow": coverage.untriggered(),
+        "performance_metrics": {},
+        "recommendations": [],
+    }
+
+    compliant = 0
+    for workflow in coverage.workflows:
+        covered = types_covered(coverage, workflow)
+        complies = workflow.error is None and len(covered) >= MIN_TYPES_COVERED
+        compliant += complies
+        report["workflow_coverage"][workflow.name] = {
+            "triggers": workflow.declared_patterns,
+            "events": sorted(workflow.events) + workflow.other_events,
+            "covers_matrix_files": complies,
+            "file_types_covered": len(covered),
+            "file_types": covered,
+            "files_triggering": bin(coverage.mask_for(workflow.name)).count('1'),
+            "error": workflow.error,
+        }
+
+    total = len(coverage.workflows)
+    score = compliant / total if total else 0
+    report["matrix_compliance"] = {
+        "score": score,
+        "compliant_workflows": compliant,
+        "total_workflows": total,
+        "compliance_percentage": f"{score:.1%}",
+    }
+
+    for name, description in DOCUMENTED_WORKFLOWS.items():
+        if not os.path.exists(os.path.join(root, WORKFLOWS_DIR, name)):
+            report["missing_implementations"].append(f"{name}: {description}")
+
+    report["performance_metrics"] = {
+        "estimated_processing_times": {
+            ".md": "15-30s per file",
+            ".py": "5-10s per file",
+            ".js/.ts": "10-15s per file",
+            ".json": "1-2s per file",
+            ".yml/.yaml": "2-5s per file"
+        },
+        "optimization_status": "Parallel processing configured",
+        "current_compliance": f"{score:.1%}",
+        "target_compliance": "100%"
+    }
+
+    missing = len(report["missing_implementations"])
+    if score < 0.8:
+        report["recommendations"].append(
+            f"Matrix compliance is {score:.1%} - improve workflow file type coverage")
+    if missing:
+        report["recommendations"].append(
+            f"Implement {missing} missing workflows for full documentation compliance")
+    if report["files_triggering_no_workflow"]:
+        report["recommendations"].append(
+            f"{len(report['files_triggering_no_workflow'])} files trigger no workflow - review path filters")
+    if score >= 0.8:
+        report["recommendations"].append(
+            "Excellent compliance! Consider optimizing performance and adding advanced features")
+    return report
+
+
+def write_github_outputs(report: Dict[str, Any]) -> None:
+    output = os.environ.get('GITHUB_OUTPUT')
+    if not output:
+        return
+    compliance = report["matrix_compliance"]
+    with open(output, 'a') as f:
+        f.write(f"compliance_score={compliance['score']:.2f}\n")
+        f.write(f"missing_count={len(report['missing_implementations'])}\n")
+        f.write(f"compliant_workflows={compliance['compliant_workflows']}\n")
+        f.write(f"total_workflows={compliance['total_workflows']}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Report which files trigger which GitHub Actions workflows')
+    parser.add_argument('directory', nargs='?', default='.',
+                        help='Repository root (default: current directory)')
+    parser.add_argument('--report', metavar='PATH',
+                        help='Write the matrix compliance report JSON to PATH')
+    parser.add_argument('--verbose', '-v', action='store_true',
+                        help='List the files that trigger no workflow')
+    args = parser.parse_args()
+
+    root = os.path.abspath(args.directory)
+    index = DocumentIndex.open(root)
+    try:
+        paths = index.paths()
+    finally:
+        index.close()
+
+    started = time.perf_counter()
+    workflows = load_workflows(root)
+    coverage = compute_coverage(workflows, paths)
+    report = matrix_report(root, coverage)
+    elapsed = (time.perf_counter() - started) * 1000
+
+    print(f"🔍 {len(workflows)} workflows x {len(paths)} files evaluated in {elapsed:.0f} ms")
+    for workflow in workflows:
+        data = report["workflow_coverage"][workflow.name]
+        if workflow.error:
+            print(f"   ❌ {workflow.name}: invalid YAML - {workflow.error}")
+            continue
+        status = "✅ COMPLIANT" if data["covers_matrix_files"] else "❌ NON-COMPLIANT"
+        print(f"   {status} {workflow.name}: {data['files_triggering']} files, "
+              f"covers {data['file_types_covered']}/{len(EXPECTED_FILE_TYPES)} file types")
+    for missing in report["missing_implementations"]:
+        print(f"   ❌ Missing workflow: {missing}")
+
+    untriggered = report["files_triggering_no_workflow"]
+    print(f"\n📊 Compliance: {report['matrix_compliance']['compliance_percentage']}, "
+          f"{len(untriggered)} files trigger no workflow")
+    if args.verbose:
+        for path in untriggered:
+            print(f"   · {path}")
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"📋 Report saved to {args.report}")
+    write_github_outputs(report)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
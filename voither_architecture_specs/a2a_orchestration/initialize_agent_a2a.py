@@ -13,6 +13,10 @@ import argparse
 import sys
 import os
 
+# Shared --profile / --trace support lives with the documentation tools
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'scripts'))
+import instrumentation
+
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -57,7 +61,8 @@ class VoitherA2AInitializer:
         for step_name, step_func in initialization_steps:
             logger.info(f"📋 {step_name}...")
             try:
-                result = await step_func()
+                with instrumentation.span(step_name):
+                    result = await step_func()
                 results[step_name] = {
                     "status": "success",
                     "timestamp": datetime.now().isoformat(),
@@ -559,6 +564,7 @@ async def main():
                        help="Run composability tests")
     parser.add_argument("--full-test", action="store_true",
                        help="Run all tests")
+    instrumentation.add_arguments(parser)
     
     args = parser.parse_args()
     
@@ -571,32 +577,36 @@ async def main():
     # Initialize A2A system
     initializer = VoitherA2AInitializer(agents_list)
     
-    try:
-        result = await initializer.initialize_a2a_system()
-        
-        # Run additional tests if requested
-        if args.test_coordination or args.full_test:
-            logger.info("🧪 Running coordination tests")
-            coordination_result = await initializer._test_agent_coordination()
-            result["coordination_tests"] = coordination_result
-        
-        if args.test_reversibility or args.full_test:
-            logger.info("⏪ Running reversibility tests")
-            reversibility_result = await initializer._validate_reversibility()
-            result["reversibility_tests"] = reversibility_result
-        
-        if args.test_composability or args.full_test:
-            logger.info("🔧 Running composability tests")
-            composability_result = await initializer._test_composability()
-            result["composability_tests"] = composability_result
-        
-        logger.info("✅ VOITHER A2A initialization completed successfully")
-        
-        return result
-        
-    except Exception as e:
-        logger.error(f"❌ A2A initialization failed: {e}")
-        sys.exit(1)
+    with instrumentation.from_args('initialize_agent_a2a', args):
+        try:
+            result = await initializer.initialize_a2a_system()
+        
+            # Run additional tests if requested
+            if args.test_coordination or args.full_test:
+                logger.info("🧪 Running coordination tests")
+                with instrumentation.span('Coordination Tests'):
+                    coordination_result = await initializer._test_agent_coordination()
+                result["coordination_tests"] = coordination_result
+        
+            if args.test_reversibility or args.full_test:
+                logger.info("⏪ Running reversibility tests")
+                with instrumentation.span('Reversibility Tests'):
+                    reversibility_result = await initializer._validate_reversibility()
+                result["reversibility_tests"] = reversibility_result
+        
+            if args.test_composability or args.full_test:
+                logger.info("🔧 Running composability tests")
+                with instrumentation.span('Composability Tests'):
+                    composability_result = await initializer._test_composability()
+                result["composability_tests"] = composability_result
+        
+            logger.info("✅ VOITHER A2A initialization completed successfully")
+        
+            return result
+        
+        except Exception as e:
+            logger.error(f"❌ A2A initialization failed: {e}")
+            sys.exit(1)
 
 if __name__ == "__main__":
     try:
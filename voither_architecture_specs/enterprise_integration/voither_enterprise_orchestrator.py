@@ -15,6 +15,10 @@ from dataclasses import dataclass, asdict
 import uuid
 import argparse
 
+# Shared --profile / --trace support lives with the documentation tools
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'scripts'))
+import instrumentation
+
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -82,7 +86,8 @@ class VoitherEnterpriseOrchestrator:
         for task_name, task_func in setup_tasks:
             logger.info(f"📋 Executing: {task_name}")
             try:
-                result = await task_func()
+                with instrumentation.span(task_name):
+                    result = await task_func()
                 self.setup_status[task_name] = {
                     "status": "success",
                     "timestamp": datetime.now().isoformat(),
@@ -563,6 +568,7 @@ async def main():
     parser.add_argument("--setup-phase-1", action="store_true", help="Execute Phase 1 setup")
     parser.add_argument("--config", default="voither_enterprise_config.json", help="Configuration file")
     parser.add_argument("--validate", action="store_true", help="Run validation tests")
+    instrumentation.add_arguments(parser)
     
     args = parser.parse_args()
     
@@ -608,12 +614,14 @@ async def main():
     
     if args.setup_phase_1:
         logger.info("🚀 Starting VOITHER Enterprise Phase 1 Setup")
-        result = await orchestrator.execute_phase_1_setup()
-        
-        if args.validate:
-            logger.info("🧪 Running validation tests")
-            validation_result = await orchestrator._validate_agent_coordination()
-            result["validation"] = validation_result
+        with instrumentation.from_args('voither_enterprise_orchestrator', args):
+            result = await orchestrator.execute_phase_1_setup()
+            
+            if args.validate:
+                logger.info("🧪 Running validation tests")
+                with instrumentation.span('Validation Tests'):
+                    validation_result = await orchestrator._validate_agent_coordination()
+                result["validation"] = validation_result
         
         logger.info("✅ VOITHER Enterprise setup completed")
         return result